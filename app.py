@@ -1,10 +1,10 @@
 import os
 import sys  # Only needed for access to command line arguments
 import threading
-import queue
+import time
 from PySide6.QtCore import (
     Qt, QSettings, QSize, QTranslator, QLocale, QLibraryInfo,
-    QUrl, QEvent, QTimer
+    QUrl, QEvent, QTimer, Signal
 )
 from PySide6.QtGui import (
     QIcon, QImage, QPixmap, QColor, QPainter, QAction, QCloseEvent,
@@ -15,29 +15,20 @@ from PySide6.QtSvgWidgets import QSvgWidget
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QSystemTrayIcon, QMenu,
     QVBoxLayout, QHBoxLayout, QGridLayout, QStackedWidget,
-    QLabel, QLineEdit, QComboBox, QSlider, QPushButton, QDial
+    QLabel, QLineEdit, QComboBox, QSlider, QPushButton, QDial, QCheckBox
 )
 from pages.WelcomePage import WelcomePage
-from control import Controller
-from recognize  import Recognizer
+from pages.LiveStreamPage import LiveStreamPage
+from pages.CalibrationPage import CalibrationPage
+from config import Config
+import startup
 from resources import rc_resources
 from translations import rc_translations
 
 ORGANIZATION_NAME = "aircursor"
 APPLICATION_NAME = "AirCursor"
 
-# 默认配置
-DEFAULT_CONFIG = {
-    "screen_width": 1920,
-    "screen_height": 1080,
-    "scale": 1.0,  # 默认 HiDPI 缩放比例（浮点数）
-    "camera_width": 480,
-    "camera_height": 270,
-    "fps": 30,
-    "scroll_speed": 1,
-    "click_sensitivity": 50,
-    "move_sensitivity": 90
-}
+MOUSE_WAIT_TIMEOUT = 0.5  # 事件驱动模式下的最长等待时间（秒），用于检查是否停止
 
 class EventManager:
     def __init__(self):
@@ -47,15 +38,18 @@ event_manager = EventManager()  # 创建全局事件管理器
 
 class MainWindow(QMainWindow):
     """ 主窗口 """
+    warmup_finished = Signal(object, object)  # (Recognizer, Controller)
+    warmup_failed = Signal(str)  # 错误信息
+
     def __init__(self):
         # When you subclass a Qt class you must always call the
         # super __init__ function to allow Qt to set up the object.
         super().__init__()
         self.setWindowTitle("AirCursor")
         self.setWindowIcon(QIcon(":/resources/imgs/icon.svg"))
-        # 初始化 QSettings
+        # 初始化 QSettings，读取一次后由带类型的 Config 缓存（如果不存在则使用默认值）
         self.settings = QSettings(ORGANIZATION_NAME, APPLICATION_NAME)
-        self.initialize_settings()  # 加载配置（如果不存在则使用默认值）
+        self.config = Config(self.settings)
         # Flags
         self.isRecognizing = False  # 是否在控制鼠标
         self.isWindowVisible = False  # 决定是否更新视频帧
@@ -64,15 +58,16 @@ class MainWindow(QMainWindow):
         self.event_manager = event_manager
         self.event_manager.pause_event.clear()  # 默认不使线程运行
 
-        # 初始化 Controller & Recognizer
-        self.controller = Controller(self.settings)
-        self.recognizer = Recognizer(
-            model_path = ":/resources/model/hand_landmarker.task",
-            settings = self.settings,
-            event_manager = self.event_manager
-        )
-
-        self.recognizer.frame_signal.connect(self.update_livestream_thread)
+        # Controller & Recognizer 在后台预热线程中创建（导入 mediapipe/OpenCV、加载模型），
+        # 托盘与窗口不必等待
+        self.controller = None
+        self.recognizer = None
+        self.start_requested = False  # 预热完成前点击了开始服务
+        self.warming_up = False  # 预热线程是否在运行
+        self.calibration_page = None  # 进行中的标定窗口
+        self.calibration_started_service = False  # 标定时临时开始了识别，结束后需要停止
+        self.warmup_finished.connect(self.on_warmup_finished)
+        self.warmup_failed.connect(self.on_warmup_failed)
 
         # 初始化托盘图标
         self.initialize_tray_icon()
@@ -100,9 +95,9 @@ class MainWindow(QMainWindow):
                 page = WelcomePage(self)
             elif page_name == self.tr("LiveStream"):
                 # Live Stream Section
-                self.livestream = QLabel()
+                self.livestream = LiveStreamPage()
                 self.livestream.setText(self.tr("Livestream view will show here."))  # Placeholder text
-                self.livestream.setAlignment(Qt.AlignCenter)
+                self.livestream.visibility_changed.connect(self.update_livestream_visibility)
                 page = self.livestream
             elif page_name == self.tr("Settings"):
                 # 配置页面
@@ -122,6 +117,65 @@ class MainWindow(QMainWindow):
         container.setLayout(main_layout)
         self.setCentralWidget(container)
 
+        QTimer.singleShot(0, self.start_warm_up)  # 事件循环开始、托盘显示后再预热
+
+    def start_warm_up(self):
+        startup.mark("tray_visible")
+        self.run_warm_up()
+
+    def run_warm_up(self):
+        self.warming_up = True
+        threading.Thread(target=self.warm_up, daemon=True).start()
+
+    def warm_up(self):
+        """后台预热：导入识别相关模块，加载模型并创建 Controller 与 Recognizer"""
+        try:
+            from control import Controller
+            from recognize import Recognizer
+            controller = Controller(self.config)
+            recognizer = Recognizer(
+                model_path = ":/resources/model/hand_landmarker.task",
+                config = self.config,
+                event_manager = self.event_manager
+            )
+            recognizer.warm_up_model()  # 创建 landmarker 并预热推理
+            # 移回界面线程，配置变化与信号连接都在界面线程中处理
+            recognizer.moveToThread(QApplication.instance().thread())
+        except Exception as e:
+            import traceback
+            print(f"识别模块预热失败: {e}")
+            traceback.print_exc()
+            self.warmup_failed.emit(str(e))
+            return
+        self.warmup_finished.emit(recognizer, controller)
+
+    def on_warmup_failed(self, message):
+        """Report the failure and forget the pending start; Start Service retries the warm-up."""
+        self.warming_up = False
+        self.start_requested = False
+        self.start_stop_action.setText(self.tr("Start Service"))
+        self.tray_icon.setToolTip("AirCursor - " + self.tr("Hand tracking failed to load"))
+        self.tray_icon.showMessage(
+            "AirCursor",
+            self.tr("Hand tracking failed to load: {}").format(message),
+            QSystemTrayIcon.Warning,
+            5000
+        )
+
+    def on_warmup_finished(self, recognizer, controller):
+        self.warming_up = False
+        self.tray_icon.setToolTip("AirCursor")
+        self.recognizer = recognizer
+        self.controller = controller
+        self.recognizer.frame_signal.connect(self.livestream.submit_frame)
+        self.recognizer.screen_mapper.watch()  # 读取屏幕布局并监听变化（需在界面线程）
+        self.controller.bounds_source = self.recognizer.screen_mapper.desktop_bounds
+        self.recognizer.LiveStreaming = self.livestream.isVisible()
+        startup.mark("warmup_done")
+        if self.start_requested:
+            self.start_requested = False
+            self.start_stop_recognition()
+
     def initialize_tray_icon(self):
         # Create a tray icon
         self.tray_icon = QSystemTrayIcon(self)
@@ -193,13 +247,13 @@ class MainWindow(QMainWindow):
         # Configuration Section
         config_layout = QVBoxLayout()
 
-        # IMPORTANT!! QSettings 返回值通常为字符串（即使保存的是数字），因此需要进行类型转换
+        config = self.config.snapshot  # 已按默认值类型转换
 
         # Screen Resolution Input
         screen_resolution_layout = QHBoxLayout()
-        self.screen_width = QLineEdit(str(self.settings.value("screen_width")))
+        self.screen_width = QLineEdit(str(config.screen_width))
         self.screen_width.setPlaceholderText(self.tr("Width (px)"))
-        self.screen_height = QLineEdit(str(self.settings.value("screen_height")))
+        self.screen_height = QLineEdit(str(config.screen_height))
         self.screen_height.setPlaceholderText(self.tr("Height (px)"))
         screen_resolution_layout.addWidget(QLabel(self.tr("Screen Resolution (px):")))
         screen_resolution_layout.addWidget(self.screen_width)
@@ -208,15 +262,32 @@ class MainWindow(QMainWindow):
         self.screen_width.textChanged.connect(lambda: self.update_screen_width(self.screen_width.text()))
         self.screen_height.textChanged.connect(lambda: self.update_screen_height(self.screen_height.text()))
 
+        # Screen Geometry Detection
+        self.screen_geometry_check = QCheckBox(self.tr("Detect screens automatically"))
+        self.screen_geometry_check.setChecked(config.screen_geometry == "auto")
+        self.screen_geometry_check.toggled.connect(self.update_screen_geometry)
+
+        # Pointer Calibration
+        calibration_layout = QHBoxLayout()
+        self.calibrate_button = QPushButton(self.tr("Calibrate Pointer"))
+        self.reset_calibration_button = QPushButton(self.tr("Reset Calibration"))
+        self.calibration_label = QLabel()
+        self.update_calibration_label(config.calibration)
+        calibration_layout.addWidget(self.calibrate_button)
+        calibration_layout.addWidget(self.reset_calibration_button)
+        calibration_layout.addWidget(self.calibration_label)
+        self.calibrate_button.clicked.connect(self.start_calibration)
+        self.reset_calibration_button.clicked.connect(self.reset_calibration)
+
         # HiDPI Scaling Stride Slider
         scale_layout = QHBoxLayout()
         self.scale_slider = QSlider(Qt.Orientation.Horizontal)
         self.scale_values = [1, 1.25, 1.5, 1.75, 2]  # 定义固定的缩放值列表
         self.scale_slider.setMinimum(0)  # 最小索引
         self.scale_slider.setMaximum(len(self.scale_values) - 1)  # 最大索引
-        init_scale_index = self.scale_values.index(float(self.settings.value("scale")))  # 获取初始值对应的索引
+        init_scale_index = self.scale_values.index(config.scale)  # 获取初始值对应的索引
         self.scale_slider.setValue(init_scale_index)  # 默认值
-        self.scale_label = QLabel(f"{float(self.settings.value("scale")) * 100:.0f}%")
+        self.scale_label = QLabel(f"{config.scale * 100:.0f}%")
         scale_layout.addWidget(QLabel(self.tr("HiDPI Scaling:")))
         scale_layout.addWidget(self.scale_slider)
         scale_layout.addWidget(self.scale_label)
@@ -224,23 +295,23 @@ class MainWindow(QMainWindow):
 
         # Camera Resolution Input
         camera_resolution_layout = QHBoxLayout()
-        self.camera_width = QLineEdit(str(self.settings.value("camera_width")))
+        self.camera_width = QLineEdit(str(config.camera_width))
         self.camera_width.setPlaceholderText(self.tr("Width (px)"))
-        self.camera_height = QLineEdit(str(self.settings.value("camera_height")))
+        self.camera_height = QLineEdit(str(config.camera_height))
         self.camera_height.setPlaceholderText(self.tr("Height (px)"))
         camera_resolution_layout.addWidget(QLabel(self.tr("Camera Resolution (px):")))
         camera_resolution_layout.addWidget(self.camera_width)
         camera_resolution_layout.addWidget(QLabel("x"))
         camera_resolution_layout.addWidget(self.camera_height)
-        self.screen_width.textChanged.connect(lambda: self.update_camera_width(self.camera_width.text()))
-        self.screen_height.textChanged.connect(lambda: self.update_camera_height(self.camera_height.text()))
+        self.camera_width.textChanged.connect(lambda: self.update_camera_width(self.camera_width.text()))
+        self.camera_height.textChanged.connect(lambda: self.update_camera_height(self.camera_height.text()))
 
         # Camera FPS Combo帧率
         fps_layout = QHBoxLayout()
         self.fps_combo = QComboBox()
         self.fps_values = ["30", "60", "90", "120"]
         self.fps_combo.addItems(self.fps_values)  # 定义固定的缩放值列表
-        init_fps_index = self.fps_values.index(str(self.settings.value("fps")))  # 获取初始值对应的索引
+        init_fps_index = self.fps_values.index(str(config.fps))  # 获取初始值对应的索引
         self.fps_combo.setCurrentIndex(init_fps_index)  # 默认值
         self.fps_label = QLabel("FPS")
         fps_layout.addWidget(QLabel(self.tr("Camera Sampling FPS:")))
@@ -254,14 +325,28 @@ class MainWindow(QMainWindow):
         self.scroll_values = [1, 2, 3, 4, 5, 6]  # 定义固定的缩放值列表
         self.scroll_slider.setMinimum(0)  # 最小索引
         self.scroll_slider.setMaximum(len(self.scroll_values) - 1)  # 最大索引
-        init_scroll_index = self.scroll_values.index(int(self.settings.value("scroll_speed")))  # 获取初始值对应的索引
+        init_scroll_index = self.scroll_values.index(config.scroll_speed)  # 获取初始值对应的索引
         self.scroll_slider.setValue(init_scroll_index)  # 默认值
-        self.scroll_label = QLabel(f"{int(self.settings.value("scroll_speed"))}")
+        self.scroll_label = QLabel(f"{config.scroll_speed}")
         scroll_layout.addWidget(QLabel(self.tr("Scroll Speed:")))
         scroll_layout.addWidget(self.scroll_slider)
         scroll_layout.addWidget(self.scroll_label)
         self.scroll_slider.valueChanged.connect(self.update_scroll)
 
+        # Pointer Filter
+        pointer_filter_layout = QHBoxLayout()
+        self.pointer_filter_combo = QComboBox()
+        self.pointer_filter_values = ["none", "one_euro", "kalman"]
+        self.pointer_filter_combo.addItems([self.tr("None"), self.tr("One Euro"), self.tr("Kalman")])
+        self.pointer_filter_combo.setCurrentIndex(self.pointer_filter_values.index(config.pointer_filter))
+        self.pointer_prediction_check = QCheckBox(self.tr("Latency prediction"))
+        self.pointer_prediction_check.setChecked(bool(config.pointer_prediction))
+        pointer_filter_layout.addWidget(QLabel(self.tr("Pointer Filter:")))
+        pointer_filter_layout.addWidget(self.pointer_filter_combo)
+        pointer_filter_layout.addWidget(self.pointer_prediction_check)
+        self.pointer_filter_combo.currentIndexChanged.connect(self.update_pointer_filter)
+        self.pointer_prediction_check.toggled.connect(self.update_pointer_prediction)
+
         sensitivity_layout = QHBoxLayout()
 
         # 点击灵敏度
@@ -269,8 +354,8 @@ class MainWindow(QMainWindow):
         self.click_thres_dial = QDial()
         self.click_thres_dial.setRange(1, 100)
         self.click_thres_dial.setSingleStep(1)
-        self.click_thres_dial.setValue(int(self.settings.value("click_sensitivity")))
-        self.click_sensitivity_label = QLabel(self.tr("Current sensitivity: {}").format(self.settings.value('click_sensitivity')))
+        self.click_thres_dial.setValue(config.click_sensitivity)
+        self.click_sensitivity_label = QLabel(self.tr("Current sensitivity: {}").format(config.click_sensitivity))
         click_thres_layout.addWidget(QLabel(self.tr("Clicking Sensitivity")))
         click_thres_layout.addWidget(self.click_thres_dial)
         click_thres_layout.addWidget(self.click_sensitivity_label)
@@ -281,8 +366,8 @@ class MainWindow(QMainWindow):
         self.move_thres_dial = QDial()
         self.move_thres_dial.setRange(0, 100)
         self.move_thres_dial.setSingleStep(1)
-        self.move_thres_dial.setValue(int(self.settings.value("move_sensitivity")))
-        self.move_sensitivity_label = QLabel(self.tr("Current sensitivity: {}").format(self.settings.value('move_sensitivity')))
+        self.move_thres_dial.setValue(config.move_sensitivity)
+        self.move_sensitivity_label = QLabel(self.tr("Current sensitivity: {}").format(config.move_sensitivity))
         move_thres_layout.addWidget(QLabel(self.tr("Moving Sensitivity")))
         move_thres_layout.addWidget(self.move_thres_dial)
         move_thres_layout.addWidget(self.move_sensitivity_label)
@@ -291,11 +376,15 @@ class MainWindow(QMainWindow):
         sensitivity_layout.addLayout(click_thres_layout)
         sensitivity_layout.addLayout(move_thres_layout)
 
+        config_layout.addWidget(self.screen_geometry_check)
         config_layout.addLayout(screen_resolution_layout)
         config_layout.addLayout(scale_layout)
+        self.update_screen_geometry_widgets(self.screen_geometry_check.isChecked())
+        config_layout.addLayout(calibration_layout)
         config_layout.addLayout(camera_resolution_layout)
         config_layout.addLayout(fps_layout)
         config_layout.addLayout(scroll_layout)
+        config_layout.addLayout(pointer_filter_layout)
         config_layout.addLayout(sensitivity_layout)
 
         config_page.setLayout(config_layout)
@@ -312,7 +401,6 @@ class MainWindow(QMainWindow):
         """Show the main window when triggered from the tray menu."""
         self.showNormal()
         self.isWindowVisible = True
-        self.recognizer.LiveStreaming = True
         self.activateWindow()
 
     def closeEvent(self, event):
@@ -320,22 +408,38 @@ class MainWindow(QMainWindow):
         event.ignore()  # Ignore the close event
         self.hide()  # Hide the main window
         self.isWindowVisible = False
-        self.recognizer.LiveStreaming = False
+        if self.recognizer is not None:
+            self.recognizer.LiveStreaming = False
 
     def quit_application(self):
         """Quit the application when triggered from the tray menu."""
         self.isRecognizing = False
-        self.recognizer.Recognizing = False
         self.isWindowVisible = False
-        self.recognizer.LiveStreaming = False
+        if self.recognizer is not None:
+            self.recognizer.Recognizing = False
+            self.recognizer.wake_waiters()
+            self.recognizer.LiveStreaming = False
+        self.config.close()  # 写回尚未保存的配置
 
         self.close()
         QApplication.quit()
 
     def start_stop_recognition(self):
+        if self.recognizer is None:
+            # 预热尚未完成：完成后自动开始；再次点击取消；上次预热失败时重新预热
+            if self.start_requested:
+                self.start_requested = False
+                self.start_stop_action.setText(self.tr("Start Service"))
+                return
+            self.start_requested = True
+            self.start_stop_action.setText(self.tr("Starting..."))
+            if not self.warming_up:
+                self.run_warm_up()
+            return
         if self.isRecognizing:
             self.isRecognizing = False
             self.recognizer.Recognizing = False
+            self.recognizer.wake_waiters()  # 唤醒鼠标控制线程使其退出
             self.event_manager.pause_event.clear()  # 暂停线程
             self.start_stop_action.setText(self.tr("Start Service"))
         else:
@@ -347,129 +451,145 @@ class MainWindow(QMainWindow):
             self.start_stop_action.setText(self.tr("Pause Service"))
 
 
-    def initialize_settings(self):
-        """Initialize QSettings with default values if they don't exist."""
-        for key, default_value in DEFAULT_CONFIG.items():
-            if self.settings.value(key) is None:  # 如果配置项不存在
-                self.settings.setValue(key, default_value)
-
     def update_setting(self, key, value):
-        """Update a setting in QSettings and ensure correct type conversion."""
+        """
+        Update a setting in the typed Config, ignoring invalid input.
+        The Recognizer and Controller pick the change up once editing pauses.
+        """
         try:
-            # QSettings 返回值通常为字符串（即使保存的是数字），因此需要根据默认值的类型进行转换
-            # 如果默认值是整数（int），将读取的值转换为整数。
-            # 如果默认值是浮点数（float），将读取的值转换为浮点数。
-            if isinstance(DEFAULT_CONFIG[key], int):
-                value = int(value)
-            elif isinstance(DEFAULT_CONFIG[key], float):
-                value = float(value)
-            self.settings.setValue(key, value)
+            self.config.set(key, value)
         except ValueError:
             pass  # Ignore invalid input
 
     def update_screen_width(self, value):
-        try:
-            self.settings.setValue("screen_width", int(value))
-            self.recognizer.update_parameters()
-            self.controller.update_parameters()
-        except ValueError:
-            pass  # Ignore invalid input
+        self.update_setting("screen_width", value)
 
     def update_screen_height(self, value):
-        try:
-            self.settings.setValue("screen_height", int(value))
-            self.recognizer.update_parameters()
-            self.controller.update_parameters()
-        except ValueError:
-            pass  # Ignore invalid input
+        self.update_setting("screen_height", value)
+
+    def update_screen_geometry(self, checked):
+        """Switch between detected screen geometry and the manual resolution and scaling."""
+        self.update_screen_geometry_widgets(checked)
+        self.update_setting("screen_geometry", "auto" if checked else "manual")
+
+    def update_screen_geometry_widgets(self, automatic):
+        for widget in (self.screen_width, self.screen_height, self.scale_slider):
+            widget.setEnabled(not automatic)
+
+    def update_calibration_label(self, calibration, error=None):
+        if not calibration:
+            self.calibration_label.setText(self.tr("Not calibrated"))
+        elif error is None:
+            self.calibration_label.setText(self.tr("Calibrated"))
+        else:
+            self.calibration_label.setText(self.tr("Calibrated (error {:.1f}%)").format(error * 100))
+
+    def start_calibration(self):
+        """Show the calibration targets; the cursor stays still until it finishes."""
+        if self.recognizer is None:
+            return  # 预热尚未完成
+        self.calibration_started_service = not self.isRecognizing
+        if self.calibration_started_service:
+            self.start_stop_recognition()
+        self.controller.suspended = True
+        self.calibration_page = CalibrationPage(self.recognizer.fingertip_position)
+        self.calibration_page.finished.connect(self.finish_calibration)
+        self.calibration_page.cancelled.connect(self.end_calibration)
+        self.calibration_page.start()
+
+    def finish_calibration(self, calibration, error):
+        self.config.set("calibration", calibration, debounce=False)
+        self.update_calibration_label(calibration, error)
+        self.end_calibration()
+
+    def end_calibration(self):
+        self.calibration_page = None
+        self.controller.suspended = False
+        # 恢复标定前的服务状态，原本未开启手势控制时不在标定后留下运行中的识别
+        if self.calibration_started_service and self.isRecognizing:
+            self.start_stop_recognition()
+        self.calibration_started_service = False
+
+    def reset_calibration(self):
+        self.config.set("calibration", "", debounce=False)
+        self.update_calibration_label("")
 
     def update_camera_width(self, value):
-        try:
-            self.settings.setValue("camera_width", int(value))
-            self.recognizer.update_parameters()
-            self.controller.update_parameters()
-        except ValueError:
-            pass  # Ignore invalid input
+        self.update_setting("camera_width", value)
 
     def update_camera_height(self, value):
-        try:
-            self.settings.setValue("camera_height", int(value))
-            self.recognizer.update_parameters()
-            self.controller.update_parameters()
-        except ValueError:
-            pass  # Ignore invalid input
+        self.update_setting("camera_height", value)
 
     def update_scale(self, index):
-        """Update the HiDPI scaling label and save the value to QSettings."""
+        """Update the HiDPI scaling label and save the value."""
         scale = self.scale_values[index]
         self.scale_label.setText(f"{scale * 100:.0f}%")
-        self.settings.setValue("scale", scale)
+        self.update_setting("scale", scale)
 
     def update_fps(self, text):
-        """Update the FPS label and save the value to QSettings."""
-        self.settings.setValue("fps", text)
-        self.recognizer.update_parameters()
+        """Update the FPS label and save the value."""
+        self.update_setting("fps", text)
 
     def update_scroll(self, index):
-        """Update the Scroll speed label and save the value to QSettings."""
+        """Update the Scroll speed label and save the value."""
         scroll = self.scroll_values[index]
         self.scroll_label.setText(f"{scroll}")
-        self.settings.setValue("scroll_speed", scroll)
-        self.controller.update_parameters()  # 更新 Controller 参数
+        self.update_setting("scroll_speed", scroll)
+
+    def update_pointer_filter(self, index):
+        """Save the selected pointer filter."""
+        self.update_setting("pointer_filter", self.pointer_filter_values[index])
+
+    def update_pointer_prediction(self, checked):
+        """Save the latency prediction switch."""
+        self.update_setting("pointer_prediction", int(checked))
 
     def update_click_sensitivity(self, value):
-        """Update the click sensitivity dial and save the value to QSettings."""
+        """Update the click sensitivity dial and save the value."""
         self.click_sensitivity_label.setText(self.tr("Current sensitivity: {}").format(value))
-        self.settings.setValue("click_sensitivity", value)
-        self.recognizer.update_parameters()
+        self.update_setting("click_sensitivity", value)
 
     def update_move_sensitivity(self, value):
-        """Update the click sensitivity dial and save the value to QSettings."""
+        """Update the click sensitivity dial and save the value."""
         self.move_sensitivity_label.setText(self.tr("Current sensitivity: {}").format(value))
-        self.settings.setValue("move_sensitivity", value)
-        self.recognizer.update_parameters()
-        self.controller.update_parameters()  # 更新 Controller 参数
+        self.update_setting("move_sensitivity", value)
 
     def mouse_control_thread(self):
+        """鼠标控制线程：新识别结果到达时唤醒，或按固定注入节拍唤醒"""
+        last_seq = self.recognizer.hand_data.seq
+        next_tick = time.perf_counter()
         while self.isRecognizing:
-            hand_data = self.recognizer.hand_data
-            if hand_data.get("is_valid", False):  # 检查手势是否有效
-                if hand_data["status"] == "drag":
-                    self.controller.handle_drag()
-                    self.controller.update_mouse_position(
-                        hand_data["target_x"], hand_data["target_y"]
-                    )
-                elif hand_data["status"] == "scroll":
-                    # 滚动状态
-                    self.controller.handle_scroll(hand_data["scroll_step"])
-                    self.controller.update_mouse_position(
-                        hand_data["target_x"], hand_data["target_y"]
-                    )
-                elif hand_data["status"] == "pre_click":
-                    self.controller.handle_click(False)
-                elif hand_data["status"] == "click":
-                    self.controller.handle_click(True)
+            interval = self.controller.injection_interval
+            if interval:
+                # 固定节拍：按绝对时间推进，落后时不补发
+                next_tick += interval
+                delay = next_tick - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
                 else:
-                    self.controller.handle_click(False)
-                    if not hand_data["clicking"]:
-                        self.controller.update_mouse_position(
-                            hand_data["target_x"], hand_data["target_y"]
-                        )
+                    next_tick = time.perf_counter()
+                hand_data = self.recognizer.hand_data
             else:
-                # 如果未检测到手势，确保鼠标左键被释放
-                if self.controller.is_pressing:
-                    self.controller.handle_click(False)  # 强制释放鼠标左键
+                hand_data = self.recognizer.wait_for_hand_data(last_seq, MOUSE_WAIT_TIMEOUT)
+            self.controller.wakeup_count += 1
+
+            fresh = hand_data.seq != last_seq
+            if not fresh and not interval:
+                continue  # 超时唤醒，仅用于检查 isRecognizing
+            last_seq = hand_data.seq
+            profiler = self.recognizer.profiler
+            if profiler.enabled:
+                injections = self.controller.injection_count
+                inject_start = time.perf_counter()
+                self.controller.apply_hand_state(hand_data, fresh)
+                if self.controller.injection_count != injections:
+                    inject_end = time.perf_counter()
+                    profiler.record("inject", inject_end - inject_start)
+                    profiler.record("glass_to_cursor", inject_end - hand_data.timestamp)
+            else:
+                self.controller.apply_hand_state(hand_data, fresh)
 
-    def update_livestream_thread(self, frame):
-        try:
-            # while not self.recognizer.frame_queue.empty():  # 处理所有积压的帧
-            # frame = self.recognizer.frame_queue.get_nowait()  # TODO: 非阻塞方式获取帧
-            # if frame is not None:
-            # 将帧转换为 QImage
-            height, width, channel = frame.shape
-            bytes_per_line = channel * width
-            q_image = QImage(frame.data, width, height, bytes_per_line, QImage.Format.Format_RGB888)
-            # 将 QImage 转换为 QPixmap 并显示在 QLabel 中
-            self.livestream.setPixmap(QPixmap.fromImage(q_image))
-        except queue.Empty:
-            pass  # 如果队列为空，跳过本次更新
+    def update_livestream_visibility(self, visible):
+        """预览页面可见时才让识别端产生预览帧"""
+        if self.recognizer is not None:
+            self.recognizer.LiveStreaming = visible
@@ -0,0 +1,110 @@
+"""
+模型变体与推理选项基准：每种组合在新的子进程中测量，避免已加载模型的影响。
+
+    python -m benchmarks.bench_model                        # 所有变体，num_hands 为 1 和 2
+    python -m benchmarks.bench_model --num-hands 1 --frames 100
+
+分别测量：
+加载模型前后的常驻内存差（rss_delta，字节）、创建 HandLandmarker 的耗时、
+第一帧推理耗时（包含初始化）以及之后各帧的平均推理耗时。
+使用 IMAGE 模式和合成帧；合成帧中没有手，每一帧都会运行手掌检测，结果对应最坏情况。
+
+和应用本身一样需要先用 pyside6-rcc 生成 resources/rc_resources.py。
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODEL_PATH = ":/resources/model/hand_landmarker.task"
+
+# 在子进程中执行，最后一行打印结果 JSON
+SCRIPT = """
+import json, sys, time
+import numpy as np
+import mediapipe as mp
+from mediapipe.tasks.python import vision as mp_vision
+from resources import rc_resources
+from model import ModelManager, current_rss
+
+variant, num_hands, frames, width, height = sys.argv[1], int(sys.argv[2]), int(sys.argv[3]), int(sys.argv[4]), int(sys.argv[5])
+rss_before = current_rss()
+model = ModelManager({model_path!r})
+start = time.perf_counter()
+options = mp_vision.HandLandmarkerOptions(base_options=model.base_options(variant),
+                                          running_mode=mp_vision.RunningMode.IMAGE, num_hands=num_hands)
+landmarker = mp_vision.HandLandmarker.create_from_options(options)
+create_time = time.perf_counter() - start
+rss_after = current_rss()
+
+rng = np.random.default_rng(0)
+images = [mp.Image(image_format=mp.ImageFormat.SRGB, data=rng.integers(0, 256, (height, width, 3), np.uint8))
+          for _ in range(4)]
+start = time.perf_counter()
+landmarker.detect(images[0])
+first_detect = time.perf_counter() - start
+start = time.perf_counter()
+for i in range(frames):
+    landmarker.detect(images[i % len(images)])
+mean_detect = (time.perf_counter() - start) / frames
+landmarker.close()
+print(json.dumps({{
+    "source": model.source,
+    "rss_delta": rss_after - rss_before if rss_before is not None and rss_after is not None else None,
+    "create_time": create_time,
+    "first_detect": first_detect,
+    "mean_detect": mean_detect
+}}))
+""".format(model_path=MODEL_PATH)
+
+
+def available_variants():
+    output = subprocess.run(
+        [sys.executable, "-c",
+         "from resources import rc_resources\n"
+         "from model import ModelManager\n"
+         f"print('\\n'.join(ModelManager({MODEL_PATH!r}).available_variants()))"],
+        cwd=ROOT, check=True, capture_output=True, text=True).stdout
+    return output.split()
+
+
+def measure(variant, num_hands, frames, width, height):
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT, variant, str(num_hands), str(frames), str(width), str(height)],
+        cwd=ROOT, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run(variants, hands, frames, width, height):
+    results = {}
+    for variant in variants:
+        for num_hands in hands:
+            results[f"{variant}/num_hands={num_hands}"] = measure(variant, num_hands, frames, width, height)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="AirCursor model variant benchmarks")
+    parser.add_argument("--variant", action="append", help="要测量的变体（默认全部）")
+    parser.add_argument("--num-hands", type=int, action="append", help="默认 1 和 2")
+    parser.add_argument("--frames", type=int, default=50)
+    parser.add_argument("--width", type=int, default=480)
+    parser.add_argument("--height", type=int, default=270)
+    parser.add_argument("--output", help="结果 JSON 输出路径（默认打印到标准输出）")
+    args = parser.parse_args(argv)
+
+    variants = args.variant or available_variants()
+    results = run(variants, args.num_hands or [1, 2], args.frames, args.width, args.height)
+    text = json.dumps({"python": sys.version.split()[0], "results": results}, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text)
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,304 @@
+"""
+识别流水线基准测试，可在无摄像头、无显示器的 Linux CI 上运行。
+
+    python -m benchmarks.bench_pipeline                         # 运行并打印 JSON
+    python -m benchmarks.bench_pipeline --output result.json    # 写入文件
+    python -m benchmarks.bench_pipeline --save-baseline         # 将本次结果保存为基线
+    python -m benchmarks.bench_pipeline --baseline benchmarks/baseline.json --threshold 0.25
+    python -m benchmarks.bench_pipeline --require-baseline      # CI：缺少基线时同样以非零状态退出
+    python -m benchmarks.bench_pipeline --backends null,uinput  # 同时测量真实注入后端（会移动指针）
+
+使用合成帧和合成关键点序列，分别测量：
+手势回调吞吐（hand_recognition_callback，绝对与相对指针模式分别记为 callback 与 callback_relative）、预处理（flip + cvtColor + mp.Image，
+分别测量逐帧分配的旧写法、预分配缓冲区和跳过翻转的 mirror_landmarks 模式）、
+预览绘制（LandmarkPainter.draw），以及 Controller 在各注入后端（injection.py）上的注入开销：
+null 后端记为 inject，其余后端记为 inject_<名称>；各后端的事件数、每批事件数与每事件耗时记在 injection 中。
+另用 tracemalloc 统计各预处理写法每帧临时分配的字节数（allocations，不参与基线比较）。
+与基线比较时，任何一项的平均耗时超过基线 (1 + threshold) 倍即以非零状态退出；
+指定 --require-baseline 时找不到基线文件也以非零状态退出，避免 CI 在没有基线时永远通过。
+
+和应用本身一样需要先用 pyside6-rcc 生成 resources/rc_resources.py。
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+import mediapipe as mp
+from PySide6.QtCore import QSettings
+
+from config import Config
+from control import Controller
+from injection import NullBackend, RecordingBackend, create_backend
+from preprocess import FramePreprocessor
+from preview import LandmarkPainter
+from recognize import Recognizer
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+CAMERA_WIDTH = 480
+CAMERA_HEIGHT = 270
+
+# 张开手掌的大致世界坐标（米），以手腕为原点
+OPEN_HAND = np.array([
+    [0.000, 0.000, 0.000],
+    [0.025, -0.015, -0.010], [0.045, -0.035, -0.015], [0.060, -0.055, -0.020], [0.070, -0.070, -0.025],
+    [0.025, -0.080, -0.005], [0.028, -0.115, -0.010], [0.030, -0.140, -0.015], [0.032, -0.160, -0.020],
+    [0.005, -0.085, -0.005], [0.005, -0.125, -0.010], [0.005, -0.150, -0.015], [0.005, -0.170, -0.020],
+    [-0.015, -0.080, -0.005], [-0.017, -0.115, -0.010], [-0.018, -0.138, -0.015], [-0.019, -0.155, -0.020],
+    [-0.032, -0.070, -0.005], [-0.036, -0.095, -0.010], [-0.038, -0.112, -0.012], [-0.040, -0.125, -0.015],
+], np.float32)
+
+
+def landmark_list(points):
+    return [SimpleNamespace(x=float(x), y=float(y), z=float(z)) for x, y, z in points]
+
+
+def synthetic_results(count, seed=0):
+    """
+    生成一段合成关键点序列：食指画圆移动，并周期性地做出点击、捏合、滚动手势，
+    偶尔丢失手部，使状态机的各条路径都被覆盖。
+    """
+    rng = np.random.default_rng(seed)
+    results = []
+    for index in range(count):
+        phase = index % 120
+        world = OPEN_HAND.copy()
+        if 20 <= phase < 26:  # 食指快速前推（点击）
+            world[8, 2] -= 0.02 * (phase - 19)
+        elif 40 <= phase < 60:  # 拇指与食指捏合（拖动）
+            world[4] = world[8] + 0.002
+        elif 70 <= phase < 90:  # 食指中指并拢（滚动）
+            world[12, :2] = world[8, :2] + 0.005
+            world[8, 2] -= 0.1
+        world += rng.normal(0, 0.0005, world.shape).astype(np.float32)
+
+        angle = 2 * math.pi * index / 240
+        center = np.array([0.5 + 0.2 * math.cos(angle), 0.45 + 0.2 * math.sin(angle), 0.0], np.float32)
+        norm = center + world * np.float32(2.5)
+
+        if phase == 110:
+            results.append(SimpleNamespace(hand_landmarks=[], hand_world_landmarks=[], handedness=[]))
+        else:
+            results.append(SimpleNamespace(
+                hand_landmarks=[landmark_list(norm)],
+                hand_world_landmarks=[landmark_list(world)],
+                handedness=[[SimpleNamespace(category_name="Right", score=0.98)]]
+            ))
+    return results
+
+
+def measure(function, iterations, warmup=50):
+    """逐次计时，返回统计（秒）"""
+    for _ in range(warmup):
+        function()
+    samples = np.empty(iterations)
+    perf_counter = time.perf_counter
+    for index in range(iterations):
+        start = perf_counter()
+        function()
+        samples[index] = perf_counter() - start
+    total = samples.sum()
+    return {
+        "iterations": iterations,
+        "ops_per_sec": iterations / total if total else 0.0,
+        "mean": float(samples.mean()),
+        "p50": float(np.percentile(samples, 50)),
+        "p95": float(np.percentile(samples, 95)),
+        "p99": float(np.percentile(samples, 99)),
+        "max": float(samples.max())
+    }
+
+
+def create_config():
+    path = os.path.join(tempfile.mkdtemp(prefix="aircursor-bench-"), "settings.ini")
+    return Config(QSettings(path, QSettings.Format.IniFormat))
+
+
+def bench_callback(recognizer, results, iterations):
+    frame = iter(range(10 ** 9))
+
+    def step():
+        index = next(frame)
+        recognizer.hand_recognition_callback(results[index % len(results)], None, index)
+    return measure(step, iterations)
+
+
+def measure_allocations(function, iterations, warmup=10):
+    """返回每次调用期间 Python 堆（含 NumPy 数组）的平均临时分配峰值（字节）"""
+    for _ in range(warmup):
+        function()
+    tracemalloc.start()
+    try:
+        total = 0
+        for _ in range(iterations):
+            tracemalloc.reset_peak()
+            current, _ = tracemalloc.get_traced_memory()
+            function()
+            total += tracemalloc.get_traced_memory()[1] - current
+    finally:
+        tracemalloc.stop()
+    return total / iterations
+
+
+def preprocess_steps():
+    """返回 {名称: 单帧预处理函数}"""
+    rng = np.random.default_rng(1)
+    frame = rng.integers(0, 256, (CAMERA_HEIGHT, CAMERA_WIDTH, 3), np.uint8)
+
+    def legacy():
+        flipped = cv2.flip(frame, 1)
+        rgb_frame = cv2.cvtColor(flipped, cv2.COLOR_BGR2RGB)
+        mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
+
+    def preallocated(preprocessor):
+        def step():
+            rgb_frame = preprocessor.process(frame)
+            mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
+        return step
+
+    return {
+        "preprocess_legacy": legacy,
+        "preprocess": preallocated(FramePreprocessor()),
+        "preprocess_no_flip": preallocated(FramePreprocessor(mirror_landmarks=True))
+    }
+
+
+def bench_draw(states, iterations):
+    rng = np.random.default_rng(2)
+    rgb_frame = rng.integers(0, 256, (CAMERA_HEIGHT, CAMERA_WIDTH, 3), np.uint8)
+    landmarks = (np.float32(0.5) + OPEN_HAND * np.float32(2.5)).astype(np.float32)
+    painter = LandmarkPainter()
+    frame = iter(range(10 ** 9))
+    return measure(lambda: painter.draw(rgb_frame, landmarks, states[next(frame) % len(states)]), iterations)
+
+
+def bench_inject(controller, states, iterations):
+    frame = iter(range(10 ** 9))
+
+    def step():
+        controller.apply_hand_state(states[next(frame) % len(states)])
+    return measure(step, iterations)
+
+
+def injection_backends(names):
+    backends = {}
+    for name in names:
+        if name == "null":
+            backends[name] = NullBackend()
+        elif name == "recording":
+            backends[name] = RecordingBackend()
+        else:
+            backends[name] = create_backend(name, lambda: (0, 0, 1920, 1080))
+    return backends
+
+
+def run(iterations, backend_names=("null",)):
+    """返回 (各项耗时, 各注入后端的统计)"""
+    config = create_config()
+    recognizer = Recognizer(model_path=None, config=config, event_manager=None)
+    results = synthetic_results(1200)
+
+    # 回放一遍合成序列，得到注入基准使用的 HandState 序列
+    states = []
+    for index, result in enumerate(results):
+        recognizer.hand_recognition_callback(result, None, index)
+        states.append(recognizer.hand_data)
+    recognizer.reset_state()
+
+    timings = {"callback": bench_callback(recognizer, results, iterations)}
+    config.set("pointer_mode", "relative", debounce=False)
+    recognizer.reset_state()
+    timings["callback_relative"] = bench_callback(recognizer, results, iterations)
+    config.set("pointer_mode", "absolute", debounce=False)
+    for name, step in preprocess_steps().items():
+        timings[name] = measure(step, iterations)
+    timings["draw_landmarks"] = bench_draw(states, iterations)
+    injection = {}
+    for name, backend in injection_backends(backend_names).items():
+        controller = Controller(config, backend=backend)
+        key = "inject" if name == "null" else f"inject_{name}"
+        timings[key] = bench_inject(controller, states, iterations)
+        injection[name] = backend.stats()
+        backend.close()
+    return timings, injection
+
+
+def run_allocations(iterations):
+    """各预处理写法每帧临时分配的字节数"""
+    return {name: measure_allocations(step, iterations) for name, step in preprocess_steps().items()}
+
+
+def compare(results, baseline, threshold):
+    """返回超出阈值的项目列表 [(名称, 当前平均, 基线平均)]"""
+    regressions = []
+    for name, stats in results.items():
+        reference = baseline.get(name)
+        if reference and stats["mean"] > reference["mean"] * (1 + threshold):
+            regressions.append((name, stats["mean"], reference["mean"]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="AirCursor pipeline benchmarks")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--output", help="结果 JSON 输出路径（默认打印到标准输出）")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="基线 JSON 路径")
+    parser.add_argument("--threshold", type=float, default=0.25, help="允许的平均耗时增幅")
+    parser.add_argument("--save-baseline", action="store_true", help="将本次结果写入基线文件")
+    parser.add_argument("--require-baseline", action="store_true", help="找不到基线文件时以非零状态退出")
+    parser.add_argument("--backends", default="null",
+                        help="逗号分隔的注入后端：null, recording, pynput, uinput")
+    args = parser.parse_args(argv)
+
+    results, injection = run(args.iterations, [name.strip() for name in args.backends.split(",") if name.strip()])
+
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "numpy": np.__version__,
+            "opencv": cv2.__version__,
+            "mediapipe": getattr(mp, "__version__", "unknown")
+        },
+        "results": results,
+        "injection": injection,
+        "allocations": run_allocations(min(args.iterations, 200))
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text)
+    else:
+        print(text)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as file:
+            file.write(text)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        if args.require_baseline:
+            print(f"MISSING BASELINE {args.baseline}: run with --save-baseline on the reference machine first",
+                  file=sys.stderr)
+            return 2
+        print(f"未找到基线文件 {args.baseline}，跳过比较", file=sys.stderr)
+        return 0
+    with open(args.baseline) as file:
+        baseline = json.load(file)["results"]
+    regressions = compare(report["results"], baseline, args.threshold)
+    for name, current, reference in regressions:
+        print(f"REGRESSION {name}: {current * 1e6:.1f}us vs baseline {reference * 1e6:.1f}us", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+冷启动耗时基准：每次测量都在新的子进程中进行，避免模块缓存的影响。
+
+    python -m benchmarks.bench_startup               # 运行并打印 JSON
+    python -m benchmarks.bench_startup --repeat 10
+
+分别测量：
+托盘与窗口显示前需要的导入（app）、后台预热中的导入（recognize、control）、
+以及从 Qt 资源加载模型。实际运行时的各阶段耗时（tray_visible、warmup_done、first_frame）
+由 startup 模块记录，通过 Recognizer.startup_stats() 读取，不打印到标准输出。
+
+和应用本身一样需要先用 pyside6-rcc 生成 resources/rc_resources.py。
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 名称 -> 在子进程中执行的代码，最后一行打印耗时（秒）
+SCENARIOS = {
+    "ui_imports": "import app",
+    "recognition_imports": "import recognize, control",
+    "model_load": (
+        "from resources import rc_resources\n"
+        "from model import ModelManager\n"
+        "start = time.perf_counter()\n"
+        "ModelManager(':/resources/model/hand_landmarker.task').load()"
+    ),
+}
+
+
+def measure(code):
+    script = f"import time\nstart = time.perf_counter()\n{code}\nprint(time.perf_counter() - start)"
+    output = subprocess.run([sys.executable, "-c", script], cwd=ROOT, check=True,
+                            capture_output=True, text=True).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def run(repeat):
+    results = {}
+    for name, code in SCENARIOS.items():
+        samples = [measure(code) for _ in range(repeat)]
+        results[name] = {
+            "repeat": repeat,
+            "median": statistics.median(samples),
+            "min": min(samples),
+            "max": max(samples)
+        }
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="AirCursor cold start benchmarks")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="结果 JSON 输出路径（默认打印到标准输出）")
+    args = parser.parse_args(argv)
+
+    text = json.dumps({"python": sys.version.split()[0], "results": run(args.repeat)}, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text)
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""
+摄像头到屏幕的标定。
+
+用户依次指向屏幕上的若干目标点，记录食指指尖的正则化坐标（显示方向），
+拟合从指尖坐标到桌面归一化坐标（0~1，覆盖 ScreenMapper 的所有屏幕）的单应矩阵，
+可选一个以画面中心为原点的径向畸变系数 k1：
+
+    (x, y) -> 去畸变 (x', y') = c + (p - c) * (1 + k1 * |p - c|²) -> H · (x', y', 1)
+
+结果以 9 个数（H 的前 8 个元素，H[2, 2] 归一化为 1，以及 k1）保存为一行文本。
+"""
+import numpy as np
+
+# 标定目标（桌面归一化坐标），3×3 网格，边缘留出一点余量便于指向
+CALIBRATION_TARGETS = [(x, y) for y in (0.1, 0.5, 0.9) for x in (0.1, 0.5, 0.9)]
+DISTORTION_CENTER = (0.5, 0.5)
+DISTORTION_RANGE = (-0.5, 0.5)  # k1 的搜索范围
+DISTORTION_ITERATIONS = 40
+
+
+def undistort(points, k1):
+    """对 (n, 2) 坐标做径向去畸变，返回新数组"""
+    center = np.asarray(DISTORTION_CENTER)
+    offset = points - center
+    scale = 1 + k1 * np.einsum("ij,ij->i", offset, offset)
+    return center + offset * scale[:, None]
+
+
+def normalizing_transform(points):
+    """把点集平移到原点、平均距离缩放到 √2 的相似变换（Hartley 归一化）"""
+    mean = points.mean(axis=0)
+    distance = np.sqrt(((points - mean) ** 2).sum(axis=1)).mean()
+    scale = np.sqrt(2) / distance if distance > 0 else 1.0
+    return np.array([[scale, 0, -scale * mean[0]],
+                     [0, scale, -scale * mean[1]],
+                     [0, 0, 1]])
+
+
+def fit_homography(source, target):
+    """归一化 DLT：求 H 使 target ~ H · source，两组均为 (n, 2)，n >= 4"""
+    source = np.asarray(source, float)
+    target = np.asarray(target, float)
+    if len(source) < 4:
+        raise ValueError("至少需要 4 个标定点")
+    source_transform = normalizing_transform(source)
+    target_transform = normalizing_transform(target)
+    ones = np.ones((len(source), 1))
+    src = np.hstack([source, ones]) @ source_transform.T
+    dst = np.hstack([target, ones]) @ target_transform.T
+
+    rows = np.zeros((2 * len(source), 9))
+    for i, ((x, y, w), (u, v, t)) in enumerate(zip(src, dst)):
+        rows[2 * i] = [0, 0, 0, -t * x, -t * y, -t * w, v * x, v * y, v * w]
+        rows[2 * i + 1] = [t * x, t * y, t * w, 0, 0, 0, -u * x, -u * y, -u * w]
+    homography = np.linalg.svd(rows)[2][-1].reshape(3, 3)
+    homography = np.linalg.inv(target_transform) @ homography @ source_transform
+    if abs(homography[2, 2]) < 1e-12:
+        raise ValueError("标定点退化，无法拟合")
+    return homography / homography[2, 2]
+
+
+def project(homography, points):
+    projected = np.hstack([points, np.ones((len(points), 1))]) @ homography.T
+    return projected[:, :2] / projected[:, 2:]
+
+
+def reprojection_error(homography, k1, source, target):
+    """均方根重投影误差（桌面归一化坐标）"""
+    residual = project(homography, undistort(source, k1)) - target
+    return float(np.sqrt((residual ** 2).sum(axis=1).mean()))
+
+
+def fit_calibration(source, target, distortion=True):
+    """
+    拟合标定，返回 (H, k1, 均方根误差)。
+    distortion 为 True 时在 DISTORTION_RANGE 内用黄金分割搜索 k1（需要至少 5 个点）。
+    """
+    source = np.asarray(source, float)
+    target = np.asarray(target, float)
+
+    def error(k1):
+        homography = fit_homography(undistort(source, k1), target)
+        return reprojection_error(homography, k1, source, target), homography
+
+    k1 = 0.0
+    best_error, best_homography = error(k1)
+    if distortion and len(source) >= 5:
+        ratio = (np.sqrt(5) - 1) / 2
+        low, high = DISTORTION_RANGE
+        for _ in range(DISTORTION_ITERATIONS):
+            a = high - ratio * (high - low)
+            b = low + ratio * (high - low)
+            if error(a)[0] < error(b)[0]:
+                high = b
+            else:
+                low = a
+        candidate = (low + high) / 2
+        candidate_error, candidate_homography = error(candidate)
+        if candidate_error < best_error:
+            k1, best_error, best_homography = candidate, candidate_error, candidate_homography
+    return best_homography, k1, best_error
+
+
+def encode_calibration(homography, k1):
+    """保存到配置的紧凑文本：H 的前 8 个元素与 k1，逗号分隔"""
+    values = list((homography / homography[2, 2]).flatten()[:8]) + [k1]
+    return ",".join(f"{value:.8g}" for value in values)
+
+
+def decode_calibration(text):
+    """解析 encode_calibration 的结果，返回 (H, k1)；为空或无法解析时返回 None"""
+    if not text:
+        return None
+    try:
+        values = [float(value) for value in str(text).split(",")]
+    except ValueError:
+        return None
+    if len(values) != 9 or not all(np.isfinite(values)):
+        return None
+    homography = np.append(values[:8], 1.0).reshape(3, 3)
+    return homography, values[8]
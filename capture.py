@@ -0,0 +1,218 @@
+import threading
+import time
+import cv2
+import numpy as np
+
+RING_SIZE = 3  # 最新帧、处理中的帧、正在写入的帧各占一个
+
+
+class CaptureSource:
+    """
+    摄像头采集源：在独立线程中读取画面，写入预分配的环形缓冲区。
+
+    采用"最新帧优先"策略：处理线程每次只取最新的一帧，尚未被取走就被覆盖的帧计入 dropped。
+    驱动缓冲设为 1，避免在驱动队列里积压过期画面。
+    frame_interval 大于 0 时，距上一次送出不足该间隔的帧只 grab 不解码（空闲降频）。
+    reconfigure() 在运行中切换分辨率与帧率：由采集线程在两次 grab 之间设置设备，
+    设置无效时才重新打开摄像头；从请求到第一帧新模式画面送出的耗时记入 stats()。
+    """
+
+    def __init__(self, camera_index=0, width=480, height=270, fps=30, profiler=None):
+        self.camera_index = camera_index
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.profiler = profiler
+        self.frame_interval = 0.0  # 送出帧的最短间隔（秒），由其他线程整体赋值
+        self.pending_mode = None  # 待切换的 (width, height, fps)
+        self.switch_requested = None  # 切换请求时间，等待第一帧新模式画面
+        self.switch_shape = None  # 切换后期望的 (height, width)
+
+        self.cap = None
+        self.thread = None
+        self.running = False
+        self.condition = threading.Condition()
+
+        self.frames = None  # (RING_SIZE, h, w, 3) 预分配缓冲区
+        self.timestamps = [0.0] * RING_SIZE  # 采集时间（time.perf_counter 秒）
+        self.latest_slot = -1
+        self.reading_slot = -1
+        self.seq = 0
+        self.consumed_seq = 0
+        self.last_publish_time = 0.0
+
+        # 统计
+        self.captured = 0
+        self.dropped = 0
+        self.consumed = 0
+        self.throttled = 0
+        self.switches = 0
+        self.reopens = 0
+        self.last_switch_duration = 0.0
+
+    def open(self):
+        cap = cv2.VideoCapture(self.camera_index)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # 尽量减少驱动端缓冲
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)  # 分辨率
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        cap.set(cv2.CAP_PROP_FPS, self.fps)
+        if not cap.isOpened():
+            cap.release()
+            raise IOError(f"无法打开摄像头 {self.camera_index}")
+        self.cap = cap
+
+    def reconfigure(self, width, height, fps):
+        """请求切换分辨率与帧率，由采集线程尽快应用；与当前模式相同时忽略"""
+        with self.condition:
+            if self.pending_mode is None and (width, height, fps) == (self.width, self.height, self.fps):
+                return
+            self.pending_mode = (width, height, fps)
+            self.switch_requested = time.perf_counter()
+
+    def apply_mode(self):
+        """在采集线程中应用待切换的模式，返回（可能重新打开的）VideoCapture，重新打开失败时返回 None"""
+        with self.condition:
+            mode, self.pending_mode = self.pending_mode, None
+        cap = self.cap
+        previous_size = (int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+        self.width, self.height, self.fps = mode
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        cap.set(cv2.CAP_PROP_FPS, self.fps)
+        size = (int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+        if size == previous_size and size != (self.width, self.height):
+            # 部分后端不支持运行中修改分辨率，重新打开设备
+            cap.release()
+            try:
+                self.open()
+            except IOError as e:
+                print(e)
+                self.cap = None
+                return None
+            cap = self.cap
+            size = (int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+            self.reopens += 1
+        self.switch_shape = (size[1], size[0])
+        return cap
+
+    def complete_switch(self, frame_shape, capture_time):
+        if self.switch_shape is not None and frame_shape[:2] != self.switch_shape and all(self.switch_shape):
+            return  # 驱动中仍是旧模式的画面
+        with self.condition:
+            if self.pending_mode is not None:
+                return  # 又有新的切换请求，以最后一次为准
+            self.last_switch_duration = capture_time - self.switch_requested
+            self.switch_requested = None
+            self.switch_shape = None
+            self.switches += 1
+
+    def allocate(self, shape):
+        self.frames = np.empty((RING_SIZE,) + shape, np.uint8)
+
+    def start(self):
+        self.open()
+        self.running = True
+        self.thread = threading.Thread(target=self.capture_thread, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        with self.condition:
+            self.condition.notify_all()
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join(timeout=1.0)
+        self.thread = None
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+
+    def free_slot(self):
+        with self.condition:
+            for slot in range(RING_SIZE):
+                if slot != self.latest_slot and slot != self.reading_slot:
+                    return slot
+
+    def capture_thread(self):
+        cap = self.cap
+        try:
+            while self.running:
+                if self.pending_mode is not None:
+                    cap = self.apply_mode()
+                    if cap is None:
+                        break
+                read_start = time.perf_counter()
+                if not cap.grab():
+                    print("无法读取摄像头画面")
+                    break
+                capture_time = time.perf_counter()
+                if capture_time - self.last_publish_time < self.frame_interval:
+                    self.throttled += 1  # 跳过解码，驱动仍按原帧率出帧
+                    continue
+                slot = self.free_slot()
+                if self.frames is None:
+                    ret, frame = cap.retrieve()
+                    if ret:
+                        self.allocate(frame.shape)
+                        self.frames[slot] = frame
+                else:
+                    buffer = self.frames[slot]
+                    ret, frame = cap.retrieve(buffer)  # 直接解码进预分配缓冲区
+                    if ret and frame is not buffer:
+                        if frame.shape != buffer.shape:
+                            # 分辨率发生变化，重新分配环形缓冲区（处理线程仍持有旧数组的引用）
+                            with self.condition:
+                                self.allocate(frame.shape)
+                                self.latest_slot = -1
+                                self.reading_slot = -1
+                        self.frames[slot] = frame
+                if not ret:
+                    print("无法读取摄像头画面")
+                    break
+                profiler = self.profiler
+                if profiler is not None and profiler.enabled:
+                    profiler.record("cap_read", time.perf_counter() - read_start)
+                self.publish(slot, capture_time)
+                if self.switch_requested is not None:
+                    self.complete_switch(self.frames[slot].shape, capture_time)
+        finally:
+            self.running = False
+            with self.condition:
+                self.condition.notify_all()
+
+    def publish(self, slot, capture_time):
+        with self.condition:
+            if self.latest_slot >= 0 and self.consumed_seq != self.seq:
+                self.dropped += 1  # 上一帧还没被取走就被新帧取代
+            self.seq += 1
+            self.timestamps[slot] = capture_time
+            self.last_publish_time = capture_time
+            self.latest_slot = slot
+            self.captured += 1
+            self.condition.notify_all()
+
+    def read_latest(self, last_seq, timeout=None):
+        """
+        等待比 last_seq 更新的帧，返回 (seq, frame, capture_time)；
+        超时或采集已停止时返回 None。frame 在下一次调用前保持有效，不会被采集线程覆盖。
+        """
+        with self.condition:
+            self.condition.wait_for(lambda: self.seq != last_seq or not self.running, timeout)
+            if self.seq == last_seq or self.latest_slot < 0:
+                return None
+            slot = self.latest_slot
+            self.reading_slot = slot
+            self.consumed_seq = self.seq
+            self.consumed += 1
+            return self.seq, self.frames[slot], self.timestamps[slot]
+
+    def stats(self):
+        return {
+            "captured": self.captured,
+            "consumed": self.consumed,
+            "dropped": self.dropped,
+            "throttled": self.throttled,
+            "mode": (self.width, self.height, self.fps),
+            "switches": self.switches,
+            "reopens": self.reopens,
+            "last_switch_duration": self.last_switch_duration
+        }
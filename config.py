@@ -0,0 +1,168 @@
+import threading
+from collections import namedtuple
+from PySide6.QtCore import QObject, QTimer, Signal
+
+# 默认配置
+DEFAULT_CONFIG = {
+    "screen_width": 1920,
+    "screen_height": 1080,
+    "scale": 1.0,  # 默认 HiDPI 缩放比例（浮点数）
+    "screen_geometry": "auto",  # "auto" 读取系统屏幕布局，"manual" 使用上面的分辨率与缩放
+    "pointer_coordinates": "auto",  # 鼠标注入坐标系："auto", "logical", "physical"
+    "calibration": "",  # 摄像头到屏幕的标定结果（calibration.encode_calibration），为空时使用固定区域
+    "camera_width": 480,
+    "camera_height": 270,
+    "fps": 30,
+    "scroll_speed": 1,
+    "click_sensitivity": 50,
+    "move_sensitivity": 90,
+    "injection_rate": 0,  # 鼠标注入频率（Hz），0 表示仅在新识别结果到达时注入
+    "pointer_filter": "one_euro",  # "none", "one_euro", "kalman"
+    "pointer_prediction": 0,  # 是否按实测延迟预测指针位置（0/1）
+    "one_euro_min_cutoff": 1.0,
+    "one_euro_beta": 0.007,
+    "kalman_process_noise": 50000.0,
+    "kalman_measurement_noise": 16.0,
+    "profiling": 0,  # 是否统计流水线各阶段延迟（0/1）
+    "max_in_flight": 1,  # 同时进行中的推理帧数上限
+    "mirror_landmarks": 0,  # 是否跳过画面翻转、改为镜像关键点（0/1）
+    "roi_tracking": 0,  # 是否只把手部周围区域送入模型（0/1）
+    "idle_timeout": 5.0,  # 无手多少秒后进入低频探测模式，0 表示不降频
+    "idle_fps": 5,  # 低频探测模式下的帧率
+    "model_variant": "hand_landmarker",  # 模型目录中的 <名称>.task
+    "num_hands": 1,  # 最多检测的手数
+    "min_hand_detection_confidence": 0.5,  # 手掌检测阈值
+    "min_hand_presence_confidence": 0.5,  # 手部存在阈值，低于该值时重新做手掌检测
+    "min_tracking_confidence": 0.5,  # 跟踪阈值，调低可更多地沿用跟踪、跳过手掌检测
+    "dominant_hand": "right",  # 多手时优先驱动指针的手："right", "left", "any"
+    "two_hand_gestures": 1,  # 是否启用双手缩放与滚动（0/1，需要 num_hands >= 2）
+    "camera_indices": "0",  # 逗号分隔的摄像头编号，第一个为主摄像头，其余参与关键点融合
+    "camera_yaws": "",  # 逗号分隔，各辅助摄像头相对主摄像头绕竖直轴的角度（度），如侧面摄像头为 90
+    "fusion_window": 0.02,  # 融合时允许的采集时间差（秒）
+    "injection_backend": "auto",  # 鼠标注入后端："auto", "pynput", "uinput", "null"（见 injection.py）
+    "pointer_mode": "absolute",  # "absolute" 指尖位置映射到屏幕，"relative" 按手的移动相对移动指针（见 relative_pointer.py）
+    "relative_gain": 1200.0,  # 相对模式下低速时手移动一个画面宽度对应的指针像素数
+    "acceleration_curve": "sigmoid",  # "none", "linear", "quadratic", "sigmoid"，或自定义折线 "速度:增益,..."
+    "acceleration": 2.0,  # 高速时增益最多增加的倍数
+    "acceleration_threshold": 0.5  # 开始加速（sigmoid 为过渡中心）的手速（画面宽度/秒）
+}
+
+DEBOUNCE_INTERVAL = 300  # 界面连续修改合并为一次生效的等待时间（毫秒）
+
+# 不可变的配置快照，字段与 DEFAULT_CONFIG 一一对应
+ConfigSnapshot = namedtuple("ConfigSnapshot", DEFAULT_CONFIG)
+DEFAULT_SNAPSHOT = ConfigSnapshot(**DEFAULT_CONFIG)
+
+
+def coerce(key, value):
+    """
+    按默认值的类型转换配置值，无法转换时抛出 ValueError。
+    QSettings 返回值通常为字符串（即使保存的是数字），界面输入同样是字符串。
+    """
+    default = DEFAULT_CONFIG[key]
+    if isinstance(default, int):
+        return int(value)
+    if isinstance(default, float):
+        return float(value)
+    return str(value)
+
+
+class Config(QObject):
+    """
+    带类型的内存配置。
+
+    启动时从 QSettings 读取并转换一次，之后所有读取都来自不可变的 ConfigSnapshot，
+    任意线程直接读 snapshot 的属性即可，不需要加锁，也不会碰到 QSettings 的 I/O。
+    set() 修改后等待 debounce_interval 毫秒没有新的修改，再发出 changed 并在后台线程写回 QSettings。
+    """
+    changed = Signal(object)  # 新的 ConfigSnapshot
+
+    def __init__(self, settings=None, debounce_interval=DEBOUNCE_INTERVAL):
+        super().__init__()
+        self.settings = settings  # QSettings 实例，为 None 时只保存在内存中
+        self.lock = threading.Lock()
+        self.snapshot = self.load()
+        self.dirty_keys = set()
+
+        self.debounce_timer = QTimer(self)
+        self.debounce_timer.setSingleShot(True)
+        self.debounce_timer.setInterval(debounce_interval)
+        self.debounce_timer.timeout.connect(self.flush)
+
+        # 后台持久化
+        self.persist_condition = threading.Condition()
+        self.pending_persist = {}
+        self.persisting = False
+        self.persist_thread = None
+
+    def load(self):
+        """读取 QSettings，缺失或无法解析的配置项使用默认值并写回"""
+        if self.settings is None:
+            return DEFAULT_SNAPSHOT
+        values = {}
+        for key, default_value in DEFAULT_CONFIG.items():
+            value = self.settings.value(key)
+            try:
+                values[key] = coerce(key, value) if value is not None else default_value
+            except ValueError:
+                values[key] = default_value
+            if value is None:  # 如果配置项不存在
+                self.settings.setValue(key, default_value)
+        return ConfigSnapshot(**values)
+
+    def get(self, key):
+        return getattr(self.snapshot, key)
+
+    def set(self, key, value, debounce=True):
+        """修改一项配置；debounce 为 False 时立即生效。值无法转换时抛出 ValueError"""
+        value = coerce(key, value)
+        with self.lock:
+            if getattr(self.snapshot, key) == value:
+                return
+            self.snapshot = self.snapshot._replace(**{key: value})
+            self.dirty_keys.add(key)
+        if debounce:
+            self.debounce_timer.start()  # 重新计时
+        else:
+            self.flush()
+
+    def flush(self):
+        """立即发出尚未生效的修改并安排写回"""
+        self.debounce_timer.stop()
+        with self.lock:
+            if not self.dirty_keys:
+                return
+            snapshot = self.snapshot
+            changes = {key: getattr(snapshot, key) for key in self.dirty_keys}
+            self.dirty_keys.clear()
+        self.changed.emit(snapshot)
+        self.persist_async(changes)
+
+    def persist_async(self, changes):
+        if self.settings is None:
+            return
+        with self.persist_condition:
+            self.pending_persist.update(changes)
+            if self.persist_thread is None:
+                self.persist_thread = threading.Thread(target=self.persist_loop, daemon=True)
+                self.persist_thread.start()
+            self.persist_condition.notify_all()
+
+    def persist_loop(self):
+        while True:
+            with self.persist_condition:
+                self.persist_condition.wait_for(lambda: self.pending_persist)
+                changes, self.pending_persist = self.pending_persist, {}
+                self.persisting = True
+            for key, value in changes.items():
+                self.settings.setValue(key, value)
+            self.settings.sync()
+            with self.persist_condition:
+                self.persisting = False
+                self.persist_condition.notify_all()
+
+    def close(self, timeout=1.0):
+        """发出未生效的修改，并等待后台写回完成（退出前调用）"""
+        self.flush()
+        with self.persist_condition:
+            self.persist_condition.wait_for(lambda: not self.pending_persist and not self.persisting, timeout)
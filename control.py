@@ -1,24 +1,145 @@
 # import pyautogui
-from pynput.mouse import Controller as MouseController, Button
+from injection import create_backend
 
 class Controller:
-    def __init__(self, settings):
-        self.mouse = MouseController()
-        self.settings = settings  # 保存 QSettings 实例
-        self.current_mouse_x, self.current_mouse_y = self.mouse.position
+    def __init__(self, config, backend=None):
+        # backend 为 injection.py 中的注入后端；传入时固定使用（如基准测试中的空后端），否则按配置创建
+        self.fixed_backend = backend is not None
+        self.backend = None
+        self.backend_name = None
+        self.requested_backend = None  # 配置变化时记录，由注入线程在下一次 apply_hand_state 时切换
+        self.bounds_source = None  # () -> 桌面外接矩形，供 uinput 绝对坐标换算
+        self.config = config  # 带类型的配置（config.Config）
+        self.current_mouse_x, self.current_mouse_y = 0, 0
+        self.last_position = None
+        self.relative = False  # 相对指针模式：按 target 的帧间差 move_by，而不是 move_to
+        self.relative_reference = None  # 相对模式下上一个 target，为 None 时下一帧只记录不移动
+        self.resync_position = False  # 切回绝对模式后从系统读取一次当前指针位置
         self.is_pressing = False
+        self.suspended = False  # 为 True 时不注入任何事件（如标定期间）
 
-        # 初始化参数
-        self.update_parameters()
-
-    def update_parameters(self):
-        """从 QSettings 更新参数"""
-        self.scroll_step = int(int(self.settings.value("screen_height", 1080)) / 120)
-        self.scroll_speed = int(self.settings.value("scroll_speed", 1))
-        self.tolerance = 102 - int(self.settings.value("move_sensitivity", 90))
+        # 统计：唤醒次数与实际注入的鼠标事件数
+        self.wakeup_count = 0
+        self.injection_count = 0
 
+        # 初始化参数，之后配置变化时自动更新
+        self.update_parameters()
+        if backend is None:
+            backend = create_backend(self.requested_backend, self.get_bounds)
+            self.backend_name = self.requested_backend
+        self.set_backend(backend)
+        config.changed.connect(self.update_parameters)
+
+    def update_parameters(self, parameters=None):
+        """应用一份配置快照（ConfigSnapshot），默认使用当前配置"""
+        if parameters is None:
+            parameters = self.config.snapshot
+        self.scroll_step = int(parameters.screen_height / 120)
+        self.scroll_speed = parameters.scroll_speed
+        self.tolerance = 102 - parameters.move_sensitivity
+        relative = parameters.pointer_mode == "relative"
+        if relative != self.relative:
+            self.relative_reference = None
+            self.resync_position = not relative
+            self.relative = relative
+        injection_rate = parameters.injection_rate  # 0 表示事件驱动
+        self.injection_interval = 1 / injection_rate if injection_rate > 0 else 0
+        if not self.fixed_backend:
+            self.requested_backend = parameters.injection_backend
+
+    def set_backend(self, backend):
+        """切换注入后端，先释放旧后端上按住的按键"""
+        previous = self.backend
+        if previous is not None and previous is not backend:
+            if self.is_pressing:
+                previous.release()
+                self.is_pressing = False
+            previous.flush()
+            previous.close()
+        self.backend = backend
+        position = backend.position()
+        if position is not None:
+            self.current_mouse_x, self.current_mouse_y = position
+        self.last_position = None
+
+    def get_bounds(self):
+        if self.bounds_source is None:
+            return 0, 0, 1920, 1080
+        return self.bounds_source()
+
+    def injection_stats(self):
+        """返回唤醒与注入计数"""
+        return {
+            "wakeups": self.wakeup_count,
+            "injections": self.injection_count,
+            "backend": self.backend.stats()
+        }
+
+    def reset_injection_stats(self):
+        self.wakeup_count = 0
+        self.injection_count = 0
+        self.backend.reset_stats()
+
+
+    def apply_hand_state(self, hand_data, fresh=True):
+        """将一个 HandState 快照转换为鼠标事件，fresh 为 False 时只更新位置"""
+        if self.requested_backend != self.backend_name and not self.fixed_backend:
+            self.backend_name = self.requested_backend
+            self.set_backend(create_backend(self.backend_name, self.get_bounds))
+        self.dispatch_hand_state(hand_data, fresh)
+        # 本次产生的事件一次发出（uinput 下为一个 SYN_REPORT 批次）
+        self.backend.flush()
+
+    def dispatch_hand_state(self, hand_data, fresh):
+        if self.suspended:
+            if self.is_pressing:
+                self.handle_click(False)
+            self.relative_reference = None
+            return
+        if hand_data.is_valid:  # 检查手势是否有效
+            if hand_data.status == "drag":
+                self.handle_drag()
+                self.update_mouse_position(hand_data.target_x, hand_data.target_y)
+            elif hand_data.status == "scroll":
+                # 滚动状态，同一结果只滚动一次
+                if fresh:
+                    self.handle_scroll(hand_data.scroll_step)
+                self.update_mouse_position(hand_data.target_x, hand_data.target_y)
+            elif hand_data.status == "zoom":
+                # 双手缩放与滚动不移动指针
+                self.handle_click(False)
+                self.relative_reference = None
+                if fresh and hand_data.zoom_step:
+                    self.handle_zoom(hand_data.zoom_step)
+            elif hand_data.status == "pan":
+                self.handle_click(False)
+                self.relative_reference = None
+                if fresh and (hand_data.hscroll_step or hand_data.scroll_step):
+                    self.handle_pan(hand_data.hscroll_step, hand_data.scroll_step)
+            elif hand_data.status == "pre_click":
+                self.handle_click(False)
+            elif hand_data.status == "click":
+                self.handle_click(True)
+            else:
+                self.handle_click(False)
+                if not hand_data.clicking:
+                    self.update_mouse_position(hand_data.target_x, hand_data.target_y)
+        else:
+            # 如果未检测到手势，确保鼠标左键被释放
+            if self.is_pressing:
+                self.handle_click(False)  # 强制释放鼠标左键
+            self.relative_reference = None  # 手重新出现时从当前指针位置继续
 
     def update_mouse_position(self, target_x, target_y):
+        if self.relative:
+            self.move_relative(target_x, target_y)
+            return
+        if self.resync_position:
+            self.resync_position = False
+            position = self.backend.position()
+            if position is not None:
+                self.current_mouse_x, self.current_mouse_y = position
+            self.last_position = None
         # 计算当前手指位置与上一次有效位置的距离
         # distance = ((target_x - self.current_mouse_x) ** 2 + (target_y - self.current_mouse_y) ** 2) ** 0.5
         dx = target_x - self.current_mouse_x
@@ -35,9 +156,30 @@ class Controller:
 
         # self.mouse.move(stride_x, stride_y)
 
+        # 位置未变化时不再写入（pynput 在 X11 下每次写入都是一次往返）
+        position = (self.current_mouse_x, self.current_mouse_y)
+        if position == self.last_position:
+            return
         # pyautogui.moveTo(self.current_mouse_x, self.current_mouse_y)
-        self.mouse.position = (self.current_mouse_x, self.current_mouse_y)
-
+        self.backend.move_to(*position)
+        self.last_position = position
+        self.injection_count += 1
+
+
+    def move_relative(self, target_x, target_y):
+        """
+        相对模式：target 为 RelativePointer 的虚拟位置（已逐像素累积、已滤波），帧间差即指针位移。
+        通过 move_by 从系统当前位置移动，不使用防抖死区，也不会把实体鼠标移动过的指针拉回。
+        """
+        reference = self.relative_reference
+        self.relative_reference = (target_x, target_y)
+        if reference is None:
+            return
+        dx = target_x - reference[0]
+        dy = target_y - reference[1]
+        if dx or dy:
+            self.backend.move_by(dx, dy)
+            self.injection_count += 1
 
     def handle_click(self, click_flag):
         # if self.is_pressing:
@@ -50,24 +192,37 @@ class Controller:
             # # 检查冷却时间
             # if current_time - self.last_click_time < CLICK_COOLDOWN:
             #     return  # 如果未达到冷却时间，则忽略本次点击
-            self.mouse.click(Button.left)  # 按下鼠标左键
+            self.backend.click()  # 按下鼠标左键
             self.is_pressing = True
-        elif not click_flag:
-            self.mouse.release(Button.left)  # 松开鼠标左键
+            self.injection_count += 1
+        elif not click_flag and self.is_pressing:
+            self.backend.release()  # 松开鼠标左键
             self.is_pressing = False
+            self.injection_count += 1
 
     def handle_scroll(self, scroll_step):
         # if self.is_pressing:
         #     self.mouse.release(Button.left)
         #     self.is_pressing = False
 
-        self.mouse.scroll(0, int(self.scroll_step * self.scroll_speed))
+        self.backend.scroll(0, int(self.scroll_step * self.scroll_speed))
+        self.injection_count += 1
         # pyautogui.scroll(int(self.scroll_step * self.scroll_speed))
 
+    def handle_zoom(self, zoom_step):
+        # Ctrl + 滚轮，多数应用中即为缩放
+        self.backend.zoom(zoom_step)
+        self.injection_count += 1
+
+    def handle_pan(self, hscroll_step, scroll_step):
+        self.backend.scroll(int(hscroll_step * self.scroll_speed), int(scroll_step * self.scroll_speed))
+        self.injection_count += 1
+
     def handle_drag(self):
         if not self.is_pressing:
-            self.mouse.press(Button.left)
+            self.backend.press()
             self.is_pressing = True
+            self.injection_count += 1
 
     # def handle_maximize(self):
     #     window = gw.getActiveWindow()[0]
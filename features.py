@@ -0,0 +1,111 @@
+import numpy as np
+
+NUM_LANDMARKS = 21
+
+# MediaPipe 手部关键点索引（与 mp.solutions.hands.HandLandmark 一致）
+WRIST = 0
+THUMB_MCP = 2
+THUMB_TIP = 4
+INDEX_FINGER_MCP = 5
+INDEX_FINGER_TIP = 8
+MIDDLE_FINGER_MCP = 9
+MIDDLE_FINGER_TIP = 12
+RING_FINGER_MCP = 13
+RING_FINGER_TIP = 16
+PINKY_MCP = 17
+PINKY_TIP = 20
+
+FINGER_TIPS = np.array([THUMB_TIP, INDEX_FINGER_TIP, MIDDLE_FINGER_TIP, RING_FINGER_TIP, PINKY_TIP])
+FINGER_BASES = np.array([THUMB_MCP, INDEX_FINGER_MCP, MIDDLE_FINGER_MCP, RING_FINGER_MCP, PINKY_MCP])
+
+
+class HandFeatures:
+    """
+    单只手的逐帧特征。
+
+    21 个正则化坐标和世界坐标每帧复制进预先分配的 float32 数组，
+    两两距离、手指伸展比例、相对手腕的深度及其帧间变化都用少量批量 NumPy 运算原地求出，
+    之后只把手势逻辑用到的几个标量取成 Python float。
+    """
+
+    def __init__(self):
+        self.norm = np.zeros((NUM_LANDMARKS, 3), np.float32)   # 正则化坐标
+        self.world = np.zeros((NUM_LANDMARKS, 3), np.float32)  # 世界坐标（米）
+        self.deltas = np.zeros((NUM_LANDMARKS, NUM_LANDMARKS, 3), np.float32)  # world[i] - world[j]
+        self.abs_deltas = np.zeros((NUM_LANDMARKS, NUM_LANDMARKS, 3), np.float32)
+        self.sq_distances = np.zeros((NUM_LANDMARKS, NUM_LANDMARKS), np.float32)
+        self.wrist_distances = np.zeros(NUM_LANDMARKS, np.float32)
+        self.depth = np.zeros(NUM_LANDMARKS, np.float32)  # z - wrist.z
+        self.previous_depth = np.zeros(NUM_LANDMARKS, np.float32)
+        self.depth_velocity = np.zeros(NUM_LANDMARKS, np.float32)  # 上一帧深度 - 当前深度
+        self.extension = np.zeros(len(FINGER_TIPS), np.float32)  # 指尖/指根到手腕距离之比
+        self._tip_distances = np.zeros(len(FINGER_TIPS), np.float32)
+        self._base_distances = np.zeros(len(FINGER_TIPS), np.float32)
+
+        # 手势逻辑使用的标量
+        self.index_tip_x = 0.0
+        self.index_tip_y = 0.0
+        self.index_distance = 0.0
+        self.index_depth = 0.0
+        self.thumb_index_dx = 0.0
+        self.thumb_index_dy = 0.0
+        self.index_middle_dx = 0.0
+        self.index_middle_dy = 0.0
+        self.delta_z = 0.0
+        self.target_x = 0
+        self.target_y = 0
+
+    def reset(self):
+        """清空跨帧保留的深度状态，复用的实例与新建的一样从零开始"""
+        self.depth.fill(0)
+        self.previous_depth.fill(0)
+        self.depth_velocity.fill(0)
+        self.delta_z = 0.0
+
+    def load(self, hand_landmarks, world_landmarks, mirror=False):
+        """
+        从 MediaPipe 关键点列表复制坐标并计算特征。
+        mirror 为 True 表示输入画面未翻转，需要把 x 坐标镜像成与翻转画面一致。
+        """
+        self.norm[:] = [(landmark.x, landmark.y, landmark.z) for landmark in hand_landmarks]
+        self.world[:] = [(landmark.x, landmark.y, landmark.z) for landmark in world_landmarks]
+        if mirror:
+            self.mirror()
+        self.compute()
+
+    def load_arrays(self, norm, world, mirror=False):
+        """从 (21, 3) 数组复制坐标并计算特征（用于回放与基准测试）"""
+        np.copyto(self.norm, norm)
+        np.copyto(self.world, world)
+        if mirror:
+            self.mirror()
+        self.compute()
+
+    def mirror(self):
+        np.subtract(1, self.norm[:, 0], out=self.norm[:, 0])
+        np.negative(self.world[:, 0], out=self.world[:, 0])
+
+    def compute(self):
+        world = self.world
+        np.subtract(world[:, None, :], world[None, :, :], out=self.deltas)
+        np.abs(self.deltas, out=self.abs_deltas)
+        np.einsum("ijk,ijk->ij", self.deltas, self.deltas, out=self.sq_distances)
+        np.sqrt(self.sq_distances[WRIST], out=self.wrist_distances)
+        np.take(self.wrist_distances, FINGER_TIPS, out=self._tip_distances)
+        np.take(self.wrist_distances, FINGER_BASES, out=self._base_distances)
+        np.divide(self._tip_distances, self._base_distances, out=self.extension,
+                  where=self._base_distances > 0)
+
+        # 深度与帧间深度变化（previous_depth 跨越丢手保留，与原逻辑一致）
+        np.copyto(self.previous_depth, self.depth)
+        np.subtract(world[:, 2], world[WRIST, 2], out=self.depth)
+        np.subtract(self.previous_depth, self.depth, out=self.depth_velocity)
+
+        self.index_tip_x = float(self.norm[INDEX_FINGER_TIP, 0])
+        self.index_tip_y = float(self.norm[INDEX_FINGER_TIP, 1])
+        # 食指与手腕的空间距离（的平方）
+        self.index_distance = float(self.sq_distances[INDEX_FINGER_TIP, WRIST])
+        self.index_depth = -float(self.depth[INDEX_FINGER_TIP])
+        self.thumb_index_dx, self.thumb_index_dy = self.abs_deltas[INDEX_FINGER_TIP, THUMB_TIP, :2].tolist()
+        self.index_middle_dx, self.index_middle_dy = self.abs_deltas[INDEX_FINGER_TIP, MIDDLE_FINGER_TIP, :2].tolist()
+        self.delta_z = 100 * float(self.depth_velocity[INDEX_FINGER_TIP])
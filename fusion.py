@@ -0,0 +1,247 @@
+import collections
+import math
+import threading
+import time
+import numpy as np
+import mediapipe as mp
+from capture import CaptureSource
+from preprocess import FramePreprocessor
+from features import NUM_LANDMARKS
+
+FUSION_WINDOW = 0.02  # 与主摄像头采集时间相差超过该值（秒）的结果不参与融合
+RESULT_HISTORY = 8  # 每个辅助摄像头保留的最近结果数
+FRAME_WAIT_TIMEOUT = 0.5
+INFLIGHT_TIMEOUT = 1.0
+
+
+def parse_camera_list(text, cast=int):
+    """解析逗号分隔的配置值（如 "0,2"），无法解析的项忽略"""
+    values = []
+    for item in str(text).split(","):
+        item = item.strip()
+        if not item:
+            continue
+        try:
+            values.append(cast(item))
+        except ValueError:
+            print(f"忽略无效的摄像头配置: {item}")
+    return values
+
+
+class CameraWorker:
+    """
+    一个辅助摄像头：独立的采集源、预处理与 LIVE_STREAM 模式 landmarker，在自己的线程中提交推理。
+
+    MediaPipe 在各自的图线程中推理，多个摄像头因此分布在多个核上并行，而不是在识别线程里串行。
+    回调只把 (采集时间, 结果) 追加进定长历史，由 LandmarkFusion 按主摄像头的采集时间取用。
+    """
+
+    def __init__(self, camera_index, yaw, create_landmarker, width, height, fps, mirror=False):
+        self.camera_index = camera_index
+        self.yaw = yaw  # 绕竖直轴旋转到主摄像头坐标系的角度（度）
+        self.rotation = self.yaw_rotation(yaw)
+        self.create_landmarker = create_landmarker  # callback -> HandLandmarker
+        self.capture = CaptureSource(camera_index, width, height, fps)
+        self.preprocessor = FramePreprocessor(mirror_landmarks=mirror)
+        self.history = collections.deque(maxlen=RESULT_HISTORY)
+        self.capture_times = {}  # timestamp_ms -> 采集时间
+        self.thread = None
+        self.running = False
+
+        # 统计
+        self.submitted = 0
+        self.completed = 0
+        self.fused = 0
+
+    @staticmethod
+    def yaw_rotation(yaw):
+        angle = math.radians(yaw)
+        cos, sin = math.cos(angle), math.sin(angle)
+        return np.array([[cos, 0, sin], [0, 1, 0], [-sin, 0, cos]], np.float32)
+
+    def start(self):
+        self.capture.start()
+        self.running = True
+        self.thread = threading.Thread(target=self.worker_thread, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join(timeout=2.0)
+        self.thread = None
+        self.capture.stop()
+
+    def on_result(self, result, output_image, timestamp_ms):
+        capture_time = self.capture_times.pop(timestamp_ms, None)
+        self.completed += 1
+        if capture_time is not None:
+            self.history.append((capture_time, result))
+
+    def worker_thread(self):
+        capture = self.capture
+        try:
+            with self.create_landmarker(self.on_result) as landmarker:
+                frame_seq = 0
+                last_timestamp_ms = -1
+                last_submit_time = 0.0
+                while self.running:
+                    latest = capture.read_latest(frame_seq, FRAME_WAIT_TIMEOUT)
+                    if latest is None:
+                        if not capture.running:
+                            break
+                        continue
+                    frame_seq, frame, capture_time = latest
+                    # 每个摄像头同时只有一帧在推理，落后时直接取最新帧
+                    if self.submitted > self.completed and capture_time - last_submit_time < INFLIGHT_TIMEOUT:
+                        continue
+                    rgb_frame = self.preprocessor.process(frame)
+                    timestamp_ms = max(int(capture_time * 1000), last_timestamp_ms + 1)
+                    last_timestamp_ms = timestamp_ms
+                    if len(self.capture_times) > RESULT_HISTORY:
+                        self.capture_times.clear()
+                    self.capture_times[timestamp_ms] = capture_time
+                    last_submit_time = time.perf_counter()
+                    self.submitted += 1
+                    landmarker.detect_async(mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame), timestamp_ms)
+        except Exception as e:
+            print(f"摄像头 {self.camera_index} 识别线程发生错误: {e}")
+        finally:
+            self.running = False
+
+    def nearest(self, capture_time, window):
+        """返回采集时间与 capture_time 最接近且在 window 内的结果，没有时返回 None"""
+        best, best_offset = None, window
+        for entry_time, result in list(self.history):
+            offset = abs(entry_time - capture_time)
+            if offset <= best_offset:
+                best, best_offset = result, offset
+        return best
+
+    def stats(self):
+        return {
+            "camera": self.camera_index,
+            "yaw": self.yaw,
+            "running": self.running,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "fused": self.fused,
+            "capture": self.capture.stats()
+        }
+
+
+class LandmarkFusion:
+    """
+    多摄像头关键点融合。
+
+    第一个摄像头为主摄像头，仍由识别线程处理，决定指针位置（正则化坐标）与是否检测到手；
+    其余摄像头各由一个 CameraWorker 推理。主摄像头的结果回调时，按采集时间取各辅助摄像头
+    在 window 内最接近的结果，按左右手标签对应到同一只手，把世界坐标按各摄像头的 yaw
+    旋转到主摄像头坐标系后，以左右手置信度加权平均，原地写回主摄像头的结果。
+    点击检测依赖的深度（指尖与手腕的 z 差）由此得到侧面视角的补充。
+
+    世界坐标以手的几何中心为原点，因此只需旋转对齐，不需要摄像头间的平移标定。
+    """
+
+    def __init__(self, window=FUSION_WINDOW):
+        self.window = window
+        self.workers = []
+        self.scratch = np.zeros((NUM_LANDMARKS, 3), np.float32)
+        self.weighted = np.zeros((NUM_LANDMARKS, 3), np.float32)  # 加权累加的世界坐标
+        self.frames_fused = 0
+
+    def start(self, camera_indices, yaws, create_landmarker, width, height, fps, mirror=False):
+        """为每个辅助摄像头启动一个 CameraWorker；无法打开的摄像头跳过"""
+        self.stop()
+        for position, camera_index in enumerate(camera_indices):
+            yaw = yaws[position] if position < len(yaws) else 0.0
+            worker = CameraWorker(camera_index, yaw, create_landmarker, width, height, fps, mirror)
+            try:
+                worker.start()
+            except IOError as e:
+                print(e)
+                continue
+            self.workers.append(worker)
+
+    def stop(self):
+        workers, self.workers = self.workers, []
+        for worker in workers:
+            worker.stop()
+
+    def reconfigure(self, width, height, fps):
+        for worker in self.workers:
+            worker.capture.reconfigure(width, height, fps)
+
+    def set_frame_interval(self, interval):
+        for worker in self.workers:
+            worker.capture.frame_interval = interval
+
+    def fuse(self, result, capture_time):
+        """把各辅助摄像头的结果融合进 result（原地修改），返回参与融合的辅助摄像头数"""
+        if not self.workers or not result.hand_landmarks:
+            return 0
+        others = []
+        for worker in self.workers:
+            other = worker.nearest(capture_time, self.window)
+            if other is not None and other.hand_landmarks:
+                others.append((worker, other))
+        if not others:
+            return 0
+
+        fused_cameras = set()
+        for index in range(len(result.hand_world_landmarks)):
+            landmarks = result.hand_world_landmarks[index]
+            total = self.handedness(result, index)[1]
+            self.scratch[:] = [(landmark.x, landmark.y, landmark.z) for landmark in landmarks]
+            np.multiply(self.scratch, np.float32(total), out=self.weighted)
+            blended = False
+            for worker, other in others:
+                other_index = self.match_hand(result, index, other)
+                if other_index is None:
+                    continue
+                weight = self.handedness(other, other_index)[1]
+                self.scratch[:] = [(landmark.x, landmark.y, landmark.z)
+                                   for landmark in other.hand_world_landmarks[other_index]]
+                # 旋转到主摄像头坐标系后累加
+                self.weighted += np.matmul(self.scratch, worker.rotation.T) * np.float32(weight)
+                total += weight
+                blended = True
+                fused_cameras.add(worker)
+            if not blended or total <= 0:
+                continue
+            self.weighted /= np.float32(total)
+            for landmark, (x, y, z) in zip(landmarks, self.weighted.tolist()):
+                landmark.x = x
+                landmark.y = y
+                landmark.z = z
+
+        for worker in fused_cameras:
+            worker.fused += 1
+        if fused_cameras:
+            self.frames_fused += 1
+        return len(fused_cameras)
+
+    @staticmethod
+    def handedness(result, index):
+        """返回 (左右手标签, 置信度)"""
+        if not result.handedness:
+            return None, 1.0
+        category = result.handedness[index][0]
+        return category.category_name, category.score
+
+    def match_hand(self, result, index, other):
+        """按左右手标签在 other 中找到同一只手，两边都只有一只手时直接对应"""
+        if len(result.hand_landmarks) == 1 and len(other.hand_landmarks) == 1:
+            return 0
+        name = self.handedness(result, index)[0]
+        for other_index in range(len(other.hand_landmarks)):
+            if self.handedness(other, other_index)[0] == name:
+                return other_index
+        return None
+
+    def stats(self):
+        return {
+            "window": self.window,
+            "frames_fused": self.frames_fused,
+            "cameras": [worker.stats() for worker in self.workers]
+        }
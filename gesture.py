@@ -0,0 +1,137 @@
+import time
+
+FALLBACK_TRANSITION = "fallback"  # 没有任何转移成立时回到默认状态
+COOLDOWN_TRANSITION = "cooldown"  # 冷却期内强制停留在默认状态
+
+
+class Transition:
+    """一条状态转移：当前状态属于 sources 且 guards 全部成立时进入 target"""
+    __slots__ = ("name", "target", "guards", "sources", "cooldown")
+
+    def __init__(self, name, target, guards, sources, cooldown):
+        self.name = name
+        self.target = target
+        self.guards = guards
+        self.sources = sources  # None 表示任意状态
+        self.cooldown = cooldown  # 触发后强制停留在默认状态的帧数
+
+
+class GestureStateMachine:
+    """
+    表驱动的手势有限状态机。
+
+    guard 是以每帧特征为参数的谓词，按名称注册；转移按声明顺序决定优先级，
+    并预先按来源状态编成查找表，热路径只需遍历当前状态的候选转移。
+    同一帧内每个 guard 最多求值一次。新增手势只需注册状态、guard 和转移。
+    """
+
+    def __init__(self, default_state="idle"):
+        self.default_state = default_state
+        self.states = [default_state]
+        self.guards = {}
+        self.transitions = []
+        self.table = {}
+        self.state = default_state
+        self.cooldown_frames = 0
+        self.last_step_time = None
+        self.reset_stats()
+        self.rebuild_table()
+
+    def add_state(self, name):
+        if name not in self.states:
+            self.states.append(name)
+            self.rebuild_table()
+
+    def add_guard(self, name, predicate):
+        self.guards[name] = predicate
+
+    def add_transition(self, name, target, guards=(), sources=None, cooldown=0):
+        """注册一条转移，guards 为 guard 名称（或其元组），sources 为来源状态（或其元组）"""
+        if isinstance(guards, str):
+            guards = (guards,)
+        if isinstance(sources, str):
+            sources = (sources,)
+        for guard in guards:
+            if guard not in self.guards:
+                raise KeyError(f"未注册的 guard: {guard}")
+        self.add_state(target)
+        for source in sources or ():
+            self.add_state(source)
+        self.transitions.append(Transition(name, target, tuple(guards), sources, cooldown))
+        self.rebuild_table()
+
+    def remove_transition(self, name):
+        self.transitions = [t for t in self.transitions if t.name != name]
+        self.rebuild_table()
+
+    def rebuild_table(self):
+        """按来源状态预先筛选候选转移（保持声明顺序）"""
+        self.table = {
+            state: tuple(t for t in self.transitions if t.sources is None or state in t.sources)
+            for state in self.states
+        }
+
+    def reset(self):
+        """丢失手部时回到默认状态（冷却计数保留），并停止累计停留时间"""
+        self.state = self.default_state
+        self.last_step_time = None
+
+    def step(self, features, now):
+        """
+        推进一帧，返回触发的 Transition（回到默认状态时返回 None）。
+        now 为该帧的时间戳（秒），用于统计各状态停留时间。
+        """
+        start = time.perf_counter()
+        previous = self.state
+        transition = None
+        if self.cooldown_frames:
+            self.cooldown_frames -= 1
+            name = COOLDOWN_TRANSITION
+        else:
+            guards = self.guards
+            results = {}
+            for candidate in self.table[previous]:
+                for guard in candidate.guards:
+                    value = results.get(guard)
+                    if value is None:
+                        value = results[guard] = bool(guards[guard](features))
+                    if not value:
+                        break
+                else:
+                    transition = candidate
+                    break
+            self.guard_evaluations += len(results)
+            if transition is None:
+                name = FALLBACK_TRANSITION
+            else:
+                name = transition.name
+                self.cooldown_frames = transition.cooldown
+
+        self.state = transition.target if transition is not None else self.default_state
+
+        # 统计
+        if self.last_step_time is not None:
+            self.dwell_times[previous] = self.dwell_times.get(previous, 0.0) + now - self.last_step_time
+        self.last_step_time = now
+        self.transition_counts[name] = self.transition_counts.get(name, 0) + 1
+        self.frames += 1
+        self.step_time += time.perf_counter() - start
+        return transition
+
+    def reset_stats(self):
+        self.frames = 0
+        self.guard_evaluations = 0
+        self.step_time = 0.0
+        self.dwell_times = {}
+        self.transition_counts = {}
+
+    def stats(self):
+        """返回各状态停留时间、各转移次数以及每帧开销"""
+        return {
+            "state": self.state,
+            "frames": self.frames,
+            "dwell_times": dict(self.dwell_times),
+            "transition_counts": dict(self.transition_counts),
+            "guard_evaluations_per_frame": self.guard_evaluations / self.frames if self.frames else 0.0,
+            "step_time_per_frame": self.step_time / self.frames if self.frames else 0.0
+        }
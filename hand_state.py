@@ -0,0 +1,40 @@
+from collections import namedtuple
+
+_HAND_STATE_FIELDS = (
+    "seq",          # 单调递增的序号，每发布一次加一
+    "timestamp",    # 对应帧的采集时间（time.perf_counter 秒）
+    "is_valid",     # 是否检测到手
+    "status",       # "idle", "pre_click", "click", "drag", "scroll"，双手手势为 "zoom", "pan"
+    "target_x",
+    "target_y",
+    "is_pressing",
+    "clicking",
+    "scroll_step",
+    "hscroll_step",  # 水平滚动步数（双手 pan）
+    "zoom_step",     # 缩放步数（双手捏合），正数为放大
+)
+
+
+class HandState(namedtuple("HandState", _HAND_STATE_FIELDS)):
+    """
+    不可变的手势状态快照。
+
+    识别线程每帧构建一个新实例，并通过一次引用替换发布到 Recognizer.hand_data，
+    读取方拿到的永远是完整一致的状态；比较 seq 即可判断是否有新结果。
+    """
+    __slots__ = ()
+
+
+EMPTY_HAND_STATE = HandState(
+    seq=0,
+    timestamp=0.0,
+    is_valid=False,
+    status="idle",
+    target_x=0,
+    target_y=0,
+    is_pressing=False,
+    clicking=False,
+    scroll_step=0,
+    hscroll_step=0,
+    zoom_step=0
+)
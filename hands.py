@@ -0,0 +1,251 @@
+import math
+from features import HandFeatures, WRIST, MIDDLE_FINGER_MCP
+
+MAX_TRACKED_HANDS = 2  # 参与跟踪与手势的手数上限，多检测到的手直接忽略
+HAND_MATCH_DISTANCE = 0.35  # 手掌中心帧间移动超过该距离（正则化坐标）则视为另一只手
+HANDEDNESS_PENALTY = 0.2  # 左右手标签不一致时追加的匹配代价
+HAND_MAX_MISSED = 3  # 连续丢失超过该帧数后删除该手的跟踪
+LEFT = 0  # 与录制文件中的 handedness 编码一致
+RIGHT = 1
+PREFERRED_HANDEDNESS = {"left": LEFT, "right": RIGHT, "any": None}
+
+ZOOM_UNIT = 0.04  # 双手捏合点间距每变化该距离（正则化坐标）缩放一级
+PAN_UNIT = 0.02  # 双手中点每移动该距离滚动一级
+
+
+class TrackedHand:
+    """一只被跟踪的手：帧间身份、逐帧特征与各自的手势状态机"""
+
+    def __init__(self, hand_id, features, gesture_fsm):
+        self.id = hand_id
+        self.features = features
+        self.gesture_fsm = gesture_fsm
+        self.handedness = None
+        self.center_x = 0.0
+        self.center_y = 0.0
+        self.present = False  # 本帧是否检测到
+        self.missed = 0  # 连续丢失的帧数
+        self.frames = 0  # 累计检测到的帧数
+
+
+class HandTracker:
+    """
+    多手的帧间身份关联。
+
+    每帧以手掌中心（手腕与中指指根的中点）和左右手标签为依据，与已有跟踪做贪心最近邻匹配，
+    手数不超过 MAX_TRACKED_HANDS，匹配代价为 O(n²) 的常数。每只手只在检测到的帧加载一次特征，
+    其余逻辑（手势状态机、双手手势）也按手数线性增长。
+
+    dominant 为驱动指针的主手：一旦选定就保持，直到该手连续丢失被删除；
+    此时优先在当前检测到的手中选择 preferred_handedness 一侧，否则选跟踪时间最长的手。
+    第二只手进入画面不会抢走指针。
+    """
+
+    def __init__(self, create_gesture_fsm, max_hands=1, preferred_handedness=RIGHT):
+        self.create_gesture_fsm = create_gesture_fsm
+        self.max_hands = max_hands
+        self.preferred_handedness = preferred_handedness
+        self.spare_features = []  # 被删除跟踪的特征缓冲区，新跟踪复用
+        self.next_id = 1
+        self.reset()
+
+    def reset(self):
+        for track in getattr(self, "tracks", ()):
+            self.spare_features.append(track.features)
+        self.tracks = []
+        self.dominant = None
+        self.switches = 0  # 主手切换次数
+        self.new_tracks = 0
+
+    def set_max_hands(self, max_hands):
+        self.max_hands = max(1, min(max_hands, MAX_TRACKED_HANDS))
+
+    def update(self, result, mirror=False):
+        """用一帧 HandLandmarkerResult 更新跟踪，并为检测到的手加载特征"""
+        hands = min(len(result.hand_landmarks), self.max_hands)
+        detections = []
+        for index in range(hands):
+            landmarks = result.hand_landmarks[index]
+            x = (landmarks[WRIST].x + landmarks[MIDDLE_FINGER_MCP].x) / 2
+            y = (landmarks[WRIST].y + landmarks[MIDDLE_FINGER_MCP].y) / 2
+            handedness = None
+            if result.handedness:
+                handedness = RIGHT if result.handedness[index][0].category_name == "Right" else LEFT
+            detections.append(self.detection(x, y, handedness, mirror))
+        for index, track in enumerate(self.associate(detections)):
+            if track is not None:
+                track.features.load(result.hand_landmarks[index], result.hand_world_landmarks[index], mirror)
+        self.select_dominant()
+
+    def update_arrays(self, norms, worlds, handedness, mirror=False):
+        """用 (hands, 21, 3) 数组更新跟踪（用于回放），handedness 为 LEFT/RIGHT 编码"""
+        hands = min(len(norms), self.max_hands)
+        detections = []
+        for index in range(hands):
+            norm = norms[index]
+            x = float(norm[WRIST, 0] + norm[MIDDLE_FINGER_MCP, 0]) / 2
+            y = float(norm[WRIST, 1] + norm[MIDDLE_FINGER_MCP, 1]) / 2
+            detections.append(self.detection(x, y, int(handedness[index]), mirror))
+        for index, track in enumerate(self.associate(detections)):
+            if track is not None:
+                track.features.load_arrays(norms[index], worlds[index], mirror)
+        self.select_dominant()
+
+    @staticmethod
+    def detection(x, y, handedness, mirror):
+        """
+        换算成显示方向的 (x, y, handedness)。
+        MediaPipe 按输入为镜像画面判断左右手，画面未翻转时标签需要互换。
+        """
+        if mirror:
+            x = 1 - x
+            if handedness is not None:
+                handedness = 1 - handedness
+        return x, y, handedness
+
+    def associate(self, detections):
+        """把检测结果匹配到跟踪，返回与 detections 对应的 TrackedHand（无法跟踪时为 None）"""
+        pairs = []
+        for index, (x, y, handedness) in enumerate(detections):
+            for track in self.tracks:
+                cost = math.hypot(x - track.center_x, y - track.center_y)
+                if handedness is not None and track.handedness is not None and handedness != track.handedness:
+                    cost += HANDEDNESS_PENALTY
+                if cost < HAND_MATCH_DISTANCE:
+                    pairs.append((cost, index, track))
+        pairs.sort(key=lambda pair: pair[0])
+
+        assigned = [None] * len(detections)
+        matched = set()
+        for cost, index, track in pairs:
+            if assigned[index] is None and track.id not in matched:
+                assigned[index] = track
+                matched.add(track.id)
+
+        for track in self.tracks:
+            track.present = track.id in matched
+            if not track.present:
+                track.missed += 1
+        expired = [track for track in self.tracks if track.missed > HAND_MAX_MISSED]
+        if expired:
+            for track in expired:
+                self.spare_features.append(track.features)
+                if track is self.dominant:
+                    self.dominant = None
+            self.tracks = [track for track in self.tracks if track.missed <= HAND_MAX_MISSED]
+
+        for index, (x, y, handedness) in enumerate(detections):
+            track = assigned[index]
+            if track is None:
+                if len(self.tracks) >= self.max_hands:
+                    continue  # 已满：旧跟踪尚未过期，新出现的手暂不接管
+                track = self.new_track()
+                assigned[index] = track
+            track.center_x = x
+            track.center_y = y
+            if handedness is not None:
+                track.handedness = handedness
+            track.present = True
+            track.missed = 0
+            track.frames += 1
+        return assigned
+
+    def new_track(self):
+        if self.spare_features:
+            features = self.spare_features.pop()
+            features.reset()  # 上一只手的深度不能参与新跟踪第一帧的 delta_z
+        else:
+            features = HandFeatures()
+        track = TrackedHand(self.next_id, features, self.create_gesture_fsm())
+        self.next_id += 1
+        self.new_tracks += 1
+        self.tracks.append(track)
+        return track
+
+    def select_dominant(self):
+        if self.dominant is not None:
+            return
+        candidates = [track for track in self.tracks if track.present]
+        if not candidates:
+            return
+        preferred = [track for track in candidates if track.handedness == self.preferred_handedness]
+        self.dominant = max(preferred or candidates, key=lambda track: track.frames)
+        self.switches += 1
+
+    def secondary(self):
+        """本帧检测到的另一只手，没有时返回 None"""
+        for track in self.tracks:
+            if track.present and track is not self.dominant:
+                return track
+        return None
+
+    def present_hands(self):
+        return [track for track in self.tracks if track.present]
+
+    def stats(self):
+        return {
+            "max_hands": self.max_hands,
+            "tracked": len(self.tracks),
+            "present": sum(track.present for track in self.tracks),
+            "dominant": self.dominant.id if self.dominant is not None else None,
+            "dominant_switches": self.switches,
+            "new_tracks": self.new_tracks
+        }
+
+
+class TwoHandGestures:
+    """
+    双手手势：两只手同时捏合为缩放（pinch-zoom），同时摆出滚动手势为二维滚动（pan）。
+
+    is_pinching / is_scroll_pose 为单手的判定函数（参数为 HandFeatures），与单手手势共用阈值。
+    进入手势时记下两个食指指尖的间距与中点作为锚点，之后每累计一个单位的变化输出一级，
+    锚点随之前移，余量留到下一帧，因此缓慢移动也不会丢失步数。
+    """
+
+    def __init__(self, is_pinching, is_scroll_pose, zoom_unit=ZOOM_UNIT, pan_unit=PAN_UNIT):
+        self.is_pinching = is_pinching
+        self.is_scroll_pose = is_scroll_pose
+        self.zoom_unit = zoom_unit
+        self.pan_unit = pan_unit
+        self.reset()
+
+    def reset(self):
+        self.mode = None  # None / "zoom" / "pan"
+        self.anchor_distance = 0.0
+        self.anchor_x = 0.0
+        self.anchor_y = 0.0
+
+    def step(self, primary, secondary):
+        """
+        推进一帧，返回 (status, hscroll_step, scroll_step, zoom_step)；两只手不构成双手手势时返回 None。
+        zoom_step 为正表示双手分开（放大），滚动步数为正表示双手向上/向右移动。
+        """
+        if self.is_pinching(primary) and self.is_pinching(secondary):
+            mode = "zoom"
+        elif self.is_scroll_pose(primary) and self.is_scroll_pose(secondary):
+            mode = "pan"
+        else:
+            self.reset()
+            return None
+
+        dx = primary.index_tip_x - secondary.index_tip_x
+        dy = primary.index_tip_y - secondary.index_tip_y
+        distance = math.hypot(dx, dy)
+        center_x = (primary.index_tip_x + secondary.index_tip_x) / 2
+        center_y = (primary.index_tip_y + secondary.index_tip_y) / 2
+        if mode != self.mode:
+            self.mode = mode
+            self.anchor_distance = distance
+            self.anchor_x = center_x
+            self.anchor_y = center_y
+            return mode, 0, 0, 0
+
+        if mode == "zoom":
+            zoom_step = int((distance - self.anchor_distance) / self.zoom_unit)
+            self.anchor_distance += zoom_step * self.zoom_unit
+            return mode, 0, 0, zoom_step
+        hscroll_step = int((center_x - self.anchor_x) / self.pan_unit)
+        scroll_step = int((self.anchor_y - center_y) / self.pan_unit)
+        self.anchor_x += hscroll_step * self.pan_unit
+        self.anchor_y -= scroll_step * self.pan_unit
+        return mode, hscroll_step, scroll_step, 0
@@ -0,0 +1,329 @@
+"""
+鼠标事件注入后端。
+
+Controller 只调用 move_to/move_by/press/release/click/scroll/zoom 把事件排入当前批次，
+每处理完一个 HandState 调用一次 flush() 统一发出。各后端只实现 emit(events)，
+基类负责统计事件数、批次数与发出耗时，便于在同一台机器上比较各后端的注入开销。
+
+    pynput     pynput（X11 下每次设置位置都是一次往返，不支持 Wayland）
+    uinput     Linux /dev/uinput 虚拟设备，一个批次的所有事件一次 write 并以 SYN_REPORT 结束
+    null       丢弃所有事件（基准测试）
+    recording  在内存中记录所有批次（测试与基准测试）
+"""
+import os
+import struct
+import sys
+import time
+
+BACKENDS = ("auto", "pynput", "uinput", "null", "recording")
+
+
+class InjectionBackend:
+    """注入后端基类：事件先排入 pending，flush() 时交给 emit() 并计时"""
+    name = "base"
+
+    def __init__(self):
+        self.pending = []  # 当前批次的 (操作, 参数...) 元组
+        self.events = 0
+        self.flushes = 0
+        self.emit_time = 0.0
+        self.max_emit_time = 0.0
+
+    def position(self):
+        """当前指针位置，无法查询时返回 None"""
+        return None
+
+    def move_to(self, x, y):
+        self.pending.append(("move_to", x, y))
+
+    def move_by(self, dx, dy):
+        self.pending.append(("move_by", dx, dy))
+
+    def press(self):
+        self.pending.append(("press",))
+
+    def release(self):
+        self.pending.append(("release",))
+
+    def click(self):
+        self.pending.append(("click",))
+
+    def scroll(self, dx, dy):
+        self.pending.append(("scroll", dx, dy))
+
+    def zoom(self, steps):
+        """按住 Ctrl 滚动 steps 级"""
+        self.pending.append(("zoom", steps))
+
+    def flush(self):
+        if not self.pending:
+            return
+        events, self.pending = self.pending, []
+        start = time.perf_counter()
+        self.emit(events)
+        elapsed = time.perf_counter() - start
+        self.events += len(events)
+        self.flushes += 1
+        self.emit_time += elapsed
+        if elapsed > self.max_emit_time:
+            self.max_emit_time = elapsed
+
+    def emit(self, events):
+        raise NotImplementedError
+
+    def close(self):
+        self.pending = []
+
+    def reset_stats(self):
+        self.events = 0
+        self.flushes = 0
+        self.emit_time = 0.0
+        self.max_emit_time = 0.0
+
+    def stats(self):
+        return {
+            "backend": self.name,
+            "events": self.events,
+            "flushes": self.flushes,
+            "events_per_flush": self.events / self.flushes if self.flushes else 0.0,
+            "time_per_event": self.emit_time / self.events if self.events else 0.0,
+            "time_per_flush": self.emit_time / self.flushes if self.flushes else 0.0,
+            "max_flush_time": self.max_emit_time
+        }
+
+
+class NullBackend(InjectionBackend):
+    """丢弃所有事件"""
+    name = "null"
+
+    def emit(self, events):
+        pass
+
+
+class RecordingBackend(InjectionBackend):
+    """在内存中按批次记录事件，batches 为 [(flush 时间, [事件, ...])]"""
+    name = "recording"
+
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def emit(self, events):
+        self.batches.append((time.perf_counter(), events))
+
+    def recorded_events(self):
+        return [event for _, events in self.batches for event in events]
+
+    def clear(self):
+        self.batches = []
+
+
+class PynputBackend(InjectionBackend):
+    """pynput 后端，事件逐个调用 pynput"""
+    name = "pynput"
+
+    def __init__(self):
+        super().__init__()
+        from pynput.mouse import Controller as MouseController, Button
+        self.mouse = MouseController()
+        self.button = Button.left
+        self.keyboard = None  # 缩放时按住 Ctrl，首次使用时创建
+
+    def position(self):
+        return self.mouse.position
+
+    def emit(self, events):
+        mouse = self.mouse
+        for event in events:
+            operation = event[0]
+            if operation == "move_to":
+                mouse.position = (event[1], event[2])
+            elif operation == "move_by":
+                mouse.move(event[1], event[2])
+            elif operation == "press":
+                mouse.press(self.button)
+            elif operation == "release":
+                mouse.release(self.button)
+            elif operation == "click":
+                mouse.click(self.button)
+            elif operation == "scroll":
+                mouse.scroll(event[1], event[2])
+            elif operation == "zoom":
+                from pynput.keyboard import Controller as KeyboardController, Key
+                if self.keyboard is None:
+                    self.keyboard = KeyboardController()
+                with self.keyboard.pressed(Key.ctrl):
+                    mouse.scroll(0, event[1])
+
+
+# linux/input-event-codes.h 与 linux/uinput.h
+EV_SYN, EV_KEY, EV_REL, EV_ABS = 0x00, 0x01, 0x02, 0x03
+SYN_REPORT = 0
+REL_X, REL_Y, REL_HWHEEL, REL_WHEEL = 0x00, 0x01, 0x06, 0x08
+ABS_X, ABS_Y = 0x00, 0x01
+BTN_LEFT, BTN_RIGHT, BTN_MIDDLE = 0x110, 0x111, 0x112
+KEY_LEFTCTRL = 29
+UI_SET_EVBIT, UI_SET_KEYBIT, UI_SET_RELBIT, UI_SET_ABSBIT = 0x40045564, 0x40045565, 0x40045566, 0x40045567
+UI_DEV_CREATE, UI_DEV_DESTROY = 0x5501, 0x5502
+BUS_VIRTUAL = 0x06
+ABS_SIZE = 64
+ABS_RESOLUTION = 32767  # 绝对坐标设备的取值范围，映射到整个桌面
+INPUT_EVENT = struct.Struct("llHHi")  # struct input_event（timeval 由内核填写）
+UINPUT_PATH = "/dev/uinput"
+
+
+class UinputDevice:
+    """一个 uinput 虚拟设备：capabilities 为 {事件类型: [代码, ...]}，abs 轴范围为 0~ABS_RESOLUTION"""
+
+    def __init__(self, name, capabilities, product):
+        import fcntl
+        self.fcntl = fcntl
+        self.fd = os.open(UINPUT_PATH, os.O_WRONLY | os.O_NONBLOCK)
+        try:
+            bits = {EV_KEY: UI_SET_KEYBIT, EV_REL: UI_SET_RELBIT, EV_ABS: UI_SET_ABSBIT}
+            fcntl.ioctl(self.fd, UI_SET_EVBIT, EV_SYN)
+            for event_type, codes in capabilities.items():
+                fcntl.ioctl(self.fd, UI_SET_EVBIT, event_type)
+                for code in codes:
+                    fcntl.ioctl(self.fd, bits[event_type], code)
+            # 旧式 struct uinput_user_dev：名称、input_id、ff_effects_max 与各轴 absmax/absmin/absfuzz/absflat
+            absmax = [0] * ABS_SIZE
+            for code in capabilities.get(EV_ABS, ()):
+                absmax[code] = ABS_RESOLUTION
+            setup = struct.pack(f"80sHHHHi{ABS_SIZE * 4}i", name.encode()[:79], BUS_VIRTUAL, 0x1209, product, 1, 0,
+                                *absmax, *([0] * ABS_SIZE * 3))
+            os.write(self.fd, setup)
+            fcntl.ioctl(self.fd, UI_DEV_CREATE)
+        except OSError:
+            os.close(self.fd)
+            raise
+        self.buffer = bytearray()
+
+    def add(self, event_type, code, value):
+        self.buffer += INPUT_EVENT.pack(0, 0, event_type, code, value)
+
+    def sync(self):
+        """以 SYN_REPORT 结束当前批次，一次 write 写入"""
+        if not self.buffer:
+            return
+        self.add(EV_SYN, SYN_REPORT, 0)
+        os.write(self.fd, self.buffer)
+        self.buffer.clear()
+
+    def close(self):
+        try:
+            self.fcntl.ioctl(self.fd, UI_DEV_DESTROY)
+        finally:
+            os.close(self.fd)
+
+
+class UinputBackend(InjectionBackend):
+    """
+    Linux uinput 后端，不依赖显示服务器（X11 与 Wayland 均可用），需要 /dev/uinput 的写权限。
+
+    绝对定位使用与虚拟机平板相同的设备类型（ABS_X/ABS_Y + 鼠标按键 + 滚轮），
+    坐标按 bounds_source() 返回的桌面范围换算到 0~ABS_RESOLUTION；
+    相对移动与 Ctrl 键各用一个设备，首次使用时创建。每个设备一批事件只 write 一次。
+    左键松开总是发往按下时的设备，拖动中切换定位模式也不会留下按住的按键。
+    """
+    name = "uinput"
+    BUTTONS = [BTN_LEFT, BTN_RIGHT, BTN_MIDDLE]
+    WHEELS = [REL_WHEEL, REL_HWHEEL]
+
+    def __init__(self, bounds_source=None):
+        super().__init__()
+        self.bounds_source = bounds_source  # () -> (left, top, right, bottom)，为 None 时按 1920x1080
+        self.absolute = UinputDevice("AirCursor Pointer", {
+            EV_KEY: self.BUTTONS, EV_REL: self.WHEELS, EV_ABS: [ABS_X, ABS_Y]}, 0x0001)
+        self.relative = None
+        self.keyboard = None
+        self.pointer = self.absolute  # 按键与滚轮发往最近一次移动所用的设备
+        self.pressed_device = None  # 左键按下所在的设备，松开必须发往同一设备，否则按键会卡住
+        self.last_position = None
+
+    @staticmethod
+    def available():
+        return sys.platform.startswith("linux") and os.access(UINPUT_PATH, os.W_OK)
+
+    def position(self):
+        return self.last_position
+
+    def absolute_value(self, value, low, high):
+        if high <= low:
+            return 0
+        return max(0, min(ABS_RESOLUTION, int((value - low) * ABS_RESOLUTION / (high - low - 1))))
+
+    def emit(self, events):
+        left, top, right, bottom = self.bounds_source() if self.bounds_source is not None else (0, 0, 1920, 1080)
+        devices = set()
+        for event in events:
+            operation = event[0]
+            if operation == "move_to":
+                self.pointer = self.absolute
+                self.absolute.add(EV_ABS, ABS_X, self.absolute_value(event[1], left, right))
+                self.absolute.add(EV_ABS, ABS_Y, self.absolute_value(event[2], top, bottom))
+                self.last_position = (event[1], event[2])
+            elif operation == "move_by":
+                if self.relative is None:
+                    self.relative = UinputDevice("AirCursor Relative Pointer", {
+                        EV_KEY: self.BUTTONS, EV_REL: [REL_X, REL_Y] + self.WHEELS}, 0x0002)
+                self.pointer = self.relative
+                self.relative.add(EV_REL, REL_X, int(event[1]))
+                self.relative.add(EV_REL, REL_Y, int(event[2]))
+            elif operation == "press":
+                self.pointer.add(EV_KEY, BTN_LEFT, 1)
+                self.pressed_device = self.pointer
+            elif operation == "release":
+                device = self.pressed_device if self.pressed_device is not None else self.pointer
+                device.add(EV_KEY, BTN_LEFT, 0)
+                devices.add(device)
+                self.pressed_device = None
+            elif operation == "click":
+                # 按下与松开必须分属两个 SYN_REPORT，否则会被合并掉
+                self.pointer.add(EV_KEY, BTN_LEFT, 1)
+                self.pointer.sync()
+                self.pointer.add(EV_KEY, BTN_LEFT, 0)
+            elif operation == "scroll":
+                if event[2]:
+                    self.pointer.add(EV_REL, REL_WHEEL, int(event[2]))
+                if event[1]:
+                    self.pointer.add(EV_REL, REL_HWHEEL, int(event[1]))
+            elif operation == "zoom":
+                if self.keyboard is None:
+                    self.keyboard = UinputDevice("AirCursor Keyboard", {EV_KEY: [KEY_LEFTCTRL]}, 0x0003)
+                self.keyboard.add(EV_KEY, KEY_LEFTCTRL, 1)
+                self.keyboard.sync()
+                self.pointer.add(EV_REL, REL_WHEEL, int(event[1]))
+                self.pointer.sync()
+                self.keyboard.add(EV_KEY, KEY_LEFTCTRL, 0)
+                devices.add(self.keyboard)
+            devices.add(self.pointer)
+        for device in devices:
+            device.sync()
+
+    def close(self):
+        super().close()
+        for device in (self.absolute, self.relative, self.keyboard):
+            if device is not None:
+                device.close()
+        self.absolute = self.relative = self.keyboard = None
+
+
+def create_backend(name="auto", bounds_source=None):
+    """
+    按名称创建注入后端。auto 在 Wayland 会话且 /dev/uinput 可写时使用 uinput，否则使用 pynput；
+    uinput 创建失败时退回 pynput。
+    """
+    if name == "null":
+        return NullBackend()
+    if name == "recording":
+        return RecordingBackend()
+    if name == "auto":
+        wayland = os.environ.get("XDG_SESSION_TYPE") == "wayland" or "WAYLAND_DISPLAY" in os.environ
+        name = "uinput" if wayland and UinputBackend.available() else "pynput"
+    if name == "uinput":
+        try:
+            return UinputBackend(bounds_source)
+        except OSError as e:
+            print(f"无法创建 uinput 设备，改用 pynput: {e}")
+    return PynputBackend()
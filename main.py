@@ -1,3 +1,4 @@
+import startup  # 最先导入，作为启动计时起点
 import os
 import sys  # Only needed for access to command line arguments
 import threading
@@ -18,8 +19,6 @@ from PySide6.QtWidgets import (
     QLabel, QLineEdit, QComboBox, QSlider, QPushButton, QDial
 )
 from app import MainWindow
-from control import Controller
-from recognize  import Recognizer
 from resources import rc_resources
 from translations import rc_translations
 
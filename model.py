@@ -0,0 +1,146 @@
+import hashlib
+import os
+import sys
+import time
+from PySide6.QtCore import QDir, QFile, QIODevice, QStandardPaths
+from mediapipe.tasks import python as mp_tasks
+
+MODEL_SUFFIX = ".task"
+DIGEST_SUFFIX = ".sha256"  # 缓存模型旁记录内容哈希的文件后缀
+# 源码目录中的模型文件（resources.qrc 由此打包），存在时优先直接使用
+MODEL_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "model")
+
+
+def current_rss():
+    """当前进程的常驻内存（字节）；只能取得峰值时返回峰值，无法获取时返回 None"""
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None  # Windows
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # macOS 为字节，其余为 KB
+
+
+class ModelManager:
+    """
+    HandLandmarker 模型文件管理。
+
+    MediaPipe 对 model_asset_path 指向的文件做内存映射，因此优先给它一个磁盘路径：
+    源码目录中有同名模型时直接使用；否则把 Qt 资源中的模型解压到缓存目录，旁边记录内容的 SHA-256，
+    之后内容不变时都用该文件（同名同大小的新模型也会重新解压）。
+    只有两者都不可用时才退回 model_asset_buffer，在内存中保留一份模型。
+
+    变体即模型目录中的 <名称>.task 文件，默认变体为 model_path 本身。
+    """
+
+    def __init__(self, model_path):
+        self.model_path = model_path  # 文件路径或 Qt 资源路径（":/..."）
+        self.directory, file_name = os.path.split(model_path)
+        self.default_variant = file_name[:-len(MODEL_SUFFIX)] if file_name.endswith(MODEL_SUFFIX) else file_name
+
+        self.variant = None
+        self.path = None  # 交给 MediaPipe 映射的磁盘路径
+        self.buffer = None  # 无法得到磁盘路径时的模型内容
+        self.source = None  # "file" / "cache" / "buffer"
+        self.load_time = 0.0
+        self.rss_before = None
+        self.rss_after = None
+        self.warmup_time = 0.0
+
+    def variant_path(self, variant):
+        return f"{self.directory}/{variant}{MODEL_SUFFIX}"
+
+    def available_variants(self):
+        names = set(QDir(self.directory).entryList([f"*{MODEL_SUFFIX}"]))
+        if os.path.isdir(MODEL_DIRECTORY):
+            names.update(name for name in os.listdir(MODEL_DIRECTORY) if name.endswith(MODEL_SUFFIX))
+        return sorted(name[:-len(MODEL_SUFFIX)] for name in names)
+
+    def load(self, variant=None):
+        """定位指定变体的模型文件；已加载同一变体时直接返回"""
+        variant = variant or self.default_variant
+        if variant == self.variant:
+            return
+        start = time.perf_counter()
+        self.rss_before = current_rss()
+        self.variant = None
+        self.path = self.buffer = None
+
+        model_path = self.variant_path(variant)
+        if not model_path.startswith(":"):
+            if not os.path.exists(model_path):
+                raise IOError(f"模型文件不存在: {model_path}")
+            self.path, self.source = model_path, "file"
+        else:
+            local_path = os.path.join(MODEL_DIRECTORY, variant + MODEL_SUFFIX)
+            if os.path.exists(local_path):
+                self.path, self.source = local_path, "file"
+            else:
+                self.extract(model_path, variant)
+
+        self.variant = variant
+        self.rss_after = current_rss()
+        self.load_time = time.perf_counter() - start
+
+    def extract(self, resource_path, variant):
+        """把 Qt 资源中的模型复制到缓存目录（内容哈希一致时复用），失败时保留在内存中"""
+        model_file = QFile(resource_path)
+        if not model_file.open(QIODevice.ReadOnly):  # 必须先 open!
+            raise IOError(f"无法打开 Qt 资源: {resource_path}")
+        data = bytes(model_file.readAll().data())
+        model_file.close()
+        digest = hashlib.sha256(data).hexdigest()
+
+        cache_directory = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+        cache_path = os.path.join(cache_directory, "models", variant + MODEL_SUFFIX) if cache_directory else None
+        if cache_path and os.path.exists(cache_path) and self.cached_digest(cache_path) == digest:
+            self.path, self.source = cache_path, "cache"
+            return
+        if cache_path:
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                temporary_path = cache_path + ".tmp"
+                with open(temporary_path, "wb") as file:
+                    file.write(data)
+                os.replace(temporary_path, cache_path)
+                # 哈希在模型文件就位后写入，中途失败时下次会重新解压
+                with open(temporary_path, "w") as file:
+                    file.write(digest)
+                os.replace(temporary_path, cache_path + DIGEST_SUFFIX)
+                self.path, self.source = cache_path, "cache"
+                return  # 释放读出的副本，由 MediaPipe 映射缓存文件
+            except OSError as e:
+                print(f"无法缓存模型文件，改为从内存加载: {e}")
+        self.buffer, self.source = data, "buffer"
+
+    @staticmethod
+    def cached_digest(cache_path):
+        """解压时记录的模型内容哈希，没有记录时返回 None"""
+        try:
+            with open(cache_path + DIGEST_SUFFIX) as file:
+                return file.read().strip()
+        except OSError:
+            return None
+
+    def base_options(self, variant=None):
+        self.load(variant)
+        if self.path is not None:
+            return mp_tasks.BaseOptions(model_asset_path=self.path)
+        return mp_tasks.BaseOptions(model_asset_buffer=self.buffer)
+
+    def stats(self):
+        return {
+            "variant": self.variant,
+            "variants": self.available_variants(),
+            "source": self.source,
+            "path": self.path,
+            "load_time": self.load_time,
+            "warmup_time": self.warmup_time,
+            "rss_before": self.rss_before,
+            "rss_after": self.rss_after
+        }
@@ -0,0 +1,146 @@
+import math
+import statistics
+import time
+from PySide6.QtCore import Qt, QTimer, Signal, QPointF
+from PySide6.QtGui import QColor, QGuiApplication, QPainter, QPen
+from PySide6.QtWidgets import QWidget
+import numpy as np
+from calibration import CALIBRATION_TARGETS, fit_calibration, encode_calibration
+
+SAMPLE_INTERVAL = 33  # 读取指尖位置的间隔（毫秒）
+HOLD_TIME = 0.8  # 指尖在目标上保持稳定的时间（秒）
+STEADY_TOLERANCE = 0.01  # 保持期间指尖移动范围不超过该值（正则化坐标）即视为稳定
+MIN_TARGET_DISTANCE = 0.03  # 指尖离开上一个目标的记录位置至少该距离（正则化坐标）后才开始记录下一个目标
+MAX_CALIBRATION_ERROR = 0.03  # 均方根误差（桌面归一化坐标）超过该值时不保存，重新标定
+TARGET_RADIUS = 18
+
+
+class CalibrationPage(QWidget):
+    """
+    标定窗口：覆盖整个虚拟桌面，依次显示 CALIBRATION_TARGETS 中的目标点。
+
+    sample_source() 返回当前食指指尖的正则化坐标 (x, y)（未检测到手时为 None）；
+    指尖离开上一个目标的位置至少 MIN_TARGET_DISTANCE 后开始计时，在 HOLD_TIME 内的移动范围小于
+    STEADY_TOLERANCE 时取中位数记为该目标的样本，进入下一个目标，避免反应慢时两个目标记下同一个点。
+    全部完成后拟合单应矩阵（含径向畸变），误差不超过 MAX_CALIBRATION_ERROR 时发出 finished(配置文本, 均方根误差)，
+    否则提示后从第一个目标重新开始；按 Esc 或以其他方式关闭窗口时发出 cancelled。
+    """
+    finished = Signal(str, float)
+    cancelled = Signal()
+
+    def __init__(self, sample_source):
+        super().__init__()
+        self.sample_source = sample_source
+        self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self.setCursor(Qt.BlankCursor)
+
+        self.target_index = 0
+        self.samples = []  # 当前目标保持期间的 (时间, x, y)
+        self.points = []  # 每个目标的指尖坐标
+        self.message = ""  # 上一次标定失败的提示
+        self.done = False  # 已发出 finished，关闭时不再发出 cancelled
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.sample)
+
+    def start(self):
+        self.setGeometry(QGuiApplication.primaryScreen().virtualGeometry())
+        self.show()
+        self.raise_()
+        self.activateWindow()
+        self.timer.start(SAMPLE_INTERVAL)
+
+    def target_position(self):
+        x, y = CALIBRATION_TARGETS[self.target_index]
+        return QPointF(x * self.width(), y * self.height())
+
+    def sample(self):
+        position = self.sample_source()
+        now = time.perf_counter()
+        if position is None or (self.points and math.dist(position, self.points[-1]) < MIN_TARGET_DISTANCE):
+            # 未检测到手，或指尖仍停在上一个目标上
+            self.samples.clear()
+            self.update()
+            return
+        self.samples.append((now, position[0], position[1]))
+        while self.samples and now - self.samples[0][0] > HOLD_TIME:
+            self.samples.pop(0)
+        xs = [x for _, x, _ in self.samples]
+        ys = [y for _, _, y in self.samples]
+        if max(xs) - min(xs) > STEADY_TOLERANCE or max(ys) - min(ys) > STEADY_TOLERANCE:
+            self.samples = self.samples[-1:]  # 移动中，重新计时
+        elif now - self.samples[0][0] >= HOLD_TIME * 0.95:
+            self.points.append((statistics.median(xs), statistics.median(ys)))
+            self.samples.clear()
+            self.target_index += 1
+            if self.target_index == len(CALIBRATION_TARGETS):
+                self.complete()
+                return
+        self.update()
+
+    def complete(self):
+        try:
+            homography, k1, error = fit_calibration(self.points, CALIBRATION_TARGETS[:len(self.points)])
+        except (ValueError, ArithmeticError, np.linalg.LinAlgError) as e:
+            print(f"标定失败: {e}")
+            self.restart(self.tr("Calibration failed, please try again."))
+            return
+        if not np.isfinite(error) or error > MAX_CALIBRATION_ERROR:
+            print(f"标定误差过大: {error:.4f}")
+            self.restart(self.tr("Calibration was not accurate enough (error {:.1f}%), please try again.").format(
+                error * 100))
+            return
+        self.timer.stop()
+        self.done = True
+        self.finished.emit(encode_calibration(homography, k1), error)
+        self.close()
+
+    def restart(self, message):
+        """丢弃已记录的点，从第一个目标重新开始"""
+        self.message = message
+        self.target_index = 0
+        self.samples.clear()
+        self.points.clear()
+        self.update()
+
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key_Escape:
+            self.close()
+            return
+        super().keyPressEvent(event)
+
+    def closeEvent(self, event):
+        # Esc、Alt+F4 与窗口管理器关闭都经过这里，未完成时视为取消
+        self.timer.stop()
+        if not self.done:
+            self.done = True
+            self.cancelled.emit()
+        super().closeEvent(event)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.fillRect(self.rect(), QColor(0, 0, 0, 200))
+        if self.target_index >= len(CALIBRATION_TARGETS):
+            return
+        center = self.target_position()
+        # 保持进度以外圈弧线表示
+        progress = 0.0
+        if len(self.samples) > 1:
+            progress = min(1.0, (self.samples[-1][0] - self.samples[0][0]) / HOLD_TIME)
+        painter.setPen(QPen(QColor(255, 255, 255), 2))
+        painter.drawEllipse(center, TARGET_RADIUS, TARGET_RADIUS)
+        painter.drawLine(center + QPointF(-TARGET_RADIUS * 1.5, 0), center + QPointF(TARGET_RADIUS * 1.5, 0))
+        painter.drawLine(center + QPointF(0, -TARGET_RADIUS * 1.5), center + QPointF(0, TARGET_RADIUS * 1.5))
+        if progress > 0:
+            painter.setPen(QPen(QColor(64, 200, 120), 4))
+            radius = TARGET_RADIUS + 8
+            painter.drawArc(int(center.x() - radius), int(center.y() - radius), 2 * radius, 2 * radius,
+                            90 * 16, int(-360 * 16 * progress))
+        painter.setPen(QColor(255, 255, 255))
+        painter.drawText(self.rect().adjusted(0, 40, 0, 0), Qt.AlignHCenter | Qt.AlignTop,
+                         self.tr("Point at the target and hold still ({}/{}). Press Esc to cancel.").format(
+                             self.target_index + 1, len(CALIBRATION_TARGETS)))
+        if self.message:
+            painter.setPen(QColor(255, 180, 80))
+            painter.drawText(self.rect().adjusted(0, 70, 0, 0), Qt.AlignHCenter | Qt.AlignTop, self.message)
@@ -0,0 +1,89 @@
+import numpy as np
+from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtWidgets import QLabel
+
+DEFAULT_REFRESH_RATE = 60.0  # 取不到屏幕刷新率时使用
+
+
+class LiveStreamPage(QLabel):
+    """
+    实时预览页面。
+
+    frame_signal 的每一帧只在 submit_frame 中记下引用，真正的绘制由与屏幕刷新率同步的定时器完成，
+    多余的帧被合并丢弃；页面不可见（切到其他页面、窗口隐藏或最小化）时定时器停止，
+    并通过 visibility_changed 通知识别端停止产生预览帧。
+    画面先缩放到标签大小写入复用的缓冲区，再包装成 QImage 转换为 QPixmap。
+    """
+    visibility_changed = Signal(bool)
+
+    def __init__(self):
+        super().__init__()
+        self.setAlignment(Qt.AlignCenter)
+        self.setMinimumSize(1, 1)  # 允许缩小，避免 pixmap 把窗口撑大
+
+        self.latest_frame = None
+        self.dirty = False
+        self.buffer = None  # 缩放后的 RGB 画面
+        self.render_timer = QTimer(self)
+        self.render_timer.timeout.connect(self.render_frame)
+
+        # 统计
+        self.frames_received = 0
+        self.frames_rendered = 0
+
+    def submit_frame(self, frame):
+        """frame_signal 的槽：只保留最新的一帧"""
+        self.latest_frame = frame
+        self.dirty = True
+        self.frames_received += 1
+
+    def refresh_interval(self):
+        screen = self.screen()
+        refresh_rate = screen.refreshRate() if screen is not None else 0
+        return max(1, int(1000 / (refresh_rate or DEFAULT_REFRESH_RATE)))
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.render_timer.start(self.refresh_interval())
+        self.visibility_changed.emit(True)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.render_timer.stop()
+        self.latest_frame = None
+        self.dirty = False
+        self.visibility_changed.emit(False)
+
+    def render_frame(self):
+        if not self.dirty or self.window().isMinimized():
+            return
+        self.dirty = False
+        frame = self.latest_frame
+        if frame is None:
+            return
+
+        # 保持宽高比缩放到标签大小
+        height, width = frame.shape[:2]
+        size = self.contentsRect().size()
+        scale = min(size.width() / width, size.height() / height, 1.0)
+        target_width = max(1, int(width * scale))
+        target_height = max(1, int(height * scale))
+        if self.buffer is None or self.buffer.shape[:2] != (target_height, target_width):
+            self.buffer = np.empty((target_height, target_width, 3), np.uint8)
+        if scale < 1.0:
+            import cv2  # 首次绘制时才导入，不拖慢启动
+            cv2.resize(frame, (target_width, target_height), dst=self.buffer, interpolation=cv2.INTER_AREA)
+        else:
+            np.copyto(self.buffer, frame)
+
+        image = QImage(self.buffer.data, target_width, target_height, 3 * target_width, QImage.Format.Format_RGB888)
+        self.setPixmap(QPixmap.fromImage(image))
+        self.frames_rendered += 1
+
+    def render_stats(self):
+        return {
+            "received": self.frames_received,
+            "rendered": self.frames_rendered,
+            "coalesced": self.frames_received - self.frames_rendered
+        }
@@ -17,8 +17,6 @@ from PySide6.QtWidgets import (
     QVBoxLayout, QHBoxLayout, QGridLayout, QStackedWidget,
     QLabel, QLineEdit, QComboBox, QSlider, QPushButton, QDial
 )
-from control import Controller
-from recognize  import Recognizer
 from resources import rc_resources
 from translations import rc_translations
 
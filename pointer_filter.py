@@ -0,0 +1,182 @@
+import math
+
+
+class PointerFilter:
+    """
+    指针滤波器基类（直通，不做平滑）。
+
+    update() 接收映射后的屏幕坐标和该帧的采集时间（秒），返回平滑后的坐标；
+    predict() 按当前速度估计把位置外推 horizon 秒，用于补偿流水线延迟。
+    """
+    name = "none"
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.x = None
+        self.y = None
+        self.vx = 0.0
+        self.vy = 0.0
+        self.last_time = None
+
+    def parameters(self):
+        return {}
+
+    def time_step(self, t):
+        dt = t - self.last_time if self.last_time is not None else 0.0
+        self.last_time = t
+        return dt
+
+    def update(self, x, y, t):
+        dt = self.time_step(t)
+        if self.x is not None and dt > 0:
+            self.vx = (x - self.x) / dt
+            self.vy = (y - self.y) / dt
+        self.x, self.y = x, y
+        return x, y
+
+    def predict(self, horizon):
+        if self.x is None:
+            return 0, 0
+        return self.x + self.vx * horizon, self.y + self.vy * horizon
+
+
+def smoothing_factor(dt, cutoff):
+    tau = 1.0 / (2 * math.pi * cutoff)
+    return 1.0 / (1.0 + tau / dt)
+
+
+class OneEuroFilter(PointerFilter):
+    """
+    One Euro 滤波器：截止频率随速度自适应。
+    慢速时以 min_cutoff 强力去抖，快速时截止频率随 beta 提高以减小滞后。
+    """
+    name = "one_euro"
+
+    def __init__(self, min_cutoff=1.0, beta=0.007, d_cutoff=1.0):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        super().__init__()
+
+    def parameters(self):
+        return {"min_cutoff": self.min_cutoff, "beta": self.beta, "d_cutoff": self.d_cutoff}
+
+    def update(self, x, y, t):
+        dt = self.time_step(t)
+        if self.x is None or dt <= 0:
+            if self.x is None:
+                self.x, self.y = float(x), float(y)
+            return self.x, self.y
+
+        # 先对速度做低通，再用速度决定位置的截止频率
+        alpha_d = smoothing_factor(dt, self.d_cutoff)
+        self.vx += alpha_d * ((x - self.x) / dt - self.vx)
+        self.vy += alpha_d * ((y - self.y) / dt - self.vy)
+        speed = math.hypot(self.vx, self.vy)
+        alpha = smoothing_factor(dt, self.min_cutoff + self.beta * speed)
+        self.x += alpha * (x - self.x)
+        self.y += alpha * (y - self.y)
+        return self.x, self.y
+
+
+class KalmanFilter(PointerFilter):
+    """
+    匀速模型卡尔曼滤波器，x/y 两轴独立。
+    process_noise 为加速度噪声谱密度（px²/s³），measurement_noise 为测量方差（px²）。
+    """
+    name = "kalman"
+
+    def __init__(self, process_noise=50000.0, measurement_noise=16.0):
+        self.process_noise = process_noise
+        self.measurement_noise = measurement_noise
+        super().__init__()
+
+    def parameters(self):
+        return {"process_noise": self.process_noise, "measurement_noise": self.measurement_noise}
+
+    def reset(self):
+        super().reset()
+        # 协方差矩阵 [[p_pp, p_pv], [p_pv, p_vv]]，两轴相同
+        self.p_pp = self.p_pv = self.p_vv = 0.0
+
+    def update(self, x, y, t):
+        dt = self.time_step(t)
+        if self.x is None:
+            self.x, self.y = float(x), float(y)
+            self.p_pp = self.measurement_noise
+            self.p_pv = 0.0
+            self.p_vv = self.process_noise
+            return self.x, self.y
+        if dt <= 0:
+            return self.x, self.y
+
+        # 预测
+        q = self.process_noise
+        px = self.x + self.vx * dt
+        py = self.y + self.vy * dt
+        p_pp = self.p_pp + dt * (2 * self.p_pv + dt * self.p_vv) + q * dt ** 3 / 3
+        p_pv = self.p_pv + dt * self.p_vv + q * dt ** 2 / 2
+        p_vv = self.p_vv + q * dt
+
+        # 更新
+        s = p_pp + self.measurement_noise
+        k_p = p_pp / s
+        k_v = p_pv / s
+        rx = x - px
+        ry = y - py
+        self.x = px + k_p * rx
+        self.y = py + k_p * ry
+        self.vx += k_v * rx
+        self.vy += k_v * ry
+        self.p_pp = (1 - k_p) * p_pp
+        self.p_pv = (1 - k_p) * p_pv
+        self.p_vv = p_vv - k_v * p_pv
+        return self.x, self.y
+
+
+FILTERS = {
+    PointerFilter.name: PointerFilter,
+    OneEuroFilter.name: OneEuroFilter,
+    KalmanFilter.name: KalmanFilter
+}
+
+
+def create_pointer_filter(name, **parameters):
+    """按名称创建滤波器，未知名称回退为直通"""
+    return FILTERS.get(name, PointerFilter)(**parameters)
+
+
+class FilterMetrics:
+    """
+    滤波效果指标（指数滑动平均，单位为像素）。
+    jitter：输出轨迹二阶差分的幅度，越小越稳；
+    lag：原始输入与输出之间的距离，越小越跟手。
+    """
+
+    def __init__(self, decay=0.05):
+        self.decay = decay
+        self.reset()
+
+    def reset(self):
+        self.jitter = 0.0
+        self.lag = 0.0
+        self.samples = 0
+        self.previous = None
+        self.previous_velocity = None
+
+    def update(self, raw_x, raw_y, x, y):
+        decay = self.decay
+        self.lag += decay * (math.hypot(raw_x - x, raw_y - y) - self.lag)
+        if self.previous is not None:
+            velocity = (x - self.previous[0], y - self.previous[1])
+            if self.previous_velocity is not None:
+                jerk = math.hypot(velocity[0] - self.previous_velocity[0], velocity[1] - self.previous_velocity[1])
+                self.jitter += decay * (jerk - self.jitter)
+            self.previous_velocity = velocity
+        self.previous = (x, y)
+        self.samples += 1
+
+    def snapshot(self):
+        return {"jitter": self.jitter, "lag": self.lag, "samples": self.samples}
@@ -0,0 +1,67 @@
+import time
+
+ACTIVE = "active"
+IDLE = "idle"
+
+
+class PowerGovernor:
+    """
+    空闲功耗调节：连续 idle_timeout 秒没有检测到手后进入 IDLE 模式，
+    采集源只按 idle_fps 的探测频率解码并送出帧，推理随之降频；
+    探测帧中一旦检测到手立即回到 ACTIVE 模式，下一帧即恢复全速。
+
+    update() 只由回调线程调用；stats() 可在任意线程读取。
+    """
+
+    def __init__(self, idle_timeout=5.0, idle_fps=5):
+        self.idle_timeout = idle_timeout  # 秒，0 表示不降频
+        self.idle_fps = idle_fps
+        self.reset()
+
+    def reset(self, now=None):
+        now = time.perf_counter() if now is None else now
+        self.mode = ACTIVE
+        self.mode_since = now
+        self.last_hand_time = now
+        self.mode_time = {ACTIVE: 0.0, IDLE: 0.0}
+        self.transitions = 0
+
+    def frame_interval(self):
+        """当前模式下采集源两次送出帧之间的最短间隔（秒）"""
+        if self.mode == IDLE and self.idle_fps > 0:
+            return 1.0 / self.idle_fps
+        return 0.0
+
+    def update(self, hand_present, now):
+        """根据本帧是否有手更新模式，模式变化时返回 True"""
+        if hand_present:
+            self.last_hand_time = now
+            if self.mode == IDLE:
+                self.switch(ACTIVE, now)
+                return True
+        elif (self.mode == ACTIVE and self.idle_timeout > 0
+              and now - self.last_hand_time >= self.idle_timeout):
+            self.switch(IDLE, now)
+            return True
+        return False
+
+    def switch(self, mode, now):
+        self.mode_time[self.mode] += now - self.mode_since
+        self.mode = mode
+        self.mode_since = now
+        self.transitions += 1
+
+    def stats(self, now=None):
+        """返回当前模式、各模式累计时间（秒）与切换次数"""
+        now = time.perf_counter() if now is None else now
+        mode_time = dict(self.mode_time)
+        mode_time[self.mode] += now - self.mode_since
+        total = sum(mode_time.values())
+        return {
+            "mode": self.mode,
+            "active_time": mode_time[ACTIVE],
+            "idle_time": mode_time[IDLE],
+            "idle_ratio": mode_time[IDLE] / total if total else 0.0,
+            "transitions": self.transitions,
+            "frame_interval": self.frame_interval()
+        }
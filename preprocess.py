@@ -0,0 +1,36 @@
+import cv2
+import numpy as np
+
+
+class FramePreprocessor:
+    """
+    把摄像头的 BGR 帧转换为送入模型的 RGB 帧，结果写入预分配缓冲区，逐帧不再分配内存。
+
+    mirror_landmarks 为 False 时先水平翻转画面（镜像效果）再转换颜色；
+    为 True 时跳过翻转，只做颜色转换，由调用方在推理后把关键点的 x 坐标镜像回来。
+    缓冲区只在帧尺寸变化时重新分配。
+    """
+
+    def __init__(self, mirror_landmarks=False):
+        self.mirror_landmarks = mirror_landmarks
+        self.flipped = None
+        self.rgb = None
+
+    def ensure_buffers(self, shape):
+        if self.rgb is None or self.rgb.shape != shape:
+            self.flipped = np.empty(shape, np.uint8)
+            self.rgb = np.empty(shape, np.uint8)
+
+    def flip(self, frame):
+        """水平翻转到预分配缓冲区；mirror_landmarks 模式下原样返回"""
+        self.ensure_buffers(frame.shape)
+        if self.mirror_landmarks:
+            return frame
+        return cv2.flip(frame, 1, dst=self.flipped)
+
+    def to_rgb(self, frame):
+        self.ensure_buffers(frame.shape)
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self.rgb)
+
+    def process(self, frame):
+        return self.to_rgb(self.flip(frame))
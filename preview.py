@@ -0,0 +1,185 @@
+import threading
+import cv2
+import numpy as np
+import mediapipe as mp
+
+PREVIEW_BUFFERS = 4  # 轮流写入：正在写入、待绘制与绘制中的帧互不覆盖（送出的是副本）
+TEXT_MARGIN = 10
+TEXT_LINE_HEIGHT = 20
+TEXT_FONT = cv2.FONT_HERSHEY_DUPLEX
+TEXT_SCALE = 0.7
+WHITE_COLOR = (255, 255, 255)
+
+
+class LandmarkPainter:
+    """
+    在预览画面上绘制手部关键点、连接线和状态文字。
+
+    MediaPipe 的默认样式只在创建时读取一次，按颜色与线宽分组成索引数组：
+    连接线每组一次 cv2.polylines，关键点直接用像素坐标画圆，不再逐帧构造 protobuf。
+    状态文字按内容缓存成掩码，逐帧只做一次掩码赋值。
+    """
+
+    def __init__(self):
+        connection_style = mp.solutions.drawing_styles.get_default_hand_connections_style()
+        landmark_style = mp.solutions.drawing_styles.get_default_hand_landmarks_style()
+
+        groups = {}
+        for connection in sorted(mp.solutions.hands.HAND_CONNECTIONS):
+            spec = connection_style[connection]
+            groups.setdefault((spec.color, spec.thickness), []).append(connection)
+        # [(颜色, 线宽, (n, 2) 连接端点索引)]
+        self.connection_groups = [
+            (color, thickness, np.array(connections, np.intp))
+            for (color, thickness), connections in groups.items()
+        ]
+
+        # 每个关键点的 (外圈半径, 半径, 颜色, 线宽)，与 drawing_utils.draw_landmarks 一致
+        self.landmark_specs = []
+        for index in range(len(landmark_style)):
+            spec = landmark_style[index]
+            border_radius = max(spec.circle_radius + 1, int(spec.circle_radius * 1.2))
+            self.landmark_specs.append((border_radius, spec.circle_radius, spec.color, spec.thickness))
+
+        self.pixels = np.zeros((len(self.landmark_specs), 2), np.int32)
+        self.text_stamps = {}  # 文字 -> 掩码
+
+    def text_stamp(self, text):
+        stamp = self.text_stamps.get(text)
+        if stamp is None:
+            lines = text.split("\n")
+            width = max(cv2.getTextSize(line, TEXT_FONT, TEXT_SCALE, 1)[0][0] for line in lines)
+            canvas = np.zeros((TEXT_LINE_HEIGHT * (len(lines) + 1), width), np.uint8)
+            for i, line in enumerate(lines):
+                cv2.putText(canvas, line, (0, TEXT_LINE_HEIGHT * (i + 1)), TEXT_FONT,
+                            TEXT_SCALE, 255, 1, cv2.LINE_AA)
+            stamp = canvas > 127
+            self.text_stamps[text] = stamp
+        return stamp
+
+    def draw_text(self, image, text, x, y):
+        """把缓存的文字掩码以白色印到 (x, y)，超出画面的部分裁掉"""
+        stamp = self.text_stamp(text)
+        height, width = image.shape[:2]
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + stamp.shape[1], width), min(y + stamp.shape[0], height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        image[y0:y1, x0:x1][stamp[y0 - y:y1 - y, x0 - x:x1 - x]] = WHITE_COLOR
+
+    def draw(self, image, landmarks, hand_data=None):
+        """landmarks 为显示方向的 (21, 3) 正则化坐标，hand_data 为 None 时不绘制状态文字"""
+        height, width = image.shape[:2]
+        pixels = self.pixels
+        np.multiply(landmarks[:, :2], (width, height), out=pixels, casting="unsafe")
+
+        for color, thickness, connections in self.connection_groups:
+            cv2.polylines(image, list(pixels[connections]), False, color, thickness)
+        for (x, y), (border_radius, radius, color, thickness) in zip(pixels.tolist(), self.landmark_specs):
+            cv2.circle(image, (x, y), border_radius, WHITE_COLOR, thickness)
+            cv2.circle(image, (x, y), radius, color, thickness)
+
+        if hand_data is None:
+            return image
+        text = f"Status: {hand_data.status}\npress: {'Yes' if hand_data.is_pressing else 'No'}"
+        x, y = pixels.min(axis=0).tolist()
+        self.draw_text(image, text, x, y - TEXT_MARGIN)
+        return image
+
+
+class PreviewStage:
+    """
+    实时预览：在独立线程中绘制关键点并送出画面，识别线程只负责复制一帧。
+
+    submit() 把最新的 RGB 帧复制（未翻转的画面顺带镜像）进轮换缓冲区后立即返回；
+    预览线程取最新的一帧和 snapshot() 返回的 (各只手的关键点, hand_data)，原地绘制后复制一份交给 emit。
+    界面线程可能在之后任意时刻才读取收到的画面，而轮换缓冲区几帧后就会被识别线程覆盖，
+    因此送出的画面归界面所有，不能是缓冲区的视图。
+    绘制跟不上时未绘制的旧帧直接被新帧取代，不会拖慢识别。
+    """
+
+    def __init__(self, snapshot, emit):
+        self.snapshot = snapshot
+        self.emit = emit
+        self.painter = None  # 首次绘制时创建
+        self.condition = threading.Condition()
+        self.thread = None
+        self.running = False
+
+        self.buffers = None  # (PREVIEW_BUFFERS, h, w, 3)
+        self.write_slot = -1
+        self.pending_slot = -1
+        self.drawing_slot = -1
+
+        # 统计
+        self.submitted = 0
+        self.rendered = 0
+
+    def start(self):
+        if self.thread is not None:
+            return
+        self.running = True
+        self.thread = threading.Thread(target=self.preview_thread, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        with self.condition:
+            self.condition.notify_all()
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join(timeout=1.0)
+        self.thread = None
+
+    def submit(self, rgb_frame, mirror=False):
+        """复制一帧待预览的画面；mirror 为 True 时画面未翻转，复制时镜像"""
+        with self.condition:
+            if self.buffers is None or self.buffers.shape[1:] != rgb_frame.shape:
+                self.buffers = np.empty((PREVIEW_BUFFERS,) + rgb_frame.shape, np.uint8)
+                self.pending_slot = -1
+                self.drawing_slot = -1
+            slot = (self.write_slot + 1) % PREVIEW_BUFFERS
+            if slot == self.drawing_slot:
+                slot = (slot + 1) % PREVIEW_BUFFERS
+            self.write_slot = slot
+            buffer = self.buffers[slot]
+        if mirror:
+            cv2.flip(rgb_frame, 1, dst=buffer)
+        else:
+            np.copyto(buffer, rgb_frame)
+        with self.condition:
+            self.pending_slot = slot
+            self.submitted += 1
+            self.condition.notify_all()
+
+    def preview_thread(self):
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.pending_slot >= 0 or not self.running)
+                if not self.running:
+                    break
+                slot = self.drawing_slot = self.pending_slot
+                self.pending_slot = -1
+                image = self.buffers[slot]
+            frame = self.render(image).copy()  # 复制在预览线程中进行，不占用识别线程
+            with self.condition:
+                self.drawing_slot = -1
+            self.emit(frame)
+
+    def render(self, image):
+        """在 image 上原地绘制最新的关键点与状态"""
+        landmarks, hand_data = self.snapshot()
+        if landmarks is not None:
+            if self.painter is None:
+                self.painter = LandmarkPainter()
+            for index, hand in enumerate(landmarks):
+                # 状态文字只标在主手上
+                self.painter.draw(image, hand, hand_data if index == 0 else None)
+        self.rendered += 1
+        return image
+
+    def stats(self):
+        return {
+            "submitted": self.submitted,
+            "rendered": self.rendered,
+            "skipped": self.submitted - self.rendered
+        }
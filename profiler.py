@@ -0,0 +1,87 @@
+import bisect
+
+# 直方图桶上界（秒）：1µs 起，每倍频程 8 个桶，约覆盖到 4 秒
+BUCKET_BOUNDS = [1e-6 * 2 ** (i / 8) for i in range(176)]
+
+# 流水线各阶段
+STAGES = (
+    "cap_read",         # cap.read()
+    "flip",             # cv2.flip
+    "cvt_color",        # cv2.cvtColor
+    "roi_crop",         # ROI 裁剪
+    "mp_image",         # mp.Image 包装
+    "submit",           # detect_async 提交
+    "inference",        # 提交到回调到达
+    "fusion",           # 多摄像头关键点融合
+    "callback",         # 回调内的手势逻辑
+    "inject",           # Controller 注入鼠标事件的耗时
+    "glass_to_cursor",  # 帧采集到鼠标事件注入完成
+)
+
+
+class LatencyHistogram:
+    """
+    对数分桶的延迟直方图。
+
+    每个阶段只由一个线程写入，计数直接在列表上递增，不加锁；
+    重置时由 PipelineProfiler 整体替换为新实例。
+    """
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, fraction):
+        """返回包含该分位的桶上界（秒），不超过最大值"""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(BUCKET_BOUNDS[index], self.max) if index < len(BUCKET_BOUNDS) else self.max
+        return self.max
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(0.50),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "max": self.max
+        }
+
+
+class PipelineProfiler:
+    """
+    流水线各阶段的延迟统计。
+
+    调用方在 enabled 为 False 时跳过计时，关闭时的开销只有一次属性判断。
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.histograms = {stage: LatencyHistogram() for stage in STAGES}
+
+    def record(self, stage, seconds):
+        self.histograms[stage].record(seconds)
+
+    def summary(self):
+        """返回各阶段的 count/mean/p50/p95/p99/max（秒）"""
+        return {stage: histogram.summary() for stage, histogram in self.histograms.items()}
+
+    def reset(self):
+        # 一次引用替换，写入线程最多把正在进行的一次记录写进旧直方图
+        self.histograms = {stage: LatencyHistogram() for stage in STAGES}
@@ -1,11 +1,28 @@
-import cv2
-import queue
+import threading
+import time
+import numpy as np
 import mediapipe as mp
-from mediapipe.tasks import python as mp_tasks
 from mediapipe.tasks.python import vision as mp_vision
-from mediapipe.framework.formats import landmark_pb2
-from PySide6.QtCore import QObject, Signal, QFile, QIODevice
+from PySide6.QtCore import QObject, Signal
 from resources import rc_resources
+from hand_state import HandState, EMPTY_HAND_STATE
+from gesture import GestureStateMachine
+from features import HandFeatures, INDEX_FINGER_TIP
+from hands import HandTracker, TwoHandGestures, PREFERRED_HANDEDNESS
+from pointer_filter import create_pointer_filter, FilterMetrics
+from profiler import PipelineProfiler
+from recording import SessionRecorder, RECORD_LANDMARKS, RECORD_FRAMES, FLAG_MIRROR_LANDMARKS
+from capture import CaptureSource
+from preprocess import FramePreprocessor
+from roi import RoiTracker, map_result
+from power import PowerGovernor
+from preview import PreviewStage
+from model import ModelManager
+from fusion import LandmarkFusion, parse_camera_list
+from screen_map import ScreenMapper
+from relative_pointer import RelativePointer
+from calibration import decode_calibration
+import startup
 
 # CAMERA_WIDTH = 480
 # CAMERA_HEIGHT = 320
@@ -16,29 +33,38 @@ SCROLL_UNIT = int(1440 / 120)
 EXTENDED_DISTANCE_THRESHOLD = 0.034
 CLOSE_DISTANCE_THRESHOLD = 0.008
 COOLDOWN_FRAME = 5
-SCALE = 1.75
+
+# 各状态对应的 (is_pressing, clicking)
+STATE_FLAGS = {
+    "idle": (False, False),
+    "pre_click": (False, True),
+    "click": (True, True),
+    "drag": (True, False),
+    "scroll": (False, False),
+    "zoom": (False, False),
+    "pan": (False, False)
+}
+MAX_PENDING_CAPTURE_TIMES = 32
+LATENCY_DECAY = 0.1  # 延迟滑动平均系数
+FRAME_WAIT_TIMEOUT = 0.5  # 等待新帧的最长时间（秒），用于检查是否停止
+INFLIGHT_TIMEOUT = 1.0  # 推理超过该时间（秒）未回调则视为丢失
+WARMUP_TIMEOUT = 5.0  # 等待预热推理返回的最长时间（秒）
 
 class Recognizer(QObject):
     frame_signal = Signal(object)   # 用于传递视频帧
 
-    def __init__(self, model_path, settings, event_manager):
+    def __init__(self, model_path, config, event_manager):
         super().__init__()
-        model_file = QFile(model_path)
-        if not model_file.open(QIODevice.ReadOnly):  # 必须先 open!
-            raise IOError(f"无法打开 Qt 资源: {model_path}")
-        self.model_data = bytes(model_file.readAll().data())
-        self.settings = settings  # 保存 QSettings 实例
+        # model_path 为 None 时不加载模型，只能用于关键点回放
+        self.model = ModelManager(model_path) if model_path is not None else None
+        self.landmarker = None  # LIVE_STREAM 模式的 HandLandmarker，跨启动复用
+        self.landmarker_stale = True  # 模型或选项变化后需要重新创建
+        self.warmup_timestamp_ms = None
+        self.warmup_event = threading.Event()
+        self.inference_time = 0.0  # 提交到回调的平均耗时（秒）
+        self.config = config  # 带类型的配置（config.Config）
         self.event_manager = event_manager
 
-        self.hand_data = {
-            # "is_valid": False,
-            "status": "idle",
-            "target_x": 0,
-            "target_y": 0,
-            "is_pressing": False,
-            "clicking": False
-        }
-
         """
         hand_data = {
             "status": "idle", "click", "drag", scroll", "maximize", "minimize", "close"
@@ -57,327 +83,657 @@ class Recognizer(QObject):
         # 放入一个queue，形成上下文，让机器学习判断。
         """
 
-        self.latest_detection_result = None
-        self.last_valid_target = {
-            "target_x": 0,
-            "target_y": 0
+        self.latest_landmarks = None  # 最新一帧各只手（主手在前）的显示方向关键点（副本），供预览绘制
+        self.recorder = None  # 会话录制器
+        # 多手：帧间身份关联决定主手，每只手各自保存特征与手势状态
+        self.hand_tracker = HandTracker(self.create_gesture_fsm)
+        self.two_hand_gestures = TwoHandGestures(self.guard_pinch, self.guard_scroll_pose)
+        self.reset_state()
+        # 转移触发时的附加动作，返回本帧的 scroll_step
+        self.transition_actions = {
+            "scroll": self.scroll_action,
+            "scroll_coast": self.scroll_coast_action,
+            "scroll_end": self.scroll_coast_action
         }
-        self.previous_depth_difference = 0  # 上一帧的 depth_difference
-        self.click_cooldown_frames = 0  # 冷却时间计数器
-        self.scroll_smoother = 0  # 滚动像素平滑器
 
-        self.frame_queue = queue.Queue(maxsize=5)
+        self.profiler = PipelineProfiler()  # 各阶段延迟统计，默认关闭
+        self.pointer_filter_metrics = FilterMetrics()
+
+        # 新结果发布时唤醒鼠标控制线程，避免其空转
+        self.hand_data_condition = threading.Condition()
+        # 进行中的推理：timestamp_ms -> (采集时间, 提交时间, 裁剪区域)，其长度即进行中的推理数
+        self.capture_times = {}
+        self.abandoned_times = {}  # 超时视为丢失的推理，迟到的回调仍可取回采集时间
+        self.inflight_lock = threading.Lock()  # 识别线程提交/放弃与回调线程完成之间互斥
+        self.roi_tracker = RoiTracker()  # 围绕上一帧的手裁剪送入模型的画面
+        self.power_governor = PowerGovernor()  # 长时间无手时降低采集与推理频率
+
+        self.capture = None  # 运行中的采集源
+        self.fusion = LandmarkFusion()  # 辅助摄像头的推理与关键点融合
+        self.screen_mapper = ScreenMapper()  # 指尖坐标到屏幕坐标的预计算变换，由界面线程调用 watch()
+        self.relative_pointer = RelativePointer()  # 相对指针模式
+        self.reset_timestamps()
+        self.preprocessor = FramePreprocessor()  # 翻转与颜色转换写入预分配缓冲区
+        self.reset_inference_counters()
+        self.preview_stage = PreviewStage(self.preview_snapshot, self.publish_preview)  # 预览绘制不占用识别线程
         self.Recognizing = False
         self.LiveStreaming = False
 
-        # 初始化参数
+        # 初始化参数，之后配置变化时自动更新
         self.update_parameters()
+        config.changed.connect(self.update_parameters)
 
-    def update_parameters(self):
-        """从 QSettings 更新参数"""
-        self.screen_width = int(self.settings.value("screen_width", 1920))
-        self.screen_height = int(self.settings.value("screen_height", 1080))
-        self.camera_width = int(self.settings.value("camera_width", 480))
-        self.camera_height = int(self.settings.value("camera_height", 270))
-        self.camera_fps = int(self.settings.value("fps", 30))
-        self.click_threshold = 0.16 * int(self.settings.value("click_sensitivity", 50)) / 100
-        self.tolerance = 102 - int(self.settings.value("move_sensitivity", 90))
-
+    def reset_state(self):
+        """清空逐帧手势状态（开始回放前调用，保证结果可复现）"""
+        self.hand_data = EMPTY_HAND_STATE  # 只读快照，每帧整体替换
+        self.last_valid_target = {
+            "target_x": 0,
+            "target_y": 0
+        }
+        self.hand_tracker.reset()
+        self.two_hand_gestures.reset()
+        self.active_hand = None  # 当前驱动指针的 TrackedHand
+        # 指向主手的特征与状态机；检测到手之前使用独立的一份
+        self.features = HandFeatures()  # 预分配的逐帧特征
+        self.scroll_smoother = 0  # 滚动像素平滑器
+        self.gesture_fsm = self.create_gesture_fsm()
+        self.pipeline_latency = 0.0  # 采集到回调的平均延迟（秒）
+        if getattr(self, "pointer_filter", None) is not None:
+            self.pointer_filter.reset()
+        if getattr(self, "relative_pointer", None) is not None:
+            self.relative_pointer.reset_position()
+
+    def update_parameters(self, parameters=None):
+        """应用一份配置快照（ConfigSnapshot），默认使用当前配置"""
+        if parameters is None:
+            parameters = self.config.snapshot
+        self.camera_width = parameters.camera_width
+        self.camera_height = parameters.camera_height
+        self.camera_fps = parameters.fps
+        # 第一个为主摄像头，其余为参与融合的辅助摄像头；摄像头列表在下次开始识别时生效
+        self.camera_indices = parse_camera_list(parameters.camera_indices) or [0]
+        self.camera_yaws = parse_camera_list(parameters.camera_yaws, float)
+        self.fusion.window = parameters.fusion_window
+        capture = self.capture
+        if capture is not None and self.camera_width > 0 and self.camera_height > 0:
+            # 运行中直接切换采集模式，landmarker 保持不变
+            capture.reconfigure(self.camera_width, self.camera_height, self.camera_fps)
+            self.fusion.reconfigure(self.camera_width, self.camera_height, self.camera_fps)
+        self.click_threshold = 0.16 * parameters.click_sensitivity / 100
+        self.tolerance = 102 - parameters.move_sensitivity
+        # 屏幕映射：自动模式读取系统屏幕布局，手动模式使用配置的分辨率与 HiDPI 缩放
+        screen_mapper = self.screen_mapper
+        screen_mapper.set_coordinate_space(parameters.pointer_coordinates)
+        screen_mapper.set_manual(parameters.screen_width, parameters.screen_height, parameters.scale)
+        screen_mapper.set_auto(parameters.screen_geometry == "auto")
+        screen_mapper.set_tolerance(self.tolerance)
+        screen_mapper.set_calibration(decode_calibration(parameters.calibration))
+        if screen_mapper.watching:
+            screen_mapper.detect()  # 坐标系可能变化，重新读取布局
+        else:
+            screen_mapper.rebuild()
+        # 相对指针：加速曲线变化时重建查找表
+        self.relative_mode = parameters.pointer_mode == "relative"
+        aspect = self.camera_height / self.camera_width if self.camera_width > 0 and self.camera_height > 0 else 1.0
+        self.relative_pointer.configure(parameters.relative_gain, parameters.acceleration_curve,
+                                        parameters.acceleration, parameters.acceleration_threshold, aspect)
+
+        # 指针滤波器：名称或参数变化时才重新创建
+        filter_name = parameters.pointer_filter
+        if filter_name == "one_euro":
+            filter_parameters = {
+                "min_cutoff": parameters.one_euro_min_cutoff,
+                "beta": parameters.one_euro_beta
+            }
+        elif filter_name == "kalman":
+            filter_parameters = {
+                "process_noise": parameters.kalman_process_noise,
+                "measurement_noise": parameters.kalman_measurement_noise
+            }
+        else:
+            filter_parameters = {}
+        pointer_filter = getattr(self, "pointer_filter", None)
+        if pointer_filter is None or pointer_filter.name != filter_name or pointer_filter.parameters() != filter_parameters:
+            self.pointer_filter = create_pointer_filter(filter_name, **filter_parameters)
+            self.pointer_filter_metrics.reset()
+        self.pointer_prediction = bool(parameters.pointer_prediction)
+        self.profiler.enabled = bool(parameters.profiling)
+        self.max_in_flight = max(1, parameters.max_in_flight)
+        # 不翻转画面，改为镜像关键点，省去每帧一次整帧翻转
+        self.preprocessor.mirror_landmarks = bool(parameters.mirror_landmarks)
+        # 多手时裁剪会挡住画面中的其他手，只在单手时启用
+        roi_tracking = bool(parameters.roi_tracking) and parameters.num_hands == 1
+        if roi_tracking != getattr(self, "roi_tracking", False):
+            self.roi_tracker.reset()
+        self.roi_tracking = roi_tracking
+        # 模型变体与推理选项：变化后在下一帧前重新创建 landmarker
+        model_options = (parameters.model_variant, parameters.num_hands, parameters.min_hand_detection_confidence,
+                         parameters.min_hand_presence_confidence, parameters.min_tracking_confidence)
+        if model_options != getattr(self, "model_options", None):
+            self.model_options = model_options
+            (self.model_variant, self.num_hands, self.min_hand_detection_confidence,
+             self.min_hand_presence_confidence, self.min_tracking_confidence) = model_options
+            self.landmarker_stale = True
+        self.hand_tracker.set_max_hands(self.num_hands)
+        self.hand_tracker.preferred_handedness = PREFERRED_HANDEDNESS.get(parameters.dominant_hand)
+        self.two_hand_enabled = bool(parameters.two_hand_gestures)
+        self.power_governor.idle_timeout = parameters.idle_timeout
+        self.power_governor.idle_fps = parameters.idle_fps
+        self.apply_power_mode()
+
+    def latency_stats(self):
+        """返回流水线各阶段延迟的 count/mean/p50/p95/p99/max（秒）"""
+        return self.profiler.summary()
+
+    def reset_latency_stats(self):
+        self.profiler.reset()
+
+    def reset_timestamps(self):
+        """新建 landmarker 时调用；同一 landmarker 跨启动复用时时间戳必须继续递增"""
+        self.timestamp_origin = None
+        self.last_timestamp_ms = -1
+
+    def reset_inference_counters(self):
+        self.last_submit_time = 0.0
+        self.frames_submitted = 0  # 只由识别线程写入
+        self.frames_completed = 0  # 只由回调线程写入
+        self.frames_abandoned = 0  # 超时未回调、视为丢失的推理
+        self.frames_late = 0  # 视为丢失之后才到达的回调
+        self.frames_skipped = 0  # 因推理未完成而跳过的帧
+        with self.inflight_lock:
+            self.capture_times.clear()
+            self.abandoned_times.clear()
+
+    def monotonic_timestamp_ms(self, capture_time):
+        """由采集时间（单调时钟）生成严格递增的毫秒时间戳"""
+        if self.timestamp_origin is None:
+            self.timestamp_origin = capture_time
+        timestamp_ms = int((capture_time - self.timestamp_origin) * 1000)
+        if timestamp_ms <= self.last_timestamp_ms:
+            timestamp_ms = self.last_timestamp_ms + 1
+        self.last_timestamp_ms = timestamp_ms
+        return timestamp_ms
+
+    def inference_slot_available(self, now):
+        """进行中的推理数是否低于上限；超时未返回的推理视为丢失"""
+        if len(self.capture_times) < self.max_in_flight:
+            return True
+        if now - self.last_submit_time > INFLIGHT_TIMEOUT:
+            self.abandon_inflight()
+            return True
+        return False
+
+    def abandon_inflight(self):
+        """把进行中的推理全部记为丢失；之后迟到的回调不再占用进行中的名额"""
+        with self.inflight_lock:
+            if len(self.abandoned_times) > MAX_PENDING_CAPTURE_TIMES:
+                self.abandoned_times.clear()  # 永远不会回调的记录，防止无限增长
+            self.abandoned_times.update(self.capture_times)
+            self.frames_abandoned += len(self.capture_times)
+            self.capture_times.clear()
+
+    def complete_inflight(self, timestamp_ms):
+        """回调到达时取出该帧的 (采集时间, 提交时间, 裁剪区域)，找不到时返回 None"""
+        with self.inflight_lock:
+            entry = self.capture_times.pop(timestamp_ms, None)
+            if entry is None:
+                entry = self.abandoned_times.pop(timestamp_ms, None)
+                if entry is not None:
+                    self.frames_late += 1
+            return entry
+
+    def inference_stats(self):
+        """返回已提交、已完成、已跳过与超时丢失的帧数"""
+        return {
+            "submitted": self.frames_submitted,
+            "completed": self.frames_completed,
+            "skipped": self.frames_skipped,
+            "abandoned": self.frames_abandoned,
+            "late": self.frames_late,
+            "in_flight": len(self.capture_times)
+        }
 
-    def hand_recognition_callback(self, result: mp_vision.HandLandmarkerResult, output_image, timestamp_ms: int):
-        if result.hand_landmarks:
-            # 获取第一只手的关键点
-            hand_landmarks = result.hand_landmarks[0]
-            self.norm_index_finger_tip = hand_landmarks[mp.solutions.hands.HandLandmark.INDEX_FINGER_TIP]  # 正则化坐标
-
-            world_landmarks = result.hand_world_landmarks[0]
-            self.thumb_tip = world_landmarks[mp.solutions.hands.HandLandmark.THUMB_TIP]
-            self.index_finger_tip = world_landmarks[mp.solutions.hands.HandLandmark.INDEX_FINGER_TIP]
-            self.middle_finger_tip = world_landmarks[mp.solutions.hands.HandLandmark.MIDDLE_FINGER_TIP]
-            self.wrist = world_landmarks[mp.solutions.hands.HandLandmark.WRIST]
-
-            norm_x = min(2*(self.norm_index_finger_tip.x - 0.25), 1) if self.norm_index_finger_tip.x > 0.25 else 0
-            norm_y = min(2*(self.norm_index_finger_tip.y - 0.2), 1) if self.norm_index_finger_tip.y > 0.2 else 0
-
-
-            # 计算食指位置映射到屏幕坐标
-            target_x = int(norm_x * (self.screen_width * SCALE + self.tolerance)) - self.tolerance  # TODO: sensitivity? 乘他干嘛？是分数缩放
-            target_y = int(norm_y * (self.screen_height * SCALE - self.tolerance)) - self.tolerance
-
-            # 检测点击动作：计算 z 坐标变化量
-            depth_difference = self.index_finger_tip.z - self.wrist.z
-            if self.previous_depth_difference is None:
-                self.previous_depth_difference = depth_difference
-                return
-            delta_z = 100*(self.previous_depth_difference - depth_difference)  # 计算帧与帧之间的 z 变化
-            self.previous_depth_difference = depth_difference  # 更新上一帧的 depth_difference
-
-            # 指与手腕的空间距离（的平方）
-            self.index_distance = (self.index_finger_tip.x-self.wrist.x)**2 + (self.index_finger_tip.y-self.wrist.y)**2 + (self.index_finger_tip.z-self.wrist.z)**2
-
-            # 食指是否伸出
-            index_extended = self.index_distance > EXTENDED_DISTANCE_THRESHOLD and (self.wrist.z -self.index_finger_tip.z) > self.click_threshold
-
-            # 两指是否接近
-            thumb_index_close = abs(self.index_finger_tip.x - self.thumb_tip.x) < CLOSE_DISTANCE_THRESHOLD and abs(self.index_finger_tip.y - self.thumb_tip.y) < CLOSE_DISTANCE_THRESHOLD
-            index_middle_close = abs(self.index_finger_tip.x - self.middle_finger_tip.x) < 4*CLOSE_DISTANCE_THRESHOLD and abs(self.index_finger_tip.y - self.middle_finger_tip.y) < 6*CLOSE_DISTANCE_THRESHOLD  # TODO
-
-            # 有限状态机，并更新共享变量
-            if self.click_cooldown_frames:  # 冷却
-                self.click_cooldown_frames -= 1
-                # 否则正常更新 xy、z 和点击状态
-                self.last_valid_target["target_x"] = target_x
-                self.last_valid_target["target_y"] = target_y
-                self.hand_data.update({
-                    "is_valid": True,  # 标记手势有效
-                    "status": "idle",
-                    "target_x": target_x,
-                    "target_y": target_y,
-                    "is_pressing": False,
-                    "clicking": False
-                })
-            elif thumb_index_close and self.index_distance > 0.2 * EXTENDED_DISTANCE_THRESHOLD:  # 捏合（选中拖动）状态
-                # 更新共享变量
-                self.last_valid_target["target_x"] = target_x
-                self.last_valid_target["target_y"] = target_y
-                self.hand_data.update({
-                    "is_valid": True,
-                    "status": "drag",
-                    "target_x": target_x,
-                    "target_y": target_y,
-                    "is_pressing": True,
-                    "clicking": False
-                })
-            elif index_extended and index_middle_close:  # 滚动状态
-                scroll_delta = target_y - self.last_valid_target["target_y"]
-                scroll_step = int(scroll_delta/SCROLL_UNIT)
-
-                if self.scroll_smoother * scroll_delta <= 0:
-                    self.scroll_smoother = 0
-                else:
-                    self.scroll_smoother = scroll_delta
-
-                self.last_valid_target["target_x"] = target_x
-                self.last_valid_target["target_y"] = target_y
-                self.hand_data.update({
-                    "is_valid": True,
-                    "status": "scroll",
-                    "target_x": target_x,
-                    "target_y": target_y,
-                    "scroll_step": scroll_step,
-                    "is_pressing": False,
-                    "clicking": False  # 滚动状态下点击为 False
-                })
-            elif self.hand_data["status"] == "scroll":  # 滚动状态
-                self.scroll_smoother = int(self.scroll_smoother*0.98)
-                scroll_step = int(self.scroll_smoother/SCROLL_UNIT)
-
-                if scroll_step:
-                    self.last_valid_target["target_x"] = target_x
-                    self.last_valid_target["target_y"] = target_y
-                    self.hand_data.update({
-                        "is_valid": True,
-                        "status": "scroll",
-                        "target_x": target_x,
-                        "target_y": target_y,
-                        "scroll_step": scroll_step,
-                        "is_pressing": False,
-                        "clicking": False  # 滚动状态下点击为 False
-                    })
-                else:
-                    self.last_valid_target["target_x"] = target_x
-                    self.last_valid_target["target_y"] = target_y
-                    self.hand_data.update({
-                        "is_valid": True,
-                        "status": "idle",
-                        "target_x": target_x,
-                        "target_y": target_y,
-                        "scroll_step": 0,
-                        "is_pressing": False,
-                        "clicking": False  # 滚动状态下点击为 False
-                    })
-            elif self.hand_data["status"] == "pre_click":
-                if index_extended:  # 单击状态
-                    self.last_valid_target["target_x"] = target_x
-                    self.last_valid_target["target_y"] = target_y
-                    # 冻结 xy 更新，则保持上一次的有效目标位置
-                    self.hand_data.update({
-                        "is_valid": True,  # 标记手势有效
-                        "status": "click",
-                        "target_x": target_x,
-                        "target_y": target_y,
-                        "is_pressing": True,
-                        "clicking": True
-                    })
-                    self.click_cooldown_frames = COOLDOWN_FRAME  # 设置冷却时间
-                elif delta_z > DELTA_Z_THRESHOLD:
-                    self.last_valid_target["target_x"] = target_x
-                    self.last_valid_target["target_y"] = target_y
-                    self.hand_data.update({
-                        "is_valid": True,  # 标记手势有效
-                        "status": "pre_click",
-                        "target_x": target_x,
-                        "target_y": target_y,
-                        "is_pressing": False,
-                        "clicking": True
-                    })
-                else:
-                    # 否则正常更新 xy、z 和点击状态
-                    self.last_valid_target["target_x"] = target_x
-                    self.last_valid_target["target_y"] = target_y
-                    self.hand_data.update({
-                        "is_valid": True,  # 标记手势有效
-                        "status": "idle",
-                        "target_x": target_x,
-                        "target_y": target_y,
-                        "is_pressing": False,
-                        "clicking": False
-                    })
-            elif delta_z > DELTA_Z_THRESHOLD:  # z方向移动很快，意为正在点击，但未超过阈值
-                # 如果冻结 xy 更新，则保持上一次的有效目标位置
-                self.last_valid_target["target_x"] = target_x
-                self.last_valid_target["target_y"] = target_y
-                self.hand_data.update({
-                    "is_valid": True,  # 标记手势有效
-                    "status": "pre_click",
-                    "target_x": target_x,
-                    "target_y": target_y,
-                    "is_pressing": False,
-                    "clicking": True
-                })
-            else:  # 空闲状态
-                # 否则正常更新 xy、z 和点击状态
-                self.last_valid_target["target_x"] = target_x
-                self.last_valid_target["target_y"] = target_y
-                self.hand_data.update({
-                    "is_valid": True,  # 标记手势有效
-                    "status": "idle",
-                    "target_x": target_x,
-                    "target_y": target_y,
-                    "is_pressing": False,
-                    "clicking": False
-                })
-
-            # 更新最新检测结果
-            self.latest_detection_result = result
+    def model_stats(self):
+        """返回模型变体、加载方式、加载与预热耗时、加载前后的常驻内存，以及当前推理选项与平均推理耗时"""
+        stats = self.model.stats() if self.model is not None else {}
+        stats.update({
+            "num_hands": self.num_hands,
+            "min_hand_detection_confidence": self.min_hand_detection_confidence,
+            "min_hand_presence_confidence": self.min_hand_presence_confidence,
+            "min_tracking_confidence": self.min_tracking_confidence,
+            "inference_time": self.inference_time
+        })
+        return stats
+
+    def capture_stats(self):
+        """返回采集源的已采集、已处理与丢弃帧数，以及当前采集模式与最近一次切换耗时"""
+        return self.capture.stats() if self.capture is not None else {}
+
+    def apply_power_mode(self):
+        """把功耗模式对应的帧间隔下发给采集源"""
+        capture = self.capture
+        if capture is not None:
+            capture.frame_interval = self.power_governor.frame_interval()
+        self.fusion.set_frame_interval(self.power_governor.frame_interval())
+
+    def fusion_stats(self):
+        """返回融合的帧数，以及各辅助摄像头的推理与采集统计"""
+        return self.fusion.stats()
+
+    def power_stats(self):
+        """返回当前功耗模式、各模式累计时间与切换次数"""
+        return self.power_governor.stats()
+
+    def startup_stats(self):
+        """返回启动各阶段（tray_visible、warmup_done、first_frame）距启动的秒数"""
+        return startup.startup_stats()
+
+    def roi_stats(self):
+        """返回 ROI 裁剪帧数、整帧帧数、丢失次数与当前裁剪区域"""
+        return self.roi_tracker.stats()
+
+    def hand_stats(self):
+        """返回跟踪中的手数、主手编号与切换次数，以及当前的双手手势"""
+        stats = self.hand_tracker.stats()
+        stats["two_hand_gesture"] = self.two_hand_gestures.mode
+        return stats
+
+    def screen_stats(self):
+        """返回屏幕映射的模式、坐标系、各屏幕矩形与当前变换"""
+        return self.screen_mapper.stats()
+
+    def relative_pointer_stats(self):
+        """返回相对指针模式是否启用、加速曲线、当前位置与离合帧数"""
+        stats = self.relative_pointer.stats()
+        stats["enabled"] = self.relative_mode
+        return stats
+
+    def pointer_filter_stats(self):
+        """返回当前滤波器及其参数、抖动/滞后指标和实测流水线延迟"""
+        return {
+            "filter": self.pointer_filter.name,
+            "parameters": self.pointer_filter.parameters(),
+            "prediction": self.pointer_prediction,
+            "pipeline_latency": self.pipeline_latency,
+            **self.pointer_filter_metrics.snapshot()
+        }
 
+    def create_gesture_fsm(self):
+        """声明手势状态机：转移按声明顺序决定优先级"""
+        fsm = GestureStateMachine("idle")
+        fsm.add_guard("pinch", self.guard_pinch)
+        fsm.add_guard("index_middle_close", self.guard_index_middle_close)
+        fsm.add_guard("scroll_coasting", self.guard_scroll_coasting)
+        fsm.add_guard("index_extended", self.guard_index_extended)
+        fsm.add_guard("fast_push", self.guard_fast_push)
+
+        fsm.add_transition("drag", "drag", "pinch")  # 捏合（选中拖动）
+        fsm.add_transition("scroll", "scroll", ("index_extended", "index_middle_close"))  # 食指中指并拢伸出
+        fsm.add_transition("scroll_coast", "scroll", "scroll_coasting", sources="scroll")  # 惯性滚动
+        fsm.add_transition("scroll_end", "idle", sources="scroll")
+        fsm.add_transition("click", "click", "index_extended", sources="pre_click", cooldown=COOLDOWN_FRAME)  # 单击
+        fsm.add_transition("pre_click", "pre_click", "fast_push")  # z方向移动很快，意为正在点击，但未超过阈值
+        return fsm
+
+    def gesture_stats(self):
+        """返回状态机的各状态停留时间、各转移次数与每帧开销"""
+        return self.gesture_fsm.stats()
+
+    def guard_pinch(self, features):
+        # 两指是否接近，且食指未收起
+        return (features.thumb_index_dx < CLOSE_DISTANCE_THRESHOLD
+                and features.thumb_index_dy < CLOSE_DISTANCE_THRESHOLD
+                and features.index_distance > 0.2 * EXTENDED_DISTANCE_THRESHOLD)
+
+    def guard_index_extended(self, features):
+        # 食指是否伸出
+        return features.index_distance > EXTENDED_DISTANCE_THRESHOLD and features.index_depth > self.click_threshold
+
+    def guard_index_middle_close(self, features):
+        return features.index_middle_dx < 4*CLOSE_DISTANCE_THRESHOLD and features.index_middle_dy < 6*CLOSE_DISTANCE_THRESHOLD  # TODO
+
+    def guard_scroll_pose(self, features):
+        # 食指中指并拢伸出（双手滚动时每只手的姿势）
+        return self.guard_index_extended(features) and self.guard_index_middle_close(features)
+
+    def guard_scroll_coasting(self, features):
+        return int(int(self.scroll_smoother*0.98)/SCROLL_UNIT) != 0
+
+    def guard_clutch(self, features):
+        # 相对模式的离合：食指收起（非捏合）或正在点击时指针不动
+        if self.gesture_fsm.state in ("pre_click", "click"):
+            return True
+        return features.index_distance < EXTENDED_DISTANCE_THRESHOLD and not self.guard_pinch(features)
+
+    def guard_fast_push(self, features):
+        return features.delta_z > DELTA_Z_THRESHOLD
+
+    def scroll_action(self, features):
+        scroll_delta = features.target_y - self.last_valid_target["target_y"]
+        if self.scroll_smoother * scroll_delta <= 0:
+            self.scroll_smoother = 0
         else:
-            # 如果未检测到手，标记手势无效
-            self.hand_data.update({
-                "is_valid": False,  # 标记手势无效
-                "status": "idle",
-                "target_x": self.last_valid_target["target_x"],
-                "target_y": self.last_valid_target["target_y"],
-                "is_pressing": False,
-                "click": False
-            })
-            self.latest_detection_result = None
-
-    def draw_landmarks_on_image(self, rgb_image, detection_result):
-        hand_landmarks_list = detection_result.hand_landmarks
-        handedness_list = detection_result.handedness
-        annotated_image = rgb_image.copy()  # 使用副本以避免修改原始帧
-
-        for idx in range(len(hand_landmarks_list)):
-            hand_landmarks = hand_landmarks_list[idx]
-            handedness = handedness_list[idx]
-
-            # 将手部关键点转换为 NormalizedLandmarkList 格式
-            hand_landmarks_proto = landmark_pb2.NormalizedLandmarkList()
-            hand_landmarks_proto.landmark.extend([
-                landmark_pb2.NormalizedLandmark(x=landmark.x, y=landmark.y, z=landmark.z) for landmark in hand_landmarks
-            ])
-
-            # 绘制手部关键点和连接线
-            mp.solutions.drawing_utils.draw_landmarks(
-                annotated_image,
-                hand_landmarks_proto,
-                mp.solutions.hands.HAND_CONNECTIONS,
-                mp.solutions.drawing_styles.get_default_hand_landmarks_style(),
-                mp.solutions.drawing_styles.get_default_hand_connections_style())
-
-            # 显示 Z 值和深度差值
-            height, width, _ = annotated_image.shape
-            x_coordinates = [landmark.x for landmark in hand_landmarks]
-            y_coordinates = [landmark.y for landmark in hand_landmarks]
-            text_x = int(min(x_coordinates) * width)
-            text_y = int(min(y_coordinates) * height) - 10  # MARGIN
-
-            info_text = (
-                # f"Thumb: {self.thumb_x:.3f} {self.thumb_y:.3f}\n"
-                # f"Index: {self.index_x:.3f} {self.index_y:.3f} {self.index_z:.3f}\n"
-                # f"Wrist: {self.wrist_x:.3f} {self.wrist_y:.3f} {self.wrist_z:.3f}\n"
-                # f"det_th_in: {self.thumb_x-self.index_x:.3f}  {self.thumb_y-self.index_y:.3f}\n"
-                # f"det_in_wr: {self.index_x-self.wrist_x:.3f}  {self.index_y-self.wrist_y:.3f} {self.index_z-self.wrist_z:.3f}\n"
-                # f"index distance: {self.index_distance:.3f}\n"
-                # f"det_z: {self.delta_z>0}\n"
-                f"Status: {self.hand_data['status']}\n"
-                f"press: {'Yes' if self.hand_data['is_pressing'] else 'No'}"
+            self.scroll_smoother = scroll_delta
+        return int(scroll_delta/SCROLL_UNIT)
+
+    def scroll_coast_action(self, features):
+        self.scroll_smoother = int(self.scroll_smoother*0.98)
+        return int(self.scroll_smoother/SCROLL_UNIT)
+
+    def publish_hand_data(self, timestamp, is_valid, status, target_x, target_y,
+                          is_pressing=False, clicking=False, scroll_step=0, hscroll_step=0, zoom_step=0):
+        """构建新的 HandState 快照，以一次引用替换发布，并唤醒等待中的线程"""
+        with self.hand_data_condition:
+            self.hand_data = HandState(
+                self.hand_data.seq + 1, timestamp, is_valid, status,
+                target_x, target_y, is_pressing, clicking, scroll_step, hscroll_step, zoom_step
             )
-            lines = info_text.split("\n")
-            for i, line in enumerate(lines):
-                cv2.putText(annotated_image, line,
-                            (text_x, text_y + 20 * (i + 1)), cv2.FONT_HERSHEY_DUPLEX,
-                            0.7, (255, 255, 255), 1, cv2.LINE_AA)
+            self.hand_data_condition.notify_all()
+
+    def wait_for_hand_data(self, last_seq, timeout=None):
+        """阻塞直到有比 last_seq 更新的快照（或超时），返回当前快照"""
+        with self.hand_data_condition:
+            self.hand_data_condition.wait_for(lambda: self.hand_data.seq != last_seq, timeout)
+            return self.hand_data
 
-        return annotated_image
+    def wake_waiters(self):
+        """唤醒所有等待线程（例如停止服务时）"""
+        with self.hand_data_condition:
+            self.hand_data_condition.notify_all()
+
+    def hand_recognition_callback(self, result: mp_vision.HandLandmarkerResult, output_image, timestamp_ms: int):
+        arrival_time = time.perf_counter()
+        if timestamp_ms == self.warmup_timestamp_ms:
+            self.warmup_event.set()  # 预热帧的结果直接丢弃
+            return
+        self.frames_completed += 1
+        if self.frames_completed == 1:
+            startup.mark("first_frame")
+        capture_time, submit_time, region = self.complete_inflight(timestamp_ms) or (arrival_time, arrival_time, None)
+        self.inference_time += LATENCY_DECAY * (arrival_time - submit_time - self.inference_time)
+        if region is not None:
+            map_result(result, region)  # 裁剪坐标换算回整帧，后续逻辑与整帧推理一致
+        profiler = self.profiler
+        if self.fusion.workers:
+            # 融合各辅助摄像头同一时刻的世界坐标，之后的手势逻辑只看到一份结果
+            fusion_start = time.perf_counter()
+            self.fusion.fuse(result, capture_time)
+            if profiler.enabled:
+                profiler.record("fusion", time.perf_counter() - fusion_start)
+        if self.power_governor.update(bool(result.hand_landmarks), arrival_time):
+            self.apply_power_mode()
+        if self.roi_tracking:
+            if result.hand_landmarks:
+                self.roi_tracker.update(result.hand_landmarks[0], capture_time)
+            else:
+                self.roi_tracker.lose()
+        recorder = self.recorder  # 界面线程可能同时停止录制，只读取一次
+        if recorder is not None and recorder.kind == RECORD_LANDMARKS:
+            recorder.write_result(capture_time, timestamp_ms, result)
+        self.handle_result(result, capture_time, arrival_time, self.preprocessor.mirror_landmarks)
+
+        if profiler.enabled:
+            profiler.record("inference", arrival_time - submit_time)
+            profiler.record("callback", time.perf_counter() - arrival_time)
+
+    def handle_result(self, result, capture_time, arrival_time, mirror=False):
+        """
+        处理一帧 HandLandmarkerResult（实时回调与视频回放共用）。
+        mirror 为 True 表示送入模型的画面未翻转，关键点需要镜像。
+        """
+        # 关联各只手的身份并批量计算特征
+        self.hand_tracker.update(result, mirror)
+        self.handle_hands(capture_time, arrival_time)
+
+    def handle_hands(self, capture_time, arrival_time):
+        """按 hand_tracker 中本帧检测到的手运行手势逻辑：主手驱动指针，两只手时先尝试双手手势"""
+        primary = self.hand_tracker.dominant
+        if primary is None or not primary.present:
+            # 主手本帧丢失时不改用其他手，避免指针在两只手之间跳动
+            self.two_hand_gestures.reset()
+            self.process_no_hand(capture_time)
+            self.latest_landmarks = None
+            return
+        if primary is not self.active_hand:
+            # 原主手已删除，换用另一只手的特征与状态机，并重新开始滤波
+            self.active_hand = primary
+            self.features = primary.features
+            self.gesture_fsm = primary.gesture_fsm
+            self.pointer_filter.reset()
+            self.relative_pointer.reset()
+            self.scroll_smoother = 0
+
+        secondary = self.hand_tracker.secondary() if self.two_hand_enabled else None
+        if secondary is None or not self.process_two_hands(primary.features, secondary.features, capture_time):
+            self.process_hand(capture_time, arrival_time)
+        # 更新最新检测结果
+        if secondary is None:
+            self.latest_landmarks = (primary.features.norm.copy(),)
+        else:
+            self.latest_landmarks = (primary.features.norm.copy(), secondary.features.norm.copy())
+
+    def process_two_hands(self, primary, secondary, capture_time):
+        """两只手构成双手手势时发布结果并返回 True；指针停在原处，主手的单手手势复位"""
+        gesture = self.two_hand_gestures.step(primary, secondary)
+        if gesture is None:
+            return False
+        status, hscroll_step, scroll_step, zoom_step = gesture
+        self.gesture_fsm.reset()
+        self.pointer_filter.reset()
+        self.relative_pointer.reset()
+        self.publish_hand_data(capture_time, True, status,
+                               self.last_valid_target["target_x"], self.last_valid_target["target_y"],
+                               scroll_step=scroll_step, hscroll_step=hscroll_step, zoom_step=zoom_step)
+        return True
+
+    def process_hand(self, capture_time, arrival_time):
+        """根据 self.features 中已加载的关键点运行手势逻辑并发布结果"""
+        features = self.features
+        # 计算食指位置映射到屏幕坐标；相对模式按帧间位移移动，离合姿势下指针不动
+        if self.relative_mode:
+            target_x, target_y = self.relative_pointer.update(features.index_tip_x, features.index_tip_y,
+                                                              capture_time, self.guard_clutch(features))
+        else:
+            target_x, target_y = self.screen_mapper.map(features.index_tip_x, features.index_tip_y)
+
+        # 指针滤波，并按实测流水线延迟向前预测
+        self.pipeline_latency += LATENCY_DECAY * (arrival_time - capture_time - self.pipeline_latency)
+        filtered_x, filtered_y = self.pointer_filter.update(target_x, target_y, capture_time)
+        if self.pointer_prediction:
+            filtered_x, filtered_y = self.pointer_filter.predict(self.pipeline_latency)
+        self.pointer_filter_metrics.update(target_x, target_y, filtered_x, filtered_y)
+        target_x = int(round(filtered_x))
+        target_y = int(round(filtered_y))
+        features.target_x = target_x
+        features.target_y = target_y
+
+        # 有限状态机，并更新共享变量
+        transition = self.gesture_fsm.step(features, capture_time)
+        status = self.gesture_fsm.state
+        scroll_step = 0
+        if transition is not None:
+            action = self.transition_actions.get(transition.name)
+            if action is not None:
+                scroll_step = action(features)
+        is_pressing, clicking = STATE_FLAGS[status]
+
+        self.last_valid_target["target_x"] = target_x
+        self.last_valid_target["target_y"] = target_y
+        self.publish_hand_data(capture_time, True, status, target_x, target_y, is_pressing, clicking, scroll_step)
+
+    def process_no_hand(self, capture_time):
+        # 如果未检测到手，标记手势无效
+        self.gesture_fsm.reset()
+        self.pointer_filter.reset()
+        self.relative_pointer.reset()
+        self.publish_hand_data(capture_time, False, "idle", self.last_valid_target["target_x"], self.last_valid_target["target_y"])
+
+    def landmarker_options(self, running_mode, result_callback=None):
+        """构建 HandLandmarker 选项，LIVE_STREAM 模式下结果默认送回 hand_recognition_callback"""
+        return mp_vision.HandLandmarkerOptions(
+            base_options=self.model.base_options(self.model_variant),
+            running_mode=running_mode,
+            num_hands=self.num_hands,
+            min_hand_detection_confidence=self.min_hand_detection_confidence,
+            min_hand_presence_confidence=self.min_hand_presence_confidence,
+            min_tracking_confidence=self.min_tracking_confidence,
+            result_callback=(result_callback or self.hand_recognition_callback)
+            if running_mode == mp_vision.RunningMode.LIVE_STREAM else None
+        )
+
+    def create_camera_landmarker(self, result_callback):
+        """为辅助摄像头创建独立的 LIVE_STREAM landmarker，选项与主摄像头一致"""
+        return mp_vision.HandLandmarker.create_from_options(
+            self.landmarker_options(mp_vision.RunningMode.LIVE_STREAM, result_callback))
+
+    def ensure_landmarker(self):
+        """返回 LIVE_STREAM 模式的 landmarker，首次使用或模型选项变化后重新创建"""
+        if self.landmarker is not None and not self.landmarker_stale:
+            return self.landmarker
+        self.landmarker_stale = False
+        if self.landmarker is not None:
+            self.landmarker.close()  # 等待进行中的推理回调完成
+            self.landmarker = None
+        self.landmarker = mp_vision.HandLandmarker.create_from_options(
+            self.landmarker_options(mp_vision.RunningMode.LIVE_STREAM))
+        self.reset_timestamps()
+        return self.landmarker
+
+    def warm_up_model(self, timeout=WARMUP_TIMEOUT):
+        """创建 landmarker 并推理一帧空白画面，使第一帧真实画面不必承担初始化开销"""
+        landmarker = self.ensure_landmarker()
+        start = time.perf_counter()
+        self.warmup_event.clear()
+        self.warmup_timestamp_ms = self.monotonic_timestamp_ms(start)
+        blank = np.zeros((self.camera_height, self.camera_width, 3), np.uint8)
+        landmarker.detect_async(mp.Image(image_format=mp.ImageFormat.SRGB, data=blank), self.warmup_timestamp_ms)
+        self.warmup_event.wait(timeout)
+        self.model.warmup_time = time.perf_counter() - start
+
+    def fingertip_position(self):
+        """主手食指指尖的显示方向正则化坐标 (x, y)，未检测到手时返回 None（供标定使用）"""
+        landmarks = self.latest_landmarks
+        if landmarks is None:
+            return None
+        x, y = landmarks[0][INDEX_FINGER_TIP, :2].tolist()
+        return x, y
+
+    def preview_snapshot(self):
+        return self.latest_landmarks, self.hand_data
+
+    def publish_preview(self, annotated_image):
+        """由预览线程调用，送出绘制好的画面"""
+        # 发送视频帧信号
+        self.frame_signal.emit(annotated_image)
+
+    def start_recording(self, path, kind=RECORD_LANDMARKS):
+        """开始录制会话：kind 为 RECORD_LANDMARKS（仅关键点）或 RECORD_FRAMES（送入模型的 RGB 帧）"""
+        self.stop_recording()
+        flags = FLAG_MIRROR_LANDMARKS if self.preprocessor.mirror_landmarks else 0
+        self.recorder = SessionRecorder(path, kind, flags)
+
+    def stop_recording(self):
+        recorder, self.recorder = self.recorder, None
+        if recorder is not None:
+            recorder.close()
 
     def recognition_thread(self):
-        cap = None  # 初始化 cap 为 None
+        capture = None  # 初始化 capture 为 None
         try:
-            BaseOptions = mp_tasks.BaseOptions
-            HandLandmarker = mp_vision.HandLandmarker
-            HandLandmarkerOptions = mp_vision.HandLandmarkerOptions
-            VisionRunningMode = mp_vision.RunningMode
-            options = HandLandmarkerOptions(
-                base_options=BaseOptions(model_asset_buffer=self.model_data,),
-                running_mode=VisionRunningMode.LIVE_STREAM,
-                result_callback=self.hand_recognition_callback
-            )
-            cap = cv2.VideoCapture(0)
-            cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.camera_width)  # 分辨率
-            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.camera_height)
-            cap.set(cv2.CAP_PROP_FPS, self.camera_fps)
-            with HandLandmarker.create_from_options(options) as landmarker:
-                # 检查是否需要暂停
-                self.event_manager.pause_event.wait()
-                while self.Recognizing:  # 使用 self.running 控制线程循环
-                    ret, frame = cap.read()
-                    if not ret:
-                        print("无法读取摄像头画面")
-                        break
-                    #套娃。。。???
-                    # 水平翻转画面（镜像效果）
-                    frame = cv2.flip(frame, 1)
-                    # 将帧转换为 RGB 格式
-                    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    # 使用 mediapipe.Image 包装帧，并指定图像格式
-                    mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
-                    # 将帧提交给 HandLandmarker 进行处理
-                    landmarker.detect_async(mp_image, timestamp_ms=int(cap.get(cv2.CAP_PROP_POS_MSEC)))
-
-                    # # 发送手势数据信号
-                    # if self.latest_detection_result is not None:
-                    #     self.hand_data_signal.emit(self.hand_data)
-
-                    if self.LiveStreaming:
-                        # 如果有最新检测结果，绘制关键点
-                        if self.latest_detection_result is not None:
-                            annotated_image = self.draw_landmarks_on_image(rgb_frame, self.latest_detection_result)
-                        else:
-                            annotated_image = rgb_frame
-                        try:
-                            self.frame_queue.put(annotated_image, block=False)  # 非阻塞方式放入队列
-                            # print("?")
-                        except queue.Full:
-                            pass  # 如果队列已满，丢弃旧帧
-                        # 发送视频帧信号
-                        self.frame_signal.emit(annotated_image)
+            # 摄像头在独立线程中采集，这里总是处理最新的一帧
+            capture = CaptureSource(self.camera_indices[0], self.camera_width, self.camera_height,
+                                    self.camera_fps, self.profiler)
+            capture.start()
+            self.capture = capture
+            if len(self.camera_indices) > 1:
+                # 辅助摄像头各自在独立线程中采集与推理
+                self.fusion.start(self.camera_indices[1:], self.camera_yaws, self.create_camera_landmarker,
+                                  self.camera_width, self.camera_height, self.camera_fps,
+                                  self.preprocessor.mirror_landmarks)
+            self.power_governor.reset()
+            self.preview_stage.start()
+            landmarker = self.ensure_landmarker()  # 预热时已创建，跨启动复用
+            # 检查是否需要暂停
+            self.event_manager.pause_event.wait()
+            self.reset_inference_counters()
+            frame_seq = 0
+            while self.Recognizing:  # 使用 self.running 控制线程循环
+                if self.landmarker_stale:
+                    landmarker = self.ensure_landmarker()  # 运行中切换模型变体或推理选项
+                latest = capture.read_latest(frame_seq, FRAME_WAIT_TIMEOUT)
+                if latest is None:
+                    if not capture.running:
+                        break  # 采集线程已退出（无法读取摄像头画面）
+                    continue
+                frame_seq, frame, capture_time = latest
+
+                # 上一帧的推理尚未返回时跳过本帧，避免任务在 landmarker 内部堆积
+                if not self.inference_slot_available(capture_time):
+                    self.frames_skipped += 1
+                    continue
+
+                profiler = self.profiler
+                profiling = profiler.enabled
+                if profiling:
+                    stage_start = time.perf_counter()
+                #套娃。。。???
+                # 水平翻转画面（镜像效果），写入预分配缓冲区；mirror_landmarks 模式下跳过
+                preprocessor = self.preprocessor
+                frame = preprocessor.flip(frame)
+                if profiling:
+                    stage_end = time.perf_counter()
+                    profiler.record("flip", stage_end - stage_start)
+                    stage_start = stage_end
+                # 将帧转换为 RGB 格式
+                rgb_frame = preprocessor.to_rgb(frame)
+                if profiling:
+                    stage_end = time.perf_counter()
+                    profiler.record("cvt_color", stage_end - stage_start)
+                    stage_start = stage_end
+                # 只把上一帧手部周围的区域送入模型；丢失手部时使用整帧
+                region = None
+                model_frame = rgb_frame
+                if self.roi_tracking:
+                    height, width = rgb_frame.shape[:2]
+                    region = self.roi_tracker.next_region(width, height)
+                    if region is not None:
+                        model_frame = self.roi_tracker.crop(rgb_frame, region)
+                    if profiling:
+                        stage_end = time.perf_counter()
+                        profiler.record("roi_crop", stage_end - stage_start)
+                        stage_start = stage_end
+                # 使用 mediapipe.Image 包装帧，并指定图像格式
+                mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=model_frame)
+                # 将帧提交给 HandLandmarker 进行处理
+                timestamp_ms = self.monotonic_timestamp_ms(capture_time)
+                submit_time = time.perf_counter()
+                with self.inflight_lock:
+                    self.capture_times[timestamp_ms] = (capture_time, submit_time, region)
+                if profiling:
+                    profiler.record("mp_image", submit_time - stage_start)
+                self.last_submit_time = submit_time
+                self.frames_submitted += 1
+                landmarker.detect_async(mp_image, timestamp_ms=timestamp_ms)
+                if profiling:
+                    profiler.record("submit", time.perf_counter() - submit_time)
+                recorder = self.recorder
+                if recorder is not None and recorder.kind == RECORD_FRAMES:
+                    recorder.write_frame(capture_time, timestamp_ms, rgb_frame)
+
+                # # 发送手势数据信号
+                # if self.latest_detection_result is not None:
+                #     self.hand_data_signal.emit(self.hand_data)
+
+                if self.LiveStreaming:
+                    # 只复制一帧，关键点绘制在预览线程中进行
+                    self.preview_stage.submit(rgb_frame, preprocessor.mirror_landmarks)
         except Exception as e:
             import traceback
             print(f"手势识别线程发生错误: {e}")
             traceback.print_exc()  # 打印完整的堆栈信息
         finally:
-            if cap is not None:  # 确保 cap 已定义再调用 release()
-                cap.release()
+            if capture is not None:  # 确保 capture 已定义再停止
+                capture.stop()
+            self.fusion.stop()
+            self.preview_stage.stop()
             self.Recognizing= False  # 确保线程退出时将 running 设置为 False
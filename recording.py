@@ -0,0 +1,267 @@
+"""
+会话录制文件格式（小端）：
+
+    固定 64 字节文件头（HEADER_DTYPE），随后是等长记录（LANDMARK_DTYPE / frame_dtype()）。
+
+记录定长，因此文件可以直接用 np.memmap 打开按帧索引，回放不需要解析。
+
+命令行（需要先用 pyside6-rcc 生成 resources/rc_resources.py）：
+
+    python -m recording record session.acrec --duration 30           # 用摄像头录制关键点
+    python -m recording record session.acrec --frames                # 录制送入模型的帧（按 Ctrl+C 结束）
+    python -m recording replay session.acrec                         # 回放并打印各状态的帧数
+    python -m recording replay session.acrec --output states.json     # 同时写出每帧的 HandState
+
+配置取自 --settings 指定的 ini 文件（与应用的 QSettings 格式相同），未指定时使用默认配置。
+回放关键点不需要摄像头和模型，可在任何机器上复现同一段会话的手势结果。
+"""
+import argparse
+import collections
+import json
+import sys
+import threading
+import time
+import numpy as np
+import mediapipe as mp
+from mediapipe.tasks.python import vision as mp_vision
+from features import NUM_LANDMARKS
+
+MAGIC = b"ACREC\x00\x00\x01"
+RECORD_LANDMARKS = 1  # 只记录关键点
+RECORD_FRAMES = 2     # 记录送入模型的 RGB 帧
+MAX_HANDS = 2
+FLAG_MIRROR_LANDMARKS = 1  # 画面未翻转，关键点需镜像后再进入手势逻辑
+
+HEADER_DTYPE = np.dtype([
+    ("magic", "S8"),
+    ("kind", "<u4"),
+    ("height", "<u4"),
+    ("width", "<u4"),
+    ("channels", "<u4"),
+    ("flags", "<u4"),
+    ("reserved", "u1", (36,)),
+])
+
+LANDMARK_DTYPE = np.dtype([
+    ("timestamp", "<f8"),      # 采集时间（秒）
+    ("timestamp_ms", "<i8"),   # 提交给 MediaPipe 的时间戳
+    ("hands", "<i4"),          # 检测到的手数（最多 MAX_HANDS）
+    ("handedness", "i1", (MAX_HANDS,)),  # 0 左手，1 右手
+    ("padding", "u1", (2,)),
+    ("score", "<f4", (MAX_HANDS,)),
+    ("norm", "<f4", (MAX_HANDS, NUM_LANDMARKS, 3)),
+    ("world", "<f4", (MAX_HANDS, NUM_LANDMARKS, 3)),
+])
+
+
+def frame_dtype(shape):
+    return np.dtype([
+        ("timestamp", "<f8"),
+        ("timestamp_ms", "<i8"),
+        ("image", "u1", tuple(shape)),
+    ])
+
+
+class SessionRecorder:
+    """
+    把实时会话写入定长记录文件。
+
+    每种记录只用一块预分配的缓冲区，逐帧原地填充后直接写出，不产生额外拷贝。
+    RECORD_FRAMES 的帧尺寸在写入第一帧时确定。
+    写入在识别线程、关闭在界面线程，二者由 lock 互斥；关闭之后的写入直接忽略。
+    """
+
+    def __init__(self, path, kind=RECORD_LANDMARKS, flags=0):
+        self.path = path
+        self.kind = kind
+        self.flags = flags
+        self.file = open(path, "wb")
+        self.lock = threading.Lock()
+        self.record = None
+        self.count = 0
+        if kind == RECORD_LANDMARKS:
+            self.write_header((0, 0, 0))
+            self.record = np.zeros(1, LANDMARK_DTYPE)
+
+    def write_header(self, shape):
+        header = np.zeros(1, HEADER_DTYPE)
+        header["magic"] = MAGIC
+        header["kind"] = self.kind
+        header["flags"] = self.flags
+        header["height"], header["width"], header["channels"] = shape
+        self.file.write(header.data)
+
+    def write_result(self, timestamp, timestamp_ms, result):
+        with self.lock:
+            if not self.file.closed:
+                self.fill_result(timestamp, timestamp_ms, result)
+
+    def fill_result(self, timestamp, timestamp_ms, result):
+        record = self.record[0]
+        record["timestamp"] = timestamp
+        record["timestamp_ms"] = timestamp_ms
+        hands = min(len(result.hand_landmarks), MAX_HANDS)
+        record["hands"] = hands
+        for index in range(hands):
+            record["norm"][index] = [(landmark.x, landmark.y, landmark.z) for landmark in result.hand_landmarks[index]]
+            record["world"][index] = [(landmark.x, landmark.y, landmark.z) for landmark in result.hand_world_landmarks[index]]
+            if result.handedness:
+                category = result.handedness[index][0]
+                record["handedness"][index] = 1 if category.category_name == "Right" else 0
+                record["score"][index] = category.score
+        self.file.write(self.record.data)
+        self.count += 1
+
+    def write_frame(self, timestamp, timestamp_ms, image):
+        with self.lock:
+            if not self.file.closed:
+                self.fill_frame(timestamp, timestamp_ms, image)
+
+    def fill_frame(self, timestamp, timestamp_ms, image):
+        if self.record is None:
+            self.write_header(image.shape)
+            self.record = np.zeros(1, frame_dtype(image.shape))
+        record = self.record[0]
+        if image.shape != record["image"].shape:
+            return  # 录制过程中分辨率变化的帧不写入
+        record["timestamp"] = timestamp
+        record["timestamp_ms"] = timestamp_ms
+        np.copyto(record["image"], image)
+        self.file.write(self.record.data)
+        self.count += 1
+
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+
+def open_recording(path):
+    """以 memmap 打开录制文件，返回 (kind, flags, records)"""
+    header = np.fromfile(path, HEADER_DTYPE, count=1)
+    if len(header) != 1 or header["magic"][0] != MAGIC:
+        raise ValueError(f"不是有效的录制文件: {path}")
+    kind = int(header["kind"][0])
+    flags = int(header["flags"][0])
+    if kind == RECORD_LANDMARKS:
+        dtype = LANDMARK_DTYPE
+    elif kind == RECORD_FRAMES:
+        shape = (int(header["height"][0]), int(header["width"][0]), int(header["channels"][0]))
+        if not all(shape):
+            return kind, flags, np.zeros(0, frame_dtype((1, 1, 3)))  # 尚未写入任何帧
+        dtype = frame_dtype(shape)
+    else:
+        raise ValueError(f"未知的录制类型: {kind}")
+    records = np.memmap(path, dtype, mode="r", offset=HEADER_DTYPE.itemsize)
+    return kind, flags, records
+
+
+def replay_landmarks(recognizer, records, mirror=False):
+    """
+    把录制的关键点直接送入手势逻辑，不经过 MediaPipe。
+    时间戳全部取自录制文件，因此同一文件每次回放得到的 hand_data 序列完全相同。
+    """
+    recognizer.reset_state()
+    states = []
+    for record in records:
+        timestamp = float(record["timestamp"])
+        hands = int(record["hands"])
+        recognizer.hand_tracker.update_arrays(record["norm"][:hands], record["world"][:hands],
+                                              record["handedness"][:hands], mirror)
+        recognizer.handle_hands(timestamp, timestamp)
+        states.append(recognizer.hand_data)
+    return states
+
+
+def replay_frames(recognizer, records, mirror=False):
+    """以 VIDEO 模式把录制的帧送入 HandLandmarker，再进入手势逻辑"""
+    recognizer.reset_state()
+    states = []
+    options = recognizer.landmarker_options(mp_vision.RunningMode.VIDEO)
+    with mp_vision.HandLandmarker.create_from_options(options) as landmarker:
+        for record in records:
+            timestamp = float(record["timestamp"])
+            mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=np.ascontiguousarray(record["image"]))
+            result = landmarker.detect_for_video(mp_image, int(record["timestamp_ms"]))
+            recognizer.handle_result(result, timestamp, timestamp, mirror)
+            states.append(recognizer.hand_data)
+    return states
+
+
+def replay(recognizer, path):
+    """回放录制文件，返回每帧发布的 HandState 列表"""
+    kind, flags, records = open_recording(path)
+    mirror = bool(flags & FLAG_MIRROR_LANDMARKS)
+    if kind == RECORD_LANDMARKS:
+        return replay_landmarks(recognizer, records, mirror)
+    return replay_frames(recognizer, records, mirror)
+
+
+MODEL_PATH = ":/resources/model/hand_landmarker.task"
+
+
+def create_recognizer(settings_path=None, model_path=MODEL_PATH):
+    """创建独立于界面的 Recognizer，配置来自 ini 文件或默认值"""
+    from types import SimpleNamespace
+    from PySide6.QtCore import QSettings
+    from config import Config
+    from recognize import Recognizer
+    settings = QSettings(settings_path, QSettings.Format.IniFormat) if settings_path else None
+    event_manager = SimpleNamespace(pause_event=threading.Event())
+    event_manager.pause_event.set()
+    return Recognizer(model_path=model_path, config=Config(settings), event_manager=event_manager)
+
+
+def record_session(args):
+    recognizer = create_recognizer(args.settings)
+    recognizer.start_recording(args.path, RECORD_FRAMES if args.frames else RECORD_LANDMARKS)
+    recognizer.Recognizing = True
+    thread = threading.Thread(target=recognizer.recognition_thread, daemon=True)
+    thread.start()
+    print(f"录制到 {args.path}，按 Ctrl+C 结束")
+    deadline = time.perf_counter() + args.duration if args.duration > 0 else None
+    try:
+        while thread.is_alive() and (deadline is None or time.perf_counter() < deadline):
+            thread.join(0.2)
+    except KeyboardInterrupt:
+        pass
+    recognizer.Recognizing = False
+    thread.join(2.0)
+    recorder = recognizer.recorder
+    recognizer.stop_recording()
+    print(f"共录制 {recorder.count if recorder is not None else 0} 帧")
+    return 0
+
+
+def replay_session(args):
+    kind, flags, records = open_recording(args.path)
+    # 回放关键点不需要模型
+    recognizer = create_recognizer(args.settings, MODEL_PATH if kind == RECORD_FRAMES else None)
+    states = replay(recognizer, args.path)
+    counts = collections.Counter(state.status if state.is_valid else "no_hand" for state in states)
+    print(json.dumps({"frames": len(states), "status": dict(counts)}, indent=2))
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump([state._asdict() for state in states], file)
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="AirCursor session recording and replay")
+    commands = parser.add_subparsers(dest="command", required=True)
+    record_parser = commands.add_parser("record", help="用摄像头录制一段会话")
+    record_parser.add_argument("path")
+    record_parser.add_argument("--settings", help="配置 ini 文件（默认使用默认配置）")
+    record_parser.add_argument("--frames", action="store_true", help="录制送入模型的帧而不是关键点")
+    record_parser.add_argument("--duration", type=float, default=0, help="录制时长（秒），0 表示直到 Ctrl+C")
+    replay_parser = commands.add_parser("replay", help="回放录制文件")
+    replay_parser.add_argument("path")
+    replay_parser.add_argument("--settings", help="配置 ini 文件（默认使用默认配置）")
+    replay_parser.add_argument("--output", help="每帧 HandState 的 JSON 输出路径")
+    args = parser.parse_args(argv)
+    if args.command == "record":
+        return record_session(args)
+    return replay_session(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
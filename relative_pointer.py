@@ -0,0 +1,148 @@
+"""
+相对指针（触控板）模式。
+
+绝对模式把指尖位置映射到整个桌面，桌面越大，每个像素对应的手部移动越小，关键点噪声被放大成大幅跳动。
+相对模式改为按帧间指尖位移移动指针：
+
+    位移（像素） = 位移（画面宽度） × relative_gain × 加速增益(手速)
+
+relative_gain 是低速时手移动一个画面宽度对应的像素数，与桌面分辨率无关；不足一个像素的位移累积到下一帧，
+因此慢速微调的精度不随桌面像素数变化。加速增益由加速曲线预先算成按手速等分的查找表，每帧只需一次查表。
+
+RelativePointer 输出的是不受屏幕限制的虚拟位置（从 0 开始），只有相邻两帧的差有意义：
+Controller 在相对模式下把 HandState 中 target 的帧间差通过注入后端的 move_by 发出，
+指针从系统当前位置开始移动，用户用实体鼠标移动指针后也不会被拉回；贴边由系统处理。
+
+离合（clutch）：食指收起（且不在捏合）或处于点击过程中时，指针不动，只更新参考点，
+相当于把手指抬离触控板后重新放下；手离开画面同样如此。
+"""
+import math
+import numpy as np
+
+ACCELERATION_CURVES = ("none", "linear", "quadratic", "sigmoid")
+MAX_SPEED = 4.0  # 查找表覆盖的最大手速（画面宽度/秒），更快时使用最后一项
+TABLE_SIZE = 512
+ACCELERATION_RANGE = 1.0  # linear/quadratic 从开始加速到增益饱和的手速区间（画面宽度/秒）
+SIGMOID_WIDTH = 0.15  # sigmoid 曲线的过渡宽度（画面宽度/秒）
+MAX_FRAME_GAP = 0.25  # 相邻两帧间隔超过该值（秒）时不移动，只重新取参考点
+
+
+def parse_curve_points(text):
+    """解析自定义曲线 "速度:增益,速度:增益,..."，返回按速度排序的 (速度数组, 增益数组)，无法解析时返回 None"""
+    points = []
+    for item in str(text).split(","):
+        try:
+            speed, gain = (float(value) for value in item.split(":"))
+        except ValueError:
+            return None
+        points.append((speed, gain))
+    if not points:
+        return None
+    points.sort()
+    return np.array([speed for speed, _ in points]), np.array([gain for _, gain in points])
+
+
+def acceleration_gains(speeds, curve, acceleration, threshold):
+    """
+    计算各手速（画面宽度/秒）下的加速增益，低速时为 1。
+
+        none       恒为 1
+        linear     超过 threshold 后线性增加，ACCELERATION_RANGE 后达到 1 + acceleration
+        quadratic  同上，按平方增加，起步更平缓
+        sigmoid    以 threshold 为中心平滑过渡到 1 + acceleration
+        其他       自定义折线 "速度:增益,..."，区间外取端点值
+    """
+    # 超出查找表范围的阈值没有意义，限制到范围内
+    threshold = 0.0 if math.isnan(threshold) else min(max(threshold, 0.0), MAX_SPEED)
+    if curve == "none":
+        return np.ones_like(speeds)
+    if curve in ("linear", "quadratic"):
+        ramp = np.clip((speeds - threshold) / ACCELERATION_RANGE, 0.0, 1.0)
+        return 1.0 + acceleration * (ramp if curve == "linear" else ramp * ramp)
+    if curve == "sigmoid":
+        # 1 / (1 + exp(-z)) 写成 (1 + tanh(z / 2)) / 2，任意 z 都不会溢出
+        logistic = 0.5 * (1.0 + np.tanh((speeds - threshold) / (2 * SIGMOID_WIDTH)))
+        base = 0.5 * (1.0 + math.tanh(-threshold / (2 * SIGMOID_WIDTH)))  # 速度为 0 时的值，减去以保证低速增益为 1
+        return 1.0 + acceleration * (logistic - base) / (1.0 - base)
+    points = parse_curve_points(curve)
+    if points is None:
+        print(f"未知的加速曲线: {curve}，不加速")
+        return np.ones_like(speeds)
+    return np.interp(speeds, *points)
+
+
+class AccelerationTable:
+    """按手速等分的增益查找表，配置变化时整体重建"""
+
+    def __init__(self, curve="none", acceleration=0.0, threshold=0.0):
+        self.curve = curve
+        speeds = np.linspace(0.0, MAX_SPEED, TABLE_SIZE)
+        gains = np.maximum(acceleration_gains(speeds, curve, acceleration, threshold), 0.0)
+        self.gains = tuple(gains.tolist())  # Python 浮点数，逐帧查表不经过 NumPy
+        self.scale = (TABLE_SIZE - 1) / MAX_SPEED
+        self.key = (curve, acceleration, threshold)
+
+    def gain(self, speed):
+        index = int(speed * self.scale + 0.5)
+        return self.gains[index] if index < TABLE_SIZE else self.gains[-1]
+
+
+class RelativePointer:
+    """
+    把指尖的正则化坐标转换为累积位移构成的虚拟位置（整数像素）。
+    虚拟位置以浮点数保存，不足一个像素的位移保留在其中，取整后帧间差的累加与实际位移一致。
+    """
+
+    def __init__(self, gain=1200.0, table=None):
+        self.gain = gain
+        self.table = table if table is not None else AccelerationTable()
+        self.aspect = 1.0  # 画面高宽比，纵向位移换算为画面宽度
+        self.reset_position()
+
+        # 统计
+        self.frames = 0
+        self.clutched_frames = 0
+        self.max_gain = 1.0
+
+    def configure(self, gain, curve, acceleration, threshold, aspect):
+        self.gain = gain
+        self.aspect = aspect
+        if self.table.key != (curve, acceleration, threshold):
+            self.table = AccelerationTable(curve, acceleration, threshold)
+
+    def reset(self):
+        """丢弃参考点，下一帧只记录位置、不移动（手丢失、切换主手、双手手势时调用）"""
+        self.last = None
+
+    def reset_position(self):
+        self.reset()
+        self.x = 0.0
+        self.y = 0.0
+
+    def update(self, x, y, t, clutched=False):
+        """输入一帧指尖坐标与采集时间，返回 (target_x, target_y)"""
+        last = self.last
+        self.last = (x, y, t)
+        self.frames += 1
+        if clutched:
+            self.clutched_frames += 1
+        elif last is not None and 0 < t - last[2] <= MAX_FRAME_GAP:
+            dx = x - last[0]
+            dy = (y - last[1]) * self.aspect
+            gain = self.table.gain(math.hypot(dx, dy) / (t - last[2]))
+            if gain > self.max_gain:
+                self.max_gain = gain
+            scale = self.gain * gain
+            self.x += dx * scale
+            self.y += dy * scale
+        return math.floor(self.x), math.floor(self.y)
+
+    def stats(self):
+        return {
+            "curve": self.table.curve,
+            "gain": self.gain,
+            "position": (self.x, self.y),
+            "frames": self.frames,
+            "clutched_frames": self.clutched_frames,
+            "max_gain": self.max_gain
+        }
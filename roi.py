@@ -0,0 +1,142 @@
+import numpy as np
+
+ROI_MARGIN = 0.3  # 手部包围盒每侧外扩的比例（相对包围盒边长）
+ROI_VELOCITY_GAIN = 2.0  # 按手的移动速度额外外扩的帧数
+ROI_MIN_SIZE = 0.4  # 裁剪区域的最小边长（占帧短边的比例），保证手掌检测器有足够像素
+ROI_MAX_SIZE = 0.85  # 裁剪区域超过该比例（占帧对应边）时直接使用整帧
+ROI_RESIZE_RATIO = 1.3  # 期望边长与当前边长之比超出该范围时才重新裁剪
+
+
+class RoiTracker:
+    """
+    手部感兴趣区域跟踪：围绕上一帧的手部包围盒裁剪画面，再送入模型。
+
+    包围盒按 margin 外扩，并按手的移动速度沿运动方向平移、扩大。
+    为了不打乱 MediaPipe 内部的跨帧跟踪，裁剪区域带有滞回：
+    只有手将要离开当前区域或大小明显变化时才更换区域。
+    丢失手部后退回整帧。
+
+    update()/lose() 在回调线程调用，next_region()/crop() 在识别线程调用；
+    跟踪状态以元组整体替换，两边不需要加锁。
+    """
+
+    def __init__(self, margin=ROI_MARGIN, velocity_gain=ROI_VELOCITY_GAIN, min_size=ROI_MIN_SIZE):
+        self.margin = margin
+        self.velocity_gain = velocity_gain
+        self.min_size = min_size
+        self.buffer = None  # 裁剪结果的平铺缓冲区，按整帧大小预分配
+        self.reset()
+
+    def reset(self):
+        self.track = None  # (x0, y0, x1, y1, vx, vy, interval)，归一化整帧坐标
+        self.last_center = None
+        self.last_time = None
+        self.region = None  # 当前裁剪区域 (x, y, w, h, frame_w, frame_h)，像素
+        self.frames_cropped = 0
+        self.frames_full = 0
+        self.losses = 0
+
+    def update(self, hand_landmarks, timestamp):
+        """用整帧坐标下的关键点更新包围盒与速度"""
+        xs = [landmark.x for landmark in hand_landmarks]
+        ys = [landmark.y for landmark in hand_landmarks]
+        x0, x1, y0, y1 = min(xs), max(xs), min(ys), max(ys)
+        center = ((x0 + x1) / 2, (y0 + y1) / 2)
+        vx = vy = interval = 0.0
+        if self.last_center is not None and timestamp > self.last_time:
+            interval = timestamp - self.last_time
+            vx = (center[0] - self.last_center[0]) / interval
+            vy = (center[1] - self.last_center[1]) / interval
+        self.last_center = center
+        self.last_time = timestamp
+        self.track = (x0, y0, x1, y1, vx, vy, interval)
+
+    def lose(self):
+        if self.track is not None:
+            self.losses += 1
+        self.track = None
+        self.last_center = None
+        self.last_time = None
+
+    def next_region(self, width, height):
+        """返回本帧的裁剪区域 (x, y, w, h, width, height)，无需裁剪时返回 None"""
+        track = self.track
+        if track is None:
+            self.region = None
+            self.frames_full += 1
+            return None
+        x0, y0, x1, y1, vx, vy, interval = track
+
+        # 沿运动方向预测下一帧的位置，并按速度扩大
+        shift_x = vx * interval
+        shift_y = vy * interval
+        x0 += shift_x
+        x1 += shift_x
+        y0 += shift_y
+        y1 += shift_y
+        expand_x = abs(shift_x) * self.velocity_gain
+        expand_y = abs(shift_y) * self.velocity_gain
+
+        # 像素坐标下的外扩包围盒，取正方形
+        box_w = (x1 - x0) * width
+        box_h = (y1 - y0) * height
+        side = max(box_w, box_h) * (1 + 2 * self.margin) + 2 * max(expand_x * width, expand_y * height)
+        side = max(side, self.min_size * min(width, height))
+        if side > ROI_MAX_SIZE * min(width, height):
+            self.region = None
+            self.frames_full += 1
+            return None
+
+        # 当前区域仍能容纳手部（保留一半外扩）且大小合适时保持不变
+        region = self.region
+        if region is not None and region[4] == width and region[5] == height:
+            x, y, w, h = region[:4]
+            pad = max(box_w, box_h) * self.margin / 2
+            if (x <= x0 * width - pad and x1 * width + pad <= x + w
+                    and y <= y0 * height - pad and y1 * height + pad <= y + h
+                    and 1 / ROI_RESIZE_RATIO <= side / w <= ROI_RESIZE_RATIO):
+                self.frames_cropped += 1
+                return region
+
+        size = int(side)
+        center_x = (x0 + x1) / 2 * width
+        center_y = (y0 + y1) / 2 * height
+        x = min(max(int(center_x - size / 2), 0), width - size)
+        y = min(max(int(center_y - size / 2), 0), height - size)
+        self.region = (x, y, size, size, width, height)
+        self.frames_cropped += 1
+        return self.region
+
+    def crop(self, frame, region):
+        """把裁剪区域复制进连续的预分配缓冲区（mp.Image 需要 C 连续数组）"""
+        if self.buffer is None or self.buffer.size < frame.size:
+            self.buffer = np.empty(frame.size, np.uint8)
+        x, y, w, h = region[:4]
+        channels = frame.shape[2]
+        image = self.buffer[:w * h * channels].reshape(h, w, channels)
+        np.copyto(image, frame[y:y + h, x:x + w])
+        return image
+
+    def stats(self):
+        total = self.frames_cropped + self.frames_full
+        return {
+            "frames_cropped": self.frames_cropped,
+            "frames_full": self.frames_full,
+            "crop_ratio": self.frames_cropped / total if total else 0.0,
+            "losses": self.losses,
+            "region": self.region[:4] if self.region is not None else None
+        }
+
+
+def map_result(result, region):
+    """把裁剪区域内的归一化关键点原地换算回整帧坐标（z 与 x 同尺度，一并缩放）"""
+    x, y, w, h, width, height = region
+    offset_x = x / width
+    offset_y = y / height
+    scale_x = w / width
+    scale_y = h / height
+    for hand_landmarks in result.hand_landmarks:
+        for landmark in hand_landmarks:
+            landmark.x = offset_x + landmark.x * scale_x
+            landmark.y = offset_y + landmark.y * scale_y
+            landmark.z *= scale_x
@@ -0,0 +1,198 @@
+import sys
+import numpy as np
+from PySide6.QtGui import QGuiApplication
+from calibration import DISTORTION_CENTER
+
+# 摄像头画面中映射到整个桌面的区域 (x0, y0, x1, y1)，正则化坐标，区域外的位置贴边
+ACTIVE_REGION = (0.25, 0.2, 0.75, 0.7)
+
+
+def default_coordinate_space():
+    """鼠标注入使用的坐标系：macOS 为逻辑坐标（点），Windows 与 X11 为物理像素"""
+    return "logical" if sys.platform == "darwin" else "physical"
+
+
+class ScreenMapper:
+    """
+    把食指指尖的正则化坐标映射为鼠标注入坐标。
+
+    屏幕布局（各屏幕在注入坐标系中的矩形）只在布局变化时读取一次，并预先算成
+    x' = ax * x + bx、y' = ay * y + by 的仿射变换，每帧只需一次乘加。
+    自动模式下从 QGuiApplication.screens() 读取所有屏幕的几何与缩放，
+    屏幕增减、分辨率或 DPI 变化时重新计算；手动模式使用配置中的分辨率与缩放。
+
+    Qt 的屏幕几何为逻辑坐标，左上角保持原生坐标，宽高按各屏幕的 devicePixelRatio 缩小，
+    因此物理坐标系下只需把宽高乘回缩放比例。
+    多个屏幕映射到它们的外接矩形上；外接矩形中不属于任何屏幕的空隙贴到最近的屏幕。
+    有标定结果（calibration.py）时改用标定的单应矩阵：桌面归一化坐标到外接矩形的缩放
+    预先乘进矩阵，每帧一次 3×3 投影（有畸变系数时先做一次径向去畸变），输入不再被裁到固定区域。
+    变换与布局以一个元组整体替换，识别线程读取时不需要加锁。
+    """
+
+    def __init__(self, region=ACTIVE_REGION):
+        self.region = region
+        self.coordinate_space = default_coordinate_space()
+        self.auto = True
+        self.detected_screens = []  # 自动检测到的屏幕矩形
+        self.manual_screen = (0, 0, 1920, 1080)  # 手动配置的屏幕矩形
+        self.tolerance = 0  # 输出范围每侧外扩的像素，抵消 Controller 的防抖死区
+        self.calibration = None  # (H, k1)，指尖坐标到桌面归一化坐标
+        self.watching = False
+        self.updates = 0
+        self.layout = None  # (ax, bx, ay, by, 需要贴边的屏幕矩形或 None, 标定投影或 None)
+        self.bounds = None  # 所有屏幕的外接矩形 (left, top, right, bottom)
+        self.rebuild()
+
+    def set_manual(self, width, height, scale):
+        """手动指定单个屏幕的逻辑分辨率与缩放比例"""
+        if self.coordinate_space == "physical":
+            width, height = width * scale, height * scale
+        self.manual_screen = (0, 0, int(round(width)), int(round(height)))
+
+    def set_auto(self, auto):
+        self.auto = auto
+
+    def set_coordinate_space(self, coordinate_space):
+        self.coordinate_space = coordinate_space if coordinate_space in ("logical", "physical") \
+            else default_coordinate_space()
+
+    def set_calibration(self, calibration):
+        self.calibration = calibration
+
+    def set_tolerance(self, tolerance):
+        self.tolerance = max(0, tolerance)
+
+    def watch(self):
+        """读取当前屏幕布局并监听变化（需在界面线程调用）"""
+        application = QGuiApplication.instance()
+        if application is None or self.watching:
+            return
+        self.watching = True
+        application.screenAdded.connect(self.on_screen_added)
+        application.screenRemoved.connect(self.on_layout_changed)
+        application.primaryScreenChanged.connect(self.on_layout_changed)
+        for screen in application.screens():
+            self.watch_screen(screen)
+        self.detect()
+
+    def watch_screen(self, screen):
+        screen.geometryChanged.connect(self.on_layout_changed)
+        screen.logicalDotsPerInchChanged.connect(self.on_layout_changed)
+        screen.physicalDotsPerInchChanged.connect(self.on_layout_changed)
+
+    def on_screen_added(self, screen):
+        self.watch_screen(screen)
+        self.detect()
+
+    def on_layout_changed(self, *args):
+        self.detect()
+
+    def detect(self):
+        application = QGuiApplication.instance()
+        if application is None:
+            return
+        physical = self.coordinate_space == "physical"
+        screens = []
+        for screen in application.screens():
+            geometry = screen.geometry()
+            ratio = screen.devicePixelRatio() if physical else 1.0
+            screens.append((geometry.x(), geometry.y(),
+                            int(round(geometry.width() * ratio)), int(round(geometry.height() * ratio))))
+        self.detected_screens = screens
+        self.rebuild()
+
+    def screens(self):
+        if self.auto and self.detected_screens:
+            return self.detected_screens
+        return [self.manual_screen]
+
+    def rebuild(self):
+        """按当前屏幕布局与容差重新计算仿射变换"""
+        screens = self.screens()
+        left = min(x for x, y, w, h in screens)
+        top = min(y for x, y, w, h in screens)
+        right = max(x + w for x, y, w, h in screens)
+        bottom = max(y + h for x, y, w, h in screens)
+        x0, y0, x1, y1 = self.region
+        tolerance = self.tolerance
+        ax = (right - left + 2 * tolerance) / (x1 - x0)
+        ay = (bottom - top + 2 * tolerance) / (y1 - y0)
+        bx = left - tolerance - ax * x0
+        by = top - tolerance - ay * y0
+        # 屏幕之间没有空隙时外接矩形内的点都有效，不必逐帧贴边
+        covered = sum(w * h for x, y, w, h in screens)
+        clamp_screens = tuple(screens) if covered < (right - left) * (bottom - top) else None
+        projection = None
+        if self.calibration is not None:
+            homography, k1 = self.calibration
+            # 桌面归一化坐标 -> 外接矩形（含容差），与 H 合成一个矩阵
+            scale = np.array([[right - left + 2 * tolerance, 0, left - tolerance],
+                              [0, bottom - top + 2 * tolerance, top - tolerance],
+                              [0, 0, 1]])
+            matrix = tuple((scale @ homography).flatten().tolist())
+            bounds = (left - tolerance, top - tolerance, right + tolerance, bottom + tolerance)
+            projection = (matrix, k1, bounds)
+        self.layout = (ax, bx, ay, by, clamp_screens, projection)
+        self.bounds = (left, top, right, bottom)
+        self.updates += 1
+
+    def desktop_bounds(self):
+        """注入坐标系中整个桌面的外接矩形，供 uinput 等绝对坐标后端换算"""
+        return self.bounds
+
+    def map(self, x, y):
+        """正则化坐标 -> 注入坐标（整数像素）"""
+        ax, bx, ay, by, clamp_screens, projection = self.layout
+        if projection is not None:
+            target_x, target_y = self.project(x, y, projection)
+        else:
+            x0, y0, x1, y1 = self.region
+            x = min(max(x, x0), x1)
+            y = min(max(y, y0), y1)
+            target_x = int(ax * x + bx)
+            target_y = int(ay * y + by)
+        if clamp_screens is not None:
+            return self.nearest_point(target_x, target_y, clamp_screens)
+        return target_x, target_y
+
+    @staticmethod
+    def project(x, y, projection):
+        (m00, m01, m02, m10, m11, m12, m20, m21, m22), k1, (left, top, right, bottom) = projection
+        if k1:
+            dx = x - DISTORTION_CENTER[0]
+            dy = y - DISTORTION_CENTER[1]
+            factor = 1 + k1 * (dx * dx + dy * dy)
+            x = DISTORTION_CENTER[0] + dx * factor
+            y = DISTORTION_CENTER[1] + dy * factor
+        w = m20 * x + m21 * y + m22
+        if w <= 1e-9:
+            return left, top  # 超出标定范围太远（投影到无穷远之后）
+        target_x = (m00 * x + m01 * y + m02) / w
+        target_y = (m10 * x + m11 * y + m12) / w
+        return int(min(max(target_x, left), right)), int(min(max(target_y, top), bottom))
+
+    @staticmethod
+    def nearest_point(x, y, screens):
+        best, best_distance = None, None
+        for left, top, width, height in screens:
+            px = min(max(x, left), left + width - 1)
+            py = min(max(y, top), top + height - 1)
+            distance = (px - x) ** 2 + (py - y) ** 2
+            if distance == 0:
+                return x, y
+            if best_distance is None or distance < best_distance:
+                best, best_distance = (px, py), distance
+        return best
+
+    def stats(self):
+        ax, bx, ay, by, clamp_screens, projection = self.layout
+        return {
+            "mode": "auto" if self.auto and self.detected_screens else "manual",
+            "calibrated": projection is not None,
+            "coordinate_space": self.coordinate_space,
+            "screens": self.screens(),
+            "bounds": self.bounds,
+            "transform": (ax, bx, ay, by),
+            "gaps": clamp_screens is not None,
+            "updates": self.updates
+        }
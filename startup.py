@@ -0,0 +1,28 @@
+"""
+启动耗时标记。
+
+main.py 最先导入本模块，以此作为起点；之后各阶段调用 mark() 记录距起点的秒数，
+同一阶段只记录第一次。
+"""
+import time
+
+START_TIME = time.perf_counter()
+
+# 阶段名 -> 距启动的秒数
+marks = {}
+
+
+def mark(name):
+    """记录阶段耗时，首次记录时返回 True"""
+    if name in marks:
+        return False
+    marks[name] = time.perf_counter() - START_TIME
+    return True
+
+
+def startup_stats():
+    return dict(marks)
+
+
+def report():
+    return "启动耗时: " + ", ".join(f"{name} {seconds:.2f}s" for name, seconds in marks.items())
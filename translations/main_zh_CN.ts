@@ -1,136 +1,229 @@
 <?xml version="1.0" encoding="utf-8"?>
 <!DOCTYPE TS>
 <TS version="2.1" language="zh_CN">
+<context>
+    <name>CalibrationPage</name>
+    <message>
+        <location filename="../pages/CalibrationPage.py" line="85"/>
+        <source>Calibration failed, please try again.</source>
+        <translation type="unfinished">校准失败，请重试。</translation>
+    </message>
+    <message>
+        <location filename="../pages/CalibrationPage.py" line="89"/>
+        <source>Calibration was not accurate enough (error {:.1f}%), please try again.</source>
+        <translation type="unfinished">校准精度不足（误差 {:.1f}%），请重试。</translation>
+    </message>
+    <message>
+        <location filename="../pages/CalibrationPage.py" line="134"/>
+        <source>Point at the target and hold still ({}/{}). Press Esc to cancel.</source>
+        <translation type="unfinished">请指向目标并保持不动（{}/{}），按 Esc 取消。</translation>
+    </message>
+</context>
 <context>
     <name>MainWindow</name>
     <message>
-        <location filename="../main.py" line="78"/>
-        <location filename="../main.py" line="95"/>
+        <location filename="../app.py" line="79"/>
+        <location filename="../app.py" line="94"/>
         <source>Welcome</source>
         <translation type="unfinished">欢迎</translation>
     </message>
     <message>
-        <location filename="../main.py" line="78"/>
-        <location filename="../main.py" line="98"/>
+        <location filename="../app.py" line="79"/>
+        <location filename="../app.py" line="96"/>
         <source>LiveStream</source>
         <translation type="unfinished">实时预览</translation>
     </message>
     <message>
-        <location filename="../main.py" line="78"/>
-        <location filename="../main.py" line="104"/>
+        <location filename="../app.py" line="79"/>
+        <location filename="../app.py" line="102"/>
         <source>Settings</source>
         <translation type="unfinished">设置</translation>
     </message>
     <message>
-        <location filename="../main.py" line="79"/>
+        <location filename="../app.py" line="79"/>
         <source>About</source>
         <translation type="unfinished">关于</translation>
     </message>
     <message>
-        <location filename="../main.py" line="99"/>
+        <location filename="../app.py" line="99"/>
         <source>Livestream view will show here.</source>
         <translation type="unfinished">实时预览将在此显示</translation>
     </message>
     <message>
-        <location filename="../main.py" line="137"/>
-        <location filename="../main.py" line="386"/>
+        <location filename="../app.py" line="156"/>
+        <location filename="../app.py" line="187"/>
+        <location filename="../app.py" line="432"/>
+        <location filename="../app.py" line="444"/>
         <source>Start Service</source>
         <translation type="unfinished">启动服务</translation>
     </message>
     <message>
-        <location filename="../main.py" line="138"/>
-        <source>Display Window</source>
-        <translation type="unfinished">显示窗口</translation>
-    </message>
-    <message>
-        <location filename="../main.py" line="139"/>
-        <source>Exit</source>
-        <translation type="unfinished">退出</translation>
-    </message>
-    <message>
-        <location filename="../main.py" line="197"/>
-        <source>&lt;b&gt;Move:&lt;/b&gt; Move your index finger to control the cursor.</source>
-        <translation type="unfinished">&lt;b&gt;移动:&lt;/b&gt; 移动食指以控制光标。</translation>
+        <location filename="../app.py" line="157"/>
+        <source>Hand tracking failed to load</source>
+        <translation type="unfinished">手部识别加载失败</translation>
     </message>
     <message>
-        <location filename="../main.py" line="203"/>
-        <source>&lt;b&gt;Click:&lt;/b&gt; Tap your index finger down to perform a click.</source>
-        <translation type="unfinished">&lt;b&gt;点击:&lt;/b&gt; 轻点食指以单击。</translation>
+        <location filename="../app.py" line="160"/>
+        <source>Hand tracking failed to load: {}</source>
+        <translation type="unfinished">手部识别加载失败：{}</translation>
     </message>
     <message>
-        <location filename="../main.py" line="209"/>
-        <source>&lt;b&gt;Drag:&lt;/b&gt; Pinch with your thumb and index finger to start dragging.</source>
-        <translation type="unfinished">&lt;b&gt;拖选:&lt;/b&gt; 拇指与食指捏合以拖动或选取。</translation>
-    </message>
-    <message>
-        <location filename="../main.py" line="215"/>
-        <source>&lt;b&gt;Scroll:&lt;/b&gt; Use your index and middle fingers to scroll.</source>
-        <translation type="unfinished">&lt;b&gt;滚动:&lt;/b&gt; 使用食指和中指来滚动。</translation>
+        <location filename="../app.py" line="188"/>
+        <source>Display Window</source>
+        <translation type="unfinished">显示窗口</translation>
     </message>
     <message>
-        <location filename="../main.py" line="221"/>
-        <source>&lt;b&gt;Settings:&lt;/b&gt; Go to the Settings page to customize sensitivity and other options.</source>
-        <translation type="unfinished">&lt;b&gt;设置:&lt;/b&gt; 前往设置页面以微调灵敏度等选项。</translation>
+        <location filename="../app.py" line="189"/>
+        <source>Exit</source>
+        <translation type="unfinished">退出</translation>
     </message>
     <message>
-        <location filename="../main.py" line="243"/>
-        <location filename="../main.py" line="270"/>
+        <location filename="../app.py" line="255"/>
+        <location filename="../app.py" line="299"/>
         <source>Width (px)</source>
         <translation type="unfinished">宽度 (px)</translation>
     </message>
     <message>
-        <location filename="../main.py" line="245"/>
-        <location filename="../main.py" line="272"/>
+        <location filename="../app.py" line="257"/>
+        <location filename="../app.py" line="301"/>
         <source>Height (px)</source>
         <translation type="unfinished">高度 (px)</translation>
     </message>
     <message>
-        <location filename="../main.py" line="246"/>
+        <location filename="../app.py" line="258"/>
         <source>Screen Resolution (px):</source>
         <translation type="unfinished">屏幕分辨率 (px):</translation>
     </message>
     <message>
-        <location filename="../main.py" line="262"/>
+        <location filename="../app.py" line="266"/>
+        <source>Detect screens automatically</source>
+        <translation type="unfinished">自动检测屏幕</translation>
+    </message>
+    <message>
+        <location filename="../app.py" line="272"/>
+        <source>Calibrate Pointer</source>
+        <translation type="unfinished">校准指针</translation>
+    </message>
+    <message>
+        <location filename="../app.py" line="273"/>
+        <source>Reset Calibration</source>
+        <translation type="unfinished">重置校准</translation>
+    </message>
+    <message>
+        <location filename="../app.py" line="291"/>
         <source>HiDPI Scaling:</source>
         <translation type="unfinished">HiDPI 显示屏缩放:</translation>
     </message>
     <message>
-        <location filename="../main.py" line="273"/>
+        <location filename="../app.py" line="302"/>
         <source>Camera Resolution (px):</source>
         <translation type="unfinished">摄像头分辨率 (px):</translation>
     </message>
     <message>
-        <location filename="../main.py" line="288"/>
+        <location filename="../app.py" line="317"/>
         <source>Camera Sampling FPS:</source>
         <translation type="unfinished">摄像头采样帧率:</translation>
     </message>
     <message>
-        <location filename="../main.py" line="302"/>
+        <location filename="../app.py" line="331"/>
         <source>Scroll Speed:</source>
         <translation type="unfinished">滚动速度:</translation>
     </message>
     <message>
-        <location filename="../main.py" line="316"/>
-        <location filename="../main.py" line="328"/>
-        <location filename="../main.py" line="468"/>
-        <location filename="../main.py" line="474"/>
+        <location filename="../app.py" line="340"/>
+        <source>None</source>
+        <translation type="unfinished">无</translation>
+    </message>
+    <message>
+        <location filename="../app.py" line="340"/>
+        <source>One Euro</source>
+        <translation type="unfinished">One Euro 滤波</translation>
+    </message>
+    <message>
+        <location filename="../app.py" line="340"/>
+        <source>Kalman</source>
+        <translation type="unfinished">卡尔曼滤波</translation>
+    </message>
+    <message>
+        <location filename="../app.py" line="342"/>
+        <source>Latency prediction</source>
+        <translation type="unfinished">延迟预测</translation>
+    </message>
+    <message>
+        <location filename="../app.py" line="344"/>
+        <source>Pointer Filter:</source>
+        <translation type="unfinished">指针滤波：</translation>
+    </message>
+    <message>
+        <location filename="../app.py" line="358"/>
+        <location filename="../app.py" line="370"/>
+        <location filename="../app.py" line="549"/>
+        <location filename="../app.py" line="554"/>
         <source>Current sensitivity: {}</source>
         <translation type="unfinished">当前灵敏度: {}</translation>
     </message>
     <message>
-        <location filename="../main.py" line="317"/>
+        <location filename="../app.py" line="359"/>
         <source>Clicking Sensitivity</source>
         <translation type="unfinished">点击灵敏度</translation>
     </message>
     <message>
-        <location filename="../main.py" line="329"/>
+        <location filename="../app.py" line="371"/>
         <source>Moving Sensitivity</source>
         <translation>移动灵敏度</translation>
     </message>
     <message>
-        <location filename="../main.py" line="393"/>
+        <location filename="../app.py" line="435"/>
+        <source>Starting...</source>
+        <translation type="unfinished">正在启动…</translation>
+    </message>
+    <message>
+        <location filename="../app.py" line="451"/>
         <source>Pause Service</source>
         <translation type="unfinished">暂停服务</translation>
     </message>
+    <message>
+        <location filename="../app.py" line="481"/>
+        <source>Not calibrated</source>
+        <translation type="unfinished">未校准</translation>
+    </message>
+    <message>
+        <location filename="../app.py" line="483"/>
+        <source>Calibrated</source>
+        <translation type="unfinished">已校准</translation>
+    </message>
+    <message>
+        <location filename="../app.py" line="485"/>
+        <source>Calibrated (error {:.1f}%)</source>
+        <translation type="unfinished">已校准（误差 {:.1f}%）</translation>
+    </message>
+</context>
+<context>
+    <name>WelcomePage</name>
+    <message>
+        <location filename="../pages/WelcomePage.py" line="38"/>
+        <source>&lt;b&gt;Move:&lt;/b&gt; Move your index finger to control the cursor.</source>
+        <translation type="unfinished">&lt;b&gt;移动:&lt;/b&gt; 移动食指以控制光标。</translation>
+    </message>
+    <message>
+        <location filename="../pages/WelcomePage.py" line="44"/>
+        <source>&lt;b&gt;Click:&lt;/b&gt; Tap your index finger down to perform a click.</source>
+        <translation type="unfinished">&lt;b&gt;点击:&lt;/b&gt; 轻点食指以单击。</translation>
+    </message>
+    <message>
+        <location filename="../pages/WelcomePage.py" line="50"/>
+        <source>&lt;b&gt;Drag:&lt;/b&gt; Pinch with your thumb and index finger to start dragging.</source>
+        <translation type="unfinished">&lt;b&gt;拖选:&lt;/b&gt; 拇指与食指捏合以拖动或选取。</translation>
+    </message>
+    <message>
+        <location filename="../pages/WelcomePage.py" line="56"/>
+        <source>&lt;b&gt;Scroll:&lt;/b&gt; Use your index and middle fingers to scroll.</source>
+        <translation type="unfinished">&lt;b&gt;滚动:&lt;/b&gt; 使用食指和中指来滚动。</translation>
+    </message>
+    <message>
+        <location filename="../pages/WelcomePage.py" line="62"/>
+        <source>&lt;b&gt;Settings:&lt;/b&gt; Go to the Settings page to customize sensitivity and other options.</source>
+        <translation type="unfinished">&lt;b&gt;设置:&lt;/b&gt; 前往设置页面以微调灵敏度等选项。</translation>
+    </message>
 </context>
 </TS>
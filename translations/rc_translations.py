@@ -1,97 +1,112 @@
 # Resource object code (Python 3)
 # Created by: object code
-# Created by: The Resource Compiler for Qt version 6.9.0
+# Created by: The Resource Compiler for Qt version 6.12.0
 # WARNING! All changes made in this file will be lost!
 
 from PySide6 import QtCore
 
 qt_resource_data = b"\
-\x00\x00\x07\xf7\
+\x00\x00\x0dW\
 <\
 \xb8d\x18\xca\xef\x9c\x95\xcd!\x1c\xbf`\xa1\xbd\xdd\xa7\
-\x00\x00\x00\x05zh_CNB\x00\x00\x00\xc0\x00\x04\
-\xcf\x04\x00\x00\x04=\x00G\x96\xc4\x00\x00\x02\xca\x00\x9e\
-\x0c\x0e\x00\x00\x00\x00\x03aY\x95\x00\x00\x06~\x03\x8c\
-\xf8N\x00\x00\x01\x18\x04p8.\x00\x00\x00\x81\x04\xf6\
-U\xda\x00\x00\x04\x9c\x05ygg\x00\x00\x04\x08\x05\xcc\
-@*\x00\x00\x03@\x07<\x0f\xde\x00\x00\x01\x9b\x09 \
-\xe8\xbd\x00\x00\x03\xc0\x0aO\xf6\xba\x00\x00\x05\xd1\x0a\xa7\
-(\x19\x00\x00\x06\xdc\x0a\xae\xbb\xbd\x00\x00\x04\xe1\x0b\x13\
-\x899\x00\x00\x03\x83\x0c\x0f\xd9\xca\x00\x00\x06\x1d\x0c\xbb\
-\x01s\x00\x00\x06S\x0c\xcf\xc5Y\x00\x00\x05b\x0d\xbc\
-\x08^\x00\x00\x02!\x0d\xc2\xa6e\x00\x00\x06\xb2\x0eo\
-\xdb\x8a\x00\x00\x02\xf2\x0f,Hy\x00\x00\x04d\x0fE\
-X\x95\x00\x00\x05\x9d\x0f\xfb\x17\xfe\x00\x00\x05\x12i\x00\
-\x00\x07\x13\x03\x00\x00\x00&\x00<\x00b\x00>p\xb9\
-Q\xfb\x00:\x00<\x00/\x00b\x00>\x00 \x8f{\
-p\xb9\x98\xdfc\x07N\xe5SUQ\xfb0\x02\x08\x00\
-\x00\x00\x00\x06\x00\x00\x00<<b>Click\
-:</b> Tap your i\
-ndex finger down\
- to perform a cl\
-ick.\x07\x00\x00\x00\x0aMainWin\
-dow\x01\x03\x00\x00\x002\x00<\x00b\x00>b\
-\xd6\x90\x09\x00:\x00<\x00/\x00b\x00>\x00 b\
-\xc7c\x07N\x0e\x98\xdfc\x07cOT\x08N\xe5b\
-\xd6R\xa8b\x16\x90\x09S\xd60\x02\x08\x00\x00\x00\x00\
-\x06\x00\x00\x00F<b>Drag:</b\
-> Pinch with you\
-r thumb and inde\
-x finger to star\
-t dragging.\x07\x00\x00\x00\x0a\
-MainWindow\x01\x03\x00\x00\x00*\
-\x00<\x00b\x00>y\xfbR\xa8\x00:\x00<\x00/\
-\x00b\x00>\x00 y\xfbR\xa8\x98\xdfc\x07N\xe5\
-c\xa7R6QIh\x070\x02\x08\x00\x00\x00\x00\x06\
-\x00\x00\x00:<b>Move:</b>\
- Move your index\
- finger to contr\
-ol the cursor.\x07\x00\
+\x00\x00\x00\x05zh_CNB\x00\x00\x01H\x00\x04\
+\xcf\x04\x00\x00\x04\x05\x00\x05VE\x00\x00\x06m\x00G\
+\x96\xc4\x00\x00\x01\x8d\x00\x9e\x0c\x0e\x00\x00\x09\x1c\x00\x9f\
+\x7fr\x00\x00\x01\xb5\x01(\xa2\xd9\x00\x00\x03\x89\x01\x81\
+\xe0>\x00\x00\x00\xf3\x03aY\x95\x00\x00\x08S\x03\x8c\
+\xf8N\x00\x00\x0a6\x04p8.\x00\x00\x09\x9e\x04t\
+\xc9\xef\x00\x00\x06\xc5\x04\xf6U\xda\x00\x00\x05\x04\x05\x18\
+3~\x00\x00\x05I\x05e|\xae\x00\x00\x05x\x05y\
+gg\x00\x00\x03\xd0\x05\xcc@*\x00\x00\x02\xc1\x06\xed\
+\xfb\x1e\x00\x00\x00[\x07<\x0f\xde\x00\x00\x0a\xba\x088\
+*I\x00\x00\x02\x1c\x09 \xe8\xbd\x00\x00\x03A\x09\xfe\
+\x19\xc4\x00\x00\x06\x92\x0a,\xb8]\x00\x00\x04w\x0aO\
+\xf6\xba\x00\x00\x07\xa6\x0a\xa7(\x19\x00\x00\x08\xe5\x0a\xae\
+\xbb\xbd\x00\x00\x05\xb1\x0a\xbeI\x9e\x00\x00\x08\x87\x0b\x13\
+\x899\x00\x00\x03\x04\x0bpz$\x00\x00\x04,\x0c\x0f\
+\xd9\xca\x00\x00\x07\xf2\x0c/\x80\xfe\x00\x00\x00\x00\x0c\xb9\
+?z\x00\x00\x076\x0c\xbb\x01s\x00\x00\x08(\x0c\xcf\
+\xc5Y\x00\x00\x062\x0d\xbc\x08^\x00\x00\x0bA\x0d\xc2\
+\xa6e\x00\x00\x08\xbb\x0eo\xdb\x8a\x00\x00\x02s\x0f,\
+Hy\x00\x00\x04\xcc\x0fEX\x95\x00\x00\x07\x02\x0f\x99\
+en\x00\x00\x07n\x0f\x9c\x12\x94\x00\x00\x01\xed\x0f\xfb\
+\x17\xfe\x00\x00\x05\xe2i\x00\x00\x0b\xeb\x03\x00\x00\x00\x12\
+h!Q\xc6Y1\x8d%\xff\x0c\x8b\xf7\x91\xcd\x8b\xd5\
+0\x02\x08\x00\x00\x00\x00\x06\x00\x00\x00%Cali\
+bration failed, \
+please try again\
+.\x07\x00\x00\x00\x0fCalibratio\
+nPage\x01\x03\x00\x00\x00.h!Q\xc6|\
+\xbe^\xa6N\x0d\x8d\xb3\xff\x08\x8b\xef]\xee\x00 \x00\
+{\x00:\x00.\x001\x00f\x00}\x00%\xff\x09\xff\
+\x0c\x8b\xf7\x91\xcd\x8b\xd50\x02\x08\x00\x00\x00\x00\x06\x00\
+\x00\x00FCalibration w\
+as not accurate \
+enough (error {:\
+.1f}%), please t\
+ry again.\x07\x00\x00\x00\x0fCa\
+librationPage\x01\x03\x00\
+\x00\x006\x8b\xf7c\x07T\x11v\xeeh\x07^vO\
+\xddc\x01N\x0dR\xa8\xff\x08\x00{\x00}\x00/\x00\
+{\x00}\xff\x09\xff\x0cc\x09\x00 \x00E\x00s\x00\
+c\x00 S\xd6m\x880\x02\x08\x00\x00\x00\x00\x06\x00\
+\x00\x00@Point at the \
+target and hold \
+still ({}/{}). P\
+ress Esc to canc\
+el.\x07\x00\x00\x00\x0fCalibrat\
+ionPage\x01\x03\x00\x00\x00\x04QsN\
+\x8e\x08\x00\x00\x00\x00\x06\x00\x00\x00\x05About\
+\x07\x00\x00\x00\x0aMainWindow\x01\
+\x03\x00\x00\x00\x08h!Q\xc6c\x07\x94\x88\x08\x00\x00\
+\x00\x00\x06\x00\x00\x00\x11Calibrate\
+ Pointer\x07\x00\x00\x00\x0aMai\
+nWindow\x01\x03\x00\x00\x00\x06]\xf2h\
+!Q\xc6\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0aCal\
+ibrated\x07\x00\x00\x00\x0aMain\
+Window\x01\x03\x00\x00\x00\x1e]\xf2h!\
+Q\xc6\xff\x08\x8b\xef]\xee\x00 \x00{\x00:\x00.\
+\x001\x00f\x00}\x00%\xff\x09\x08\x00\x00\x00\x00\x06\
+\x00\x00\x00\x1aCalibrated (\
+error {:.1f}%)\x07\x00\
 \x00\x00\x0aMainWindow\x01\x03\x00\
-\x00\x00,\x00<\x00b\x00>n\xdaR\xa8\x00:\x00\
-<\x00/\x00b\x00>\x00 O\x7fu(\x98\xdfc\
-\x07T\x8cN-c\x07gen\xdaR\xa80\x02\x08\
-\x00\x00\x00\x00\x06\x00\x00\x00;<b>Scro\
-ll:</b> Use your\
- index and middl\
-e fingers to scr\
-oll.\x07\x00\x00\x00\x0aMainWin\
-dow\x01\x03\x00\x00\x006\x00<\x00b\x00>\x8b\
-\xbe\x7fn\x00:\x00<\x00/\x00b\x00>\x00 R\
-M_\x80\x8b\xbe\x7fn\x98u\x97bN\xe5_\xae\x8c\
-\x03pueO^\xa6{I\x90\x09\x98y0\x02\x08\
-\x00\x00\x00\x00\x06\x00\x00\x00T<b>Sett\
-ings:</b> Go to \
-the Settings pag\
-e to customize s\
-ensitivity and o\
-ther options.\x07\x00\x00\
-\x00\x0aMainWindow\x01\x03\x00\x00\
-\x00\x04QsN\x8e\x08\x00\x00\x00\x00\x06\x00\x00\x00\x05\
-About\x07\x00\x00\x00\x0aMainWi\
-ndow\x01\x03\x00\x00\x00\x18dDP\xcfY4\
-R\x06\x8f\xa8s\x87\x00 \x00(\x00p\x00x\x00)\
-\x00:\x08\x00\x00\x00\x00\x06\x00\x00\x00\x17Came\
-ra Resolution (p\
-x):\x07\x00\x00\x00\x0aMainWind\
-ow\x01\x03\x00\x00\x00\x10dDP\xcfY4\x91\xc7\
-h7^'s\x87\x00:\x08\x00\x00\x00\x00\x06\x00\x00\
-\x00\x14Camera Samplin\
-g FPS:\x07\x00\x00\x00\x0aMainW\
-indow\x01\x03\x00\x00\x00\x0ap\xb9Q\xfbp\
-ueO^\xa6\x08\x00\x00\x00\x00\x06\x00\x00\x00\x14C\
-licking Sensitiv\
-ity\x07\x00\x00\x00\x0aMainWind\
-ow\x01\x03\x00\x00\x00\x12_SRMpueO\
-^\xa6\x00:\x00 \x00{\x00}\x08\x00\x00\x00\x00\x06\
-\x00\x00\x00\x17Current sens\
-itivity: {}\x07\x00\x00\x00\x0a\
+\x00\x00\x18dDP\xcfY4R\x06\x8f\xa8s\x87\x00\
+ \x00(\x00p\x00x\x00)\x00:\x08\x00\x00\x00\x00\
+\x06\x00\x00\x00\x17Camera Reso\
+lution (px):\x07\x00\x00\x00\
+\x0aMainWindow\x01\x03\x00\x00\x00\
+\x10dDP\xcfY4\x91\xc7h7^'s\x87\x00\
+:\x08\x00\x00\x00\x00\x06\x00\x00\x00\x14Camer\
+a Sampling FPS:\x07\
+\x00\x00\x00\x0aMainWindow\x01\x03\
+\x00\x00\x00\x0ap\xb9Q\xfbpueO^\xa6\x08\x00\
+\x00\x00\x00\x06\x00\x00\x00\x14Clicking\
+ Sensitivity\x07\x00\x00\x00\
+\x0aMainWindow\x01\x03\x00\x00\x00\
+\x12_SRMpueO^\xa6\x00:\x00 \x00\
+{\x00}\x08\x00\x00\x00\x00\x06\x00\x00\x00\x17Cur\
+rent sensitivity\
+: {}\x07\x00\x00\x00\x0aMainWin\
+dow\x01\x03\x00\x00\x00\x0c\x81\xeaR\xa8h\xc0m\
+K\x5cO^U\x08\x00\x00\x00\x00\x06\x00\x00\x00\x1cD\
+etect screens au\
+tomatically\x07\x00\x00\x00\x0a\
 MainWindow\x01\x03\x00\x00\x00\x08\
 f>y:z\x97S\xe3\x08\x00\x00\x00\x00\x06\x00\x00\
 \x00\x0eDisplay Window\
 \x07\x00\x00\x00\x0aMainWindow\x01\
 \x03\x00\x00\x00\x04\x90\x00Q\xfa\x08\x00\x00\x00\x00\x06\x00\
 \x00\x00\x04Exit\x07\x00\x00\x00\x0aMain\
+Window\x01\x03\x00\x00\x00\x10bK\x90\xe8\
+\x8b\xc6R+R\xa0\x8f}Y1\x8d%\x08\x00\x00\x00\
+\x00\x06\x00\x00\x00\x1cHand track\
+ing failed to lo\
+ad\x07\x00\x00\x00\x0aMainWindo\
+w\x01\x03\x00\x00\x00\x16bK\x90\xe8\x8b\xc6R+R\
+\xa0\x8f}Y1\x8d%\xff\x1a\x00{\x00}\x08\x00\x00\
+\x00\x00\x06\x00\x00\x00 Hand trac\
+king failed to l\
+oad: {}\x07\x00\x00\x00\x0aMain\
 Window\x01\x03\x00\x00\x00\x0e\x9a\xd8^\xa6\
 \x00 \x00(\x00p\x00x\x00)\x08\x00\x00\x00\x00\x06\
 \x00\x00\x00\x0bHeight (px)\x07\
@@ -100,42 +115,113 @@ Window\x01\x03\x00\x00\x00\x0e\x9a\xd8^\xa6\
 f>y:\x5cO\x7f)e>\x00:\x08\x00\x00\x00\
 \x00\x06\x00\x00\x00\x0eHiDPI Scal\
 ing:\x07\x00\x00\x00\x0aMainWin\
-dow\x01\x03\x00\x00\x00\x08[\x9ee\xf6\x98\x84\x89\
-\xc8\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0aLiveS\
-tream\x07\x00\x00\x00\x0aMainWi\
-ndow\x01\x03\x00\x00\x00\x12[\x9ee\xf6\x98\x84\
-\x89\xc8\x5c\x06W(kdf>y:\x08\x00\x00\x00\
-\x00\x06\x00\x00\x00\x1fLivestream\
- view will show \
-here.\x07\x00\x00\x00\x0aMainWi\
-ndow\x01\x03\x00\x00\x00\x0ay\xfbR\xa8pu\
-eO^\xa6\x08\x00\x00\x00\x00\x06\x00\x00\x00\x12Mo\
-ving Sensitivity\
+dow\x01\x03\x00\x00\x00\x0aSa\x5c\x14f\xfcn\
+\xe4l\xe2\x08\x00\x00\x00\x00\x06\x00\x00\x00\x06Kal\
+man\x07\x00\x00\x00\x0aMainWind\
+ow\x01\x03\x00\x00\x00\x08^\xf6\x8f\xdf\x98\x84mK\
+\x08\x00\x00\x00\x00\x06\x00\x00\x00\x12Latenc\
+y prediction\x07\x00\x00\x00\
+\x0aMainWindow\x01\x03\x00\x00\x00\
+\x08[\x9ee\xf6\x98\x84\x89\xc8\x08\x00\x00\x00\x00\x06\x00\
+\x00\x00\x0aLiveStream\x07\x00\x00\
+\x00\x0aMainWindow\x01\x03\x00\x00\
+\x00\x12[\x9ee\xf6\x98\x84\x89\xc8\x5c\x06W(kd\
+f>y:\x08\x00\x00\x00\x00\x06\x00\x00\x00\x1fLi\
+vestream view wi\
+ll show here.\x07\x00\x00\
+\x00\x0aMainWindow\x01\x03\x00\x00\
+\x00\x0ay\xfbR\xa8pueO^\xa6\x08\x00\x00\x00\
+\x00\x06\x00\x00\x00\x12Moving Sen\
+sitivity\x07\x00\x00\x00\x0aMai\
+nWindow\x01\x03\x00\x00\x00\x02e\xe0\x08\
+\x00\x00\x00\x00\x06\x00\x00\x00\x04None\x07\x00\x00\
+\x00\x0aMainWindow\x01\x03\x00\x00\
+\x00\x06g*h!Q\xc6\x08\x00\x00\x00\x00\x06\x00\x00\
+\x00\x0eNot calibrated\
 \x07\x00\x00\x00\x0aMainWindow\x01\
-\x03\x00\x00\x00\x08f\x82P\x5cg\x0dR\xa1\x08\x00\x00\
-\x00\x00\x06\x00\x00\x00\x0dPause Ser\
-vice\x07\x00\x00\x00\x0aMainWin\
-dow\x01\x03\x00\x00\x00\x16\x5cO^UR\x06\x8f\
-\xa8s\x87\x00 \x00(\x00p\x00x\x00)\x00:\x08\
-\x00\x00\x00\x00\x06\x00\x00\x00\x17Screen \
-Resolution (px):\
+\x03\x00\x00\x00\x16\x00O\x00n\x00e\x00 \x00E\x00\
+u\x00r\x00o\x00 n\xe4l\xe2\x08\x00\x00\x00\x00\
+\x06\x00\x00\x00\x08One Euro\x07\x00\x00\
+\x00\x0aMainWindow\x01\x03\x00\x00\
+\x00\x08f\x82P\x5cg\x0dR\xa1\x08\x00\x00\x00\x00\x06\
+\x00\x00\x00\x0dPause Servic\
+e\x07\x00\x00\x00\x0aMainWindow\
+\x01\x03\x00\x00\x00\x0ac\x07\x94\x88n\xe4l\xe2\xff\x1a\
+\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0fPointe\
+r Filter:\x07\x00\x00\x00\x0aMa\
+inWindow\x01\x03\x00\x00\x00\x08\x91\xcd\
+\x7fnh!Q\xc6\x08\x00\x00\x00\x00\x06\x00\x00\x00\x11\
+Reset Calibratio\
+n\x07\x00\x00\x00\x0aMainWindow\
+\x01\x03\x00\x00\x00\x16\x5cO^UR\x06\x8f\xa8s\x87\
+\x00 \x00(\x00p\x00x\x00)\x00:\x08\x00\x00\x00\
+\x00\x06\x00\x00\x00\x17Screen Res\
+olution (px):\x07\x00\x00\
+\x00\x0aMainWindow\x01\x03\x00\x00\
+\x00\x0an\xdaR\xa8\x90\x1f^\xa6\x00:\x08\x00\x00\x00\
+\x00\x06\x00\x00\x00\x0dScroll Spe\
+ed:\x07\x00\x00\x00\x0aMainWind\
+ow\x01\x03\x00\x00\x00\x04\x8b\xbe\x7fn\x08\x00\x00\x00\
+\x00\x06\x00\x00\x00\x08Settings\x07\x00\
+\x00\x00\x0aMainWindow\x01\x03\x00\
+\x00\x00\x08T/R\xa8g\x0dR\xa1\x08\x00\x00\x00\x00\
+\x06\x00\x00\x00\x0dStart Servi\
+ce\x07\x00\x00\x00\x0aMainWindo\
+w\x01\x03\x00\x00\x00\x0akcW(T/R\xa8 \
+&\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0bStart\
+ing...\x07\x00\x00\x00\x0aMainW\
+indow\x01\x03\x00\x00\x00\x04k\x22\x8f\xce\x08\
+\x00\x00\x00\x00\x06\x00\x00\x00\x07Welcome\
 \x07\x00\x00\x00\x0aMainWindow\x01\
-\x03\x00\x00\x00\x0an\xdaR\xa8\x90\x1f^\xa6\x00:\x08\
-\x00\x00\x00\x00\x06\x00\x00\x00\x0dScroll \
-Speed:\x07\x00\x00\x00\x0aMainW\
-indow\x01\x03\x00\x00\x00\x04\x8b\xbe\x7fn\x08\
-\x00\x00\x00\x00\x06\x00\x00\x00\x08Setting\
-s\x07\x00\x00\x00\x0aMainWindow\
-\x01\x03\x00\x00\x00\x08T/R\xa8g\x0dR\xa1\x08\x00\
-\x00\x00\x00\x06\x00\x00\x00\x0dStart Se\
-rvice\x07\x00\x00\x00\x0aMainWi\
-ndow\x01\x03\x00\x00\x00\x04k\x22\x8f\xce\x08\x00\
-\x00\x00\x00\x06\x00\x00\x00\x07Welcome\x07\
-\x00\x00\x00\x0aMainWindow\x01\x03\
-\x00\x00\x00\x0e[\xbd^\xa6\x00 \x00(\x00p\x00x\
-\x00)\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0aWidt\
-h (px)\x07\x00\x00\x00\x0aMainW\
-indow\x01\
+\x03\x00\x00\x00\x0e[\xbd^\xa6\x00 \x00(\x00p\x00\
+x\x00)\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0aWid\
+th (px)\x07\x00\x00\x00\x0aMain\
+Window\x01\x03\x00\x00\x00&\x00<\x00b\
+\x00>p\xb9Q\xfb\x00:\x00<\x00/\x00b\x00>\
+\x00 \x8f{p\xb9\x98\xdfc\x07N\xe5SUQ\xfb\
+0\x02\x08\x00\x00\x00\x00\x06\x00\x00\x00<<b>C\
+lick:</b> Tap yo\
+ur index finger \
+down to perform \
+a click.\x07\x00\x00\x00\x0bWel\
+comePage\x01\x03\x00\x00\x002\x00<\
+\x00b\x00>b\xd6\x90\x09\x00:\x00<\x00/\x00b\
+\x00>\x00 b\xc7c\x07N\x0e\x98\xdfc\x07cO\
+T\x08N\xe5b\xd6R\xa8b\x16\x90\x09S\xd60\x02\
+\x08\x00\x00\x00\x00\x06\x00\x00\x00F<b>Dra\
+g:</b> Pinch wit\
+h your thumb and\
+ index finger to\
+ start dragging.\
+\x07\x00\x00\x00\x0bWelcomePage\
+\x01\x03\x00\x00\x00*\x00<\x00b\x00>y\xfbR\xa8\
+\x00:\x00<\x00/\x00b\x00>\x00 y\xfbR\xa8\
+\x98\xdfc\x07N\xe5c\xa7R6QIh\x070\x02\
+\x08\x00\x00\x00\x00\x06\x00\x00\x00:<b>Mov\
+e:</b> Move your\
+ index finger to\
+ control the cur\
+sor.\x07\x00\x00\x00\x0bWelcome\
+Page\x01\x03\x00\x00\x00,\x00<\x00b\x00>\
+n\xdaR\xa8\x00:\x00<\x00/\x00b\x00>\x00 \
+O\x7fu(\x98\xdfc\x07T\x8cN-c\x07ge\
+n\xdaR\xa80\x02\x08\x00\x00\x00\x00\x06\x00\x00\x00;\
+<b>Scroll:</b> U\
+se your index an\
+d middle fingers\
+ to scroll.\x07\x00\x00\x00\x0b\
+WelcomePage\x01\x03\x00\x00\x00\
+6\x00<\x00b\x00>\x8b\xbe\x7fn\x00:\x00<\x00\
+/\x00b\x00>\x00 RM_\x80\x8b\xbe\x7fn\x98\
+u\x97bN\xe5_\xae\x8c\x03pueO^\xa6{\
+I\x90\x09\x98y0\x02\x08\x00\x00\x00\x00\x06\x00\x00\x00\
+T<b>Settings:</b\
+> Go to the Sett\
+ings page to cus\
+tomize sensitivi\
+ty and other opt\
+ions.\x07\x00\x00\x00\x0bWelcom\
+ePage\x01\
 "
 
 qt_resource_name = b"\
@@ -155,7 +241,7 @@ qt_resource_struct = b"\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
 \x00\x00\x00\x00\x00\x00\x00\x00\
 \x00\x00\x00\x1e\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x96\x7f\x88\xab\xec\
+\x00\x00\x01\xa1NBL\x18\
 "
 
 def qInitResources():